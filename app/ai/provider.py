@@ -1,13 +1,18 @@
 """AI client abstractions and factories."""
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Protocol
+from functools import lru_cache
+from typing import Any, Protocol
 
 import httpx
+import orjson
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ExplanationContext:
     """Data passed to AI client for explanation generation."""
 
@@ -30,106 +35,249 @@ class AIClient(Protocol):
     def explain(self, context: ExplanationContext) -> tuple[str, str | None]:
         ...
 
+    async def aexplain(self, context: ExplanationContext) -> tuple[str, str | None]:
+        ...
+
+
+_BANDS = ("low", "medium", "high")
+
+
+def _band(score: float) -> str:
+    """Map a reconciliation score to its confidence band (>=0.8 high, >=0.55 medium)."""
+
+    return _BANDS[(score >= 0.55) + (score >= 0.8)]
+
+
+OPENAI_API_BASE = "https://api.openai.com/v1"
+OPENAI_CHAT_COMPLETIONS_URL = f"{OPENAI_API_BASE}/chat/completions"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_PROMPT_PLACEHOLDER = "\x00prompt\x00"
+
+
+def _render_user_prompt(c: ExplanationContext) -> str:
+    """Render the user prompt with a single f-string pass."""
+
+    return (
+        f"Invoice amount {c.invoice_amount} {c.invoice_currency}, date {c.invoice_date or 'unknown'}, "
+        f"vendor {c.vendor_name or 'unknown vendor'}. "
+        f"Transaction amount {c.transaction_amount} {c.transaction_currency}, date {c.transaction_date}. "
+        f"Transaction memo {c.transaction_description or 'n/a'}. "
+        f"Heuristic reasoning: {c.reasoning}. Overall score {c.score:.2f}."
+    )
+
+
+def _stream_delta(line: str) -> str:
+    """Return the content fragment carried by one server-sent event line."""
+
+    if not line.startswith("data: "):
+        return ""
+    data = line[len("data: ") :]
+    if data == "[DONE]":
+        return ""
+    choices = orjson.loads(data).get("choices") or []
+    if not choices:
+        return ""
+    return (choices[0].get("delta") or {}).get("content") or ""
+
+
+class ExplanationCache:
+    """Bounded, thread-safe LRU of completions keyed by prompt digest."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(prompt: str) -> str:
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+            return content
+
+    def set(self, key: str, content: str) -> None:
+        with self._lock:
+            self._entries[key] = content
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class OpenAIClient:
-    """Minimal OpenAI completions client for explanation generation."""
+    """Minimal OpenAI completions client for explanation generation.
 
-    def __init__(self, model: str, api_key: str, timeout: float = 8.0) -> None:
+    The underlying ``httpx`` clients are created once per instance so keep-alive
+    connections are reused across explanations instead of re-handshaking.
+    Completions are cached per prompt, so identical prompts skip the API call.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        api_key: str,
+        timeout: float = 8.0,
+        cache: ExplanationCache | None = None,
+    ) -> None:
         self.model = model
         self.api_key = api_key
         self.timeout = timeout
+        self.cache = cache if cache is not None else ExplanationCache()
+        # Everything but the user prompt is fixed per client, so the request
+        # envelope is encoded once and only the prompt is serialized per call.
+        self._skeleton = self._build_skeleton(stream=False)
+        self._stream_skeleton = self._build_skeleton(stream=True)
+        # Content-Type is sent per request with the pre-encoded JSON body.
+        headers = {"Authorization": f"Bearer {api_key}"}
+        self._client = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers=headers,
+        )
+        self._aclient = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers=headers,
+        )
+
+    async def aclose(self) -> None:
+        """Release pooled connections held by both HTTP clients."""
+
+        self._client.close()
+        await self._aclient.aclose()
+
+    # Async-only: closing the async client needs an event loop, and a sync
+    # close that skipped it would leak its connections.
+    async def __aenter__(self) -> "OpenAIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     def explain(self, context: ExplanationContext) -> tuple[str, str | None]:
-        payload = {
+        prompt = _render_user_prompt(context)
+        key = self.cache.key_for(prompt)
+        content = self.cache.get(key)
+        if content is None:
+            body = self._encode_payload(prompt, stream=True)
+            with self._client.stream(
+                "POST", OPENAI_CHAT_COMPLETIONS_URL, content=body, headers=_JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+                content = "".join(_stream_delta(line) for line in response.iter_lines()).strip()
+            if not content:
+                # Left uncached so the next request asks the API again.
+                return fallback_client().explain(context)
+            self.cache.set(key, content)
+        return content, _band(context.score)
+
+    async def aexplain(self, context: ExplanationContext) -> tuple[str, str | None]:
+        prompt = _render_user_prompt(context)
+        key = self.cache.key_for(prompt)
+        content = self.cache.get(key)
+        if content is None:
+            body = self._encode_payload(prompt, stream=True)
+            async with self._aclient.stream(
+                "POST", OPENAI_CHAT_COMPLETIONS_URL, content=body, headers=_JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+                parts = [_stream_delta(line) async for line in response.aiter_lines()]
+            content = "".join(parts).strip()
+            if not content:
+                return await fallback_client().aexplain(context)
+            self.cache.set(key, content)
+        return content, _band(context.score)
+
+    def _encode_payload(self, prompt: str, stream: bool = False) -> bytes:
+        """Splice the JSON-encoded prompt into the pre-serialized request skeleton."""
+
+        prefix, suffix = self._stream_skeleton if stream else self._skeleton
+        return prefix + orjson.dumps(prompt) + suffix
+
+    def _build_skeleton(self, stream: bool) -> tuple[bytes, bytes]:
+        payload: dict[str, Any] = {
             "model": self.model,
             "messages": [
                 {
                     "role": "system",
                     "content": "You explain invoice and bank transaction matches succinctly.",
                 },
-                {
-                    "role": "user",
-                    "content": (
-                        "Invoice amount {amount} {currency}, date {invoice_date}, vendor {vendor}. "
-                        "Transaction amount {txn_amount} {txn_currency}, date {txn_date}. "
-                        "Transaction memo {txn_description}. "
-                        "Heuristic reasoning: {reasoning}. Overall score {score:.2f}."
-                    ).format(
-                        amount=context.invoice_amount,
-                        currency=context.invoice_currency,
-                        invoice_date=context.invoice_date or "unknown",
-                        vendor=context.vendor_name or "unknown vendor",
-                        txn_amount=context.transaction_amount,
-                        txn_currency=context.transaction_currency,
-                        txn_date=context.transaction_date,
-                        txn_description=context.transaction_description or "n/a",
-                        reasoning=context.reasoning,
-                        score=context.score,
-                    ),
-                },
+                {"role": "user", "content": _PROMPT_PLACEHOLDER},
             ],
             "temperature": 0.2,
             "max_tokens": 200,
         }
+        if stream:
+            payload["stream"] = True
+        prefix, suffix = orjson.dumps(payload).split(orjson.dumps(_PROMPT_PLACEHOLDER), 1)
+        return prefix, suffix
+
+
+_FALLBACK_TEMPLATES = {
+    "high": (
+        "The invoice and transaction align strongly: exact/tight amount match, "
+        "date proximity, and descriptive similarity. Reasoning: {reasoning}."
+    ),
+    "medium": (
+        "The match appears plausible with reasonable amount alignment and some context overlap. "
+        "Reasoning: {reasoning}."
+    ),
+    "low": (
+        "The evidence is weak; consider manual review before confirming. Reasoning: {reasoning}."
+    ),
+}
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                "https://api.openai.com/v1/chat/completions",
-                json=payload,
-                headers=headers,
-            )
-        response.raise_for_status()
-        data = response.json()
-        content = data["choices"][0]["message"]["content"].strip()
-
-        if context.score >= 0.8:
-            confidence = "high"
-        elif context.score >= 0.55:
-            confidence = "medium"
-        else:
-            confidence = "low"
-        return content, confidence
+@lru_cache(maxsize=1024)
+def _render_fallback(band: str, reasoning: str) -> str:
+    """Render the fallback template for a band; output depends only on its inputs."""
+
+    return _FALLBACK_TEMPLATES[band].format(reasoning=reasoning)
 
 
 class DeterministicFallbackClient:
     """Fallback explanation client using heuristic-driven templates."""
 
     def explain(self, context: ExplanationContext) -> tuple[str, str | None]:
-        if context.score >= 0.8:
-            band = "high"
-            template = (
-                "The invoice and transaction align strongly: exact/tight amount match, "
-                "date proximity, and descriptive similarity. Reasoning: {reasoning}."
-            )
-        elif context.score >= 0.55:
-            band = "medium"
-            template = (
-                "The match appears plausible with reasonable amount alignment and some context overlap. "
-                "Reasoning: {reasoning}."
-            )
-        else:
-            band = "low"
-            template = (
-                "The evidence is weak; consider manual review before confirming. Reasoning: {reasoning}."
-            )
-        explanation = template.format(reasoning=context.reasoning)
-        return explanation, band
+        band = _band(context.score)
+        return _render_fallback(band, context.reasoning), band
+
+    async def aexplain(self, context: ExplanationContext) -> tuple[str, str | None]:
+        return self.explain(context)
+
+
+
+_OPENAI_CLIENTS: dict[tuple[str, str], OpenAIClient] = {}
 
 
 def resolve_ai_client(model: str, api_key: str | None) -> AIClient | None:
-    """Return an AI client instance when credentials are available."""
+    """Return a shared AI client instance when credentials are available."""
 
     if not api_key:
         return None
-    return OpenAIClient(model=model, api_key=api_key)
+    client = _OPENAI_CLIENTS.get((model, api_key))
+    if client is None:
+        client = OpenAIClient(model=model, api_key=api_key)
+        _OPENAI_CLIENTS[(model, api_key)] = client
+    return client
+
+
+async def close_ai_clients() -> None:
+    """Close shared AI clients and drop them from the cache."""
+
+    while _OPENAI_CLIENTS:
+        _, client = _OPENAI_CLIENTS.popitem()
+        await client.aclose()
 
 
+@lru_cache(maxsize=1)
 def fallback_client() -> DeterministicFallbackClient:
-    """Return deterministic fallback client instance."""
+    """Return the shared deterministic fallback client; it holds no state."""
 
     return DeterministicFallbackClient()
@@ -6,10 +6,11 @@ from uuid import UUID
 from fastapi import Depends, HTTPException, Path, status
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db_session
+from app.core.database import bind_session_tenant, get_db_session
 from app.core.tenant import TenantContext, TenantNotFoundError, load_tenant_context
 from app.schemas.invoice import InvoiceFilterParams
 from app.services.bank_transaction_service import BankTransactionService
+from app.services.explanation_jobs import ExplanationJobStore, explanation_jobs
 from app.services.explanation_service import ExplanationService
 from app.services.invoice_service import InvoiceService
 from app.services.reconciliation_service import ReconciliationService
@@ -22,9 +23,19 @@ def tenant_id_path(tenant_id: UUID = Path(..., description="Tenant identifier"))
     return str(tenant_id)
 
 
-def get_tenant_context(
+def get_tenant_db_session(
     tenant_id: str = Depends(tenant_id_path),
     session: Session = Depends(get_db_session),
+) -> Session:
+    """Return the request's single session with the path tenant bound to it."""
+
+    bind_session_tenant(session, tenant_id)
+    return session
+
+
+def get_tenant_context(
+    tenant_id: str = Depends(tenant_id_path),
+    session: Session = Depends(get_tenant_db_session),
 ) -> TenantContext:
     """Resolve a tenant context for the request."""
 
@@ -40,40 +51,94 @@ def get_tenant_service(session: Session = Depends(get_db_session)) -> TenantServ
     return TenantService(session)
 
 
-def get_invoice_service(
+class ServiceBundle:
+    """Tenant-scoped services for one request, constructed lazily on first access."""
+
+    __slots__ = (
+        "session",
+        "tenant",
+        "_invoices",
+        "_bank_transactions",
+        "_reconciliation",
+        "_explanations",
+    )
+
+    def __init__(self, session: Session, tenant: TenantContext) -> None:
+        self.session = session
+        self.tenant = tenant
+        self._invoices: InvoiceService | None = None
+        self._bank_transactions: BankTransactionService | None = None
+        self._reconciliation: ReconciliationService | None = None
+        self._explanations: ExplanationService | None = None
+
+    @property
+    def invoices(self) -> InvoiceService:
+        if self._invoices is None:
+            self._invoices = InvoiceService(self.session, self.tenant)
+        return self._invoices
+
+    @property
+    def bank_transactions(self) -> BankTransactionService:
+        if self._bank_transactions is None:
+            self._bank_transactions = BankTransactionService(self.session, self.tenant)
+        return self._bank_transactions
+
+    @property
+    def reconciliation(self) -> ReconciliationService:
+        if self._reconciliation is None:
+            self._reconciliation = ReconciliationService(self.session, self.tenant)
+        return self._reconciliation
+
+    @property
+    def explanations(self) -> ExplanationService:
+        if self._explanations is None:
+            self._explanations = ExplanationService(self.session, self.tenant)
+        return self._explanations
+
+
+def get_service_bundle(
     tenant: TenantContext = Depends(get_tenant_context),
-    session: Session = Depends(get_db_session),
-) -> InvoiceService:
+    session: Session = Depends(get_tenant_db_session),
+) -> ServiceBundle:
+    """Resolve session and tenant once and share them across the request's services."""
+
+    return ServiceBundle(session, tenant)
+
+
+def get_invoice_service(services: ServiceBundle = Depends(get_service_bundle)) -> InvoiceService:
     """Provide invoice service bound to tenant context."""
 
-    return InvoiceService(session, tenant)
+    return services.invoices
 
 
 def get_bank_transaction_service(
-    tenant: TenantContext = Depends(get_tenant_context),
-    session: Session = Depends(get_db_session),
+    services: ServiceBundle = Depends(get_service_bundle),
 ) -> BankTransactionService:
     """Provide bank transaction service bound to tenant context."""
 
-    return BankTransactionService(session, tenant)
+    return services.bank_transactions
 
 
 def get_reconciliation_service(
-    tenant: TenantContext = Depends(get_tenant_context),
-    session: Session = Depends(get_db_session),
+    services: ServiceBundle = Depends(get_service_bundle),
 ) -> ReconciliationService:
     """Provide reconciliation service bound to tenant context."""
 
-    return ReconciliationService(session, tenant)
+    return services.reconciliation
 
 
 def get_explanation_service(
-    tenant: TenantContext = Depends(get_tenant_context),
-    session: Session = Depends(get_db_session),
+    services: ServiceBundle = Depends(get_service_bundle),
 ) -> ExplanationService:
     """Provide explanation service bound to tenant context."""
 
-    return ExplanationService(session, tenant)
+    return services.explanations
+
+
+def get_explanation_jobs() -> ExplanationJobStore:
+    """Provide the process-wide background explanation job registry."""
+
+    return explanation_jobs
 
 
 def get_invoice_filters(params: InvoiceFilterParams = Depends()) -> InvoiceFilterParams:
@@ -36,10 +36,18 @@ def list_invoices(
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
     service: InvoiceService = Depends(get_invoice_service),
-) -> InvoiceListResponse:
-    """List invoices with optional filters."""
+) -> Response:
+    """List invoices with optional filters.
+
+    Pass ``cursor`` (empty for the first page) to page by keyset; ``offset``
+    is deprecated and ignored when a cursor is given.
+    """
 
-    return service.list(filters, offset=offset, limit=limit)
+    try:
+        result = service.list(filters, offset=offset, limit=limit)
+    except ServiceError as exc:
+        raise map_service_error(exc) from exc
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.delete("/{invoice_id}", status_code=status.HTTP_204_NO_CONTENT)
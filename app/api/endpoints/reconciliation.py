@@ -1,29 +1,61 @@
 """Reconciliation, match confirmation, and explanation endpoints."""
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
 
+from app.ai.provider import ExplanationContext
 from app.api.dependencies import (
+    get_explanation_jobs,
     get_explanation_service,
     get_reconciliation_service,
 )
 from app.api.errors import map_service_error
-from app.schemas.match import AIExplanationResponse, MatchConfirmationResponse, ReconciliationResponse
-from app.services.explanation_service import ExplanationService
+from app.schemas.match import (
+    AIExplanationBatchRequest,
+    AIExplanationBatchResponse,
+    AIExplanationResponse,
+    ExplanationJobAccepted,
+    ExplanationJobStatus,
+    MatchConfirmationResponse,
+    ReconciliationResponse,
+)
 from app.services.exceptions import ServiceError
+from app.services.explanation_jobs import ExplanationJobStore
+from app.services.explanation_service import ExplanationService
 from app.services.reconciliation_service import ReconciliationService
 
 router = APIRouter(prefix="/tenants/{tenant_id}", tags=["reconciliation"])
 
 
+async def _resolve_context(
+    service: ExplanationService,
+    match_id: str | None,
+    invoice_id: str | None,
+    bank_transaction_id: str | None,
+) -> ExplanationContext:
+    """Load the explanation context on the threadpool; the session is blocking."""
+
+    if match_id is not None:
+        return await run_in_threadpool(service.match_context, match_id)
+    if invoice_id is not None and bank_transaction_id is not None:
+        return await run_in_threadpool(service.pair_context, invoice_id, bank_transaction_id)
+    raise HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="Provide match_id or both invoice_id and bank_transaction_id",
+    )
+
+
 @router.post("/reconcile", response_model=ReconciliationResponse)
 def reconcile(
     tenant_id: str,
     service: ReconciliationService = Depends(get_reconciliation_service),
-) -> ReconciliationResponse:
+) -> Response:
     """Trigger reconciliation for a tenant."""
 
-    return service.reconcile()
+    # The response is already validated; dumping it directly skips FastAPI's
+    # re-validation and jsonable_encoder pass over every match.
+    return Response(content=service.reconcile().model_dump_json(), media_type="application/json")
 
 
 @router.post("/matches/{match_id}/confirm", response_model=MatchConfirmationResponse)
@@ -41,7 +73,7 @@ def confirm_match(
 
 
 @router.get("/reconcile/explain", response_model=AIExplanationResponse)
-def explain_match(
+async def explain_match(
     tenant_id: str,
     match_id: str | None = Query(default=None, description="Match identifier"),
     invoice_id: str | None = Query(default=None, description="Invoice identifier"),
@@ -51,14 +83,60 @@ def explain_match(
     """Return AI/fallback explanation for a match or an explicit invoice/transaction pair."""
 
     try:
-        if match_id is not None:
-            return service.explain_match(match_id)
-        if invoice_id is not None and bank_transaction_id is not None:
-            return service.explain_pair(invoice_id, bank_transaction_id)
+        context = await _resolve_context(service, match_id, invoice_id, bank_transaction_id)
+        return await service.aexplain_context(context)
     except ServiceError as exc:
         raise map_service_error(exc) from exc
 
-    raise HTTPException(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        detail="Provide match_id or both invoice_id and bank_transaction_id",
-    )
+
+@router.post("/reconcile/explain/batch", response_model=AIExplanationBatchResponse)
+async def explain_matches(
+    tenant_id: str,
+    payload: AIExplanationBatchRequest,
+    service: ExplanationService = Depends(get_explanation_service),
+) -> AIExplanationBatchResponse:
+    """Return explanations for several matches, generated concurrently."""
+
+    try:
+        contexts = await run_in_threadpool(service.match_contexts, payload.match_ids)
+        explanations = await service.aexplain_contexts(contexts)
+    except ServiceError as exc:
+        raise map_service_error(exc) from exc
+    return AIExplanationBatchResponse(explanations=explanations)
+
+
+@router.post(
+    "/reconcile/explain",
+    response_model=ExplanationJobAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_explanation(
+    tenant_id: str,
+    match_id: str | None = Query(default=None, description="Match identifier"),
+    invoice_id: str | None = Query(default=None, description="Invoice identifier"),
+    bank_transaction_id: str | None = Query(default=None, description="Bank transaction identifier"),
+    service: ExplanationService = Depends(get_explanation_service),
+    jobs: ExplanationJobStore = Depends(get_explanation_jobs),
+) -> ExplanationJobAccepted:
+    """Queue an explanation in the background and return a job id to poll."""
+
+    try:
+        context = await _resolve_context(service, match_id, invoice_id, bank_transaction_id)
+        return ExplanationJobAccepted(job_id=service.submit_job(jobs, context))
+    except ServiceError as exc:
+        raise map_service_error(exc) from exc
+
+
+@router.get("/reconcile/explain/{job_id}", response_model=ExplanationJobStatus)
+async def get_explanation_job(
+    tenant_id: str,
+    job_id: str,
+    service: ExplanationService = Depends(get_explanation_service),
+    jobs: ExplanationJobStore = Depends(get_explanation_jobs),
+) -> ExplanationJobStatus:
+    """Report the progress of a background explanation job."""
+
+    try:
+        return service.job_status(jobs, job_id)
+    except ServiceError as exc:
+        raise map_service_error(exc) from exc
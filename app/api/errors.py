@@ -3,16 +3,31 @@ from __future__ import annotations
 
 from fastapi import HTTPException, status
 
-from app.services.exceptions import ConflictError, NotFoundError, ServiceError, ValidationError
+from app.services.exceptions import (
+    CapacityError,
+    ConflictError,
+    NotFoundError,
+    ServiceError,
+    ValidationError,
+)
+
+_STATUS_BY_ERROR: dict[type[ServiceError], int] = {
+    NotFoundError: status.HTTP_404_NOT_FOUND,
+    ConflictError: status.HTTP_409_CONFLICT,
+    ValidationError: status.HTTP_400_BAD_REQUEST,
+    CapacityError: status.HTTP_503_SERVICE_UNAVAILABLE,
+}
 
 
 def map_service_error(exc: ServiceError) -> HTTPException:
-    """Translate service-layer errors into HTTP exceptions."""
+    """Translate service-layer errors into HTTP exceptions.
+
+    The exception's MRO is looked up in ``_STATUS_BY_ERROR`` so subclasses
+    inherit their parent's status code.
+    """
 
-    if isinstance(exc, NotFoundError):
-        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
-    if isinstance(exc, ConflictError):
-        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
-    if isinstance(exc, ValidationError):
-        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    for cls in type(exc).__mro__:
+        status_code = _STATUS_BY_ERROR.get(cls)
+        if status_code is not None:
+            return HTTPException(status_code=status_code, detail=str(exc))
     return HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal service error")
@@ -1,19 +1,34 @@
 """Root API router for REST endpoints."""
+from functools import lru_cache
+
 from fastapi import APIRouter
 
 from app.api.endpoints import bank_transactions, invoices, reconciliation, tenants
 
-router = APIRouter()
-
 
-@router.get("/health", tags=["health"], summary="Health check")
 def health_check() -> dict[str, str]:
     """Return basic service health information."""
 
     return {"status": "ok"}
 
 
-router.include_router(tenants.router)
-router.include_router(invoices.router)
-router.include_router(bank_transactions.router)
-router.include_router(reconciliation.router)
+@lru_cache(maxsize=1)
+def build_router() -> APIRouter:
+    """Assemble the REST router once; later calls reuse the flattened route table."""
+
+    api_router = APIRouter()
+    api_router.add_api_route(
+        "/health",
+        health_check,
+        methods=["GET"],
+        tags=["health"],
+        summary="Health check",
+    )
+    api_router.include_router(tenants.router)
+    api_router.include_router(invoices.router)
+    api_router.include_router(bank_transactions.router)
+    api_router.include_router(reconciliation.router)
+    return api_router
+
+
+router = build_router()
@@ -0,0 +1,39 @@
+"""Operational commands, run as ``python -m app.cli <command>``."""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+
+from alembic import command
+from alembic.config import Config
+
+from app.core.database import create_database_schema
+
+
+def migrate() -> None:
+    """Execute Alembic migrations; fallback to metadata create_all on failure."""
+
+    config = Config("alembic.ini")
+    try:
+        command.upgrade(config, "head")
+    except Exception:
+        create_database_schema()
+        return
+
+    create_database_schema()
+
+
+COMMANDS = {"migrate": migrate}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Dispatch to the requested command."""
+
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args(argv)
+    COMMANDS[args.command]()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,50 @@
+"""Short-lived in-process caches for read-heavy and replayed responses."""
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Hashable
+from typing import Any
+
+LIST_CACHE_TTL_SECONDS = 15.0
+
+
+class TTLCache:
+    """Thread-safe expiring cache whose entries are grouped by namespace.
+
+    Namespaces let writers drop every cached page for one tenant at once,
+    while other tenants keep their warm entries.
+    """
+
+    def __init__(self, ttl: float = LIST_CACHE_TTL_SECONDS, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, dict[Hashable, tuple[float, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: Hashable, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(namespace, {}).get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[namespace][key]
+                return None
+            return value
+
+    def set(self, namespace: Hashable, key: Hashable, value: Any) -> None:
+        with self._lock:
+            bucket = self._entries.setdefault(namespace, {})
+            bucket[key] = (time.monotonic() + self.ttl, value)
+            while len(bucket) > self.maxsize:
+                del bucket[next(iter(bucket))]
+
+    def clear(self, namespace: Hashable | None = None) -> None:
+        """Drop one namespace, or every entry when no namespace is given."""
+
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(namespace, None)
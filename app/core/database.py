@@ -1,16 +1,49 @@
 """Database engine and session management utilities."""
 from collections.abc import Generator
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from app.db import Base, models  # noqa: F401  # Ensure models are imported for metadata registration
+# Ensure models are imported for metadata registration.
+from app.db import Base, models  # noqa: F401
 
 from .settings import get_settings
 
 _settings = get_settings()
 
-ENGINE = create_engine(_settings.database_url, future=True)
+# Large enough that REST and GraphQL statement variants don't evict each other
+# from the compiled-SQL cache (SQLAlchemy's default holds 500 entries).
+QUERY_CACHE_SIZE = 1200
+
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """Return pool configuration suited to the database backend."""
+
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        options: dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+        if url.database in (None, "", ":memory:"):
+            # A private in-memory database only exists on its one connection.
+            options["poolclass"] = StaticPool
+        return options
+    return {
+        "pool_size": _settings.db_pool_size,
+        "max_overflow": _settings.db_max_overflow,
+        "pool_pre_ping": _settings.db_pool_pre_ping,
+        "pool_recycle": _settings.db_pool_recycle,
+        "pool_timeout": _settings.db_pool_timeout,
+    }
+
+
+ENGINE = create_engine(
+    _settings.database_url,
+    future=True,
+    query_cache_size=QUERY_CACHE_SIZE,
+    **_engine_options(_settings.database_url),
+)
 SessionLocal = sessionmaker(bind=ENGINE, class_=Session, autoflush=False, autocommit=False)
 
 
@@ -24,6 +57,28 @@ def get_db_session() -> Generator[Session, None, None]:
         session.close()
 
 
+_SET_TENANT_SQL = text("SELECT set_config('app.tenant_id', :tenant_id, true)")
+
+
+def bind_session_tenant(session: Session, tenant_id: str) -> None:
+    """Expose the tenant id to PostgreSQL row-level security for every transaction.
+
+    ``set_config(..., true)`` is transaction-local, so it is re-applied whenever the
+    session begins a new transaction (services commit mid-request). Other
+    backends have no equivalent and are left untouched.
+    """
+
+    if session.get_bind().dialect.name != "postgresql":
+        return
+
+    def _set_tenant(_session: Session, _transaction: object, connection: object) -> None:
+        connection.execute(_SET_TENANT_SQL, {"tenant_id": tenant_id})  # type: ignore[attr-defined]
+
+    event.listen(session, "after_begin", _set_tenant)
+    if session.in_transaction():
+        session.execute(_SET_TENANT_SQL, {"tenant_id": tenant_id})
+
+
 def create_database_schema() -> None:
     """Create database tables based on ORM metadata."""
 
@@ -0,0 +1,23 @@
+"""Primary key generation."""
+from __future__ import annotations
+
+import os
+import time
+import uuid
+
+
+def new_id() -> str:
+    """Return a UUIDv7 string (RFC 9562).
+
+    The leading 48 bits are a millisecond Unix timestamp, so ids generated in
+    sequence sort together and inserts land on the rightmost B-tree leaf instead
+    of scattering like ``uuid4``. The remaining bits are random.
+    """
+
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | rand
+    # Overwrite the version (0111) and variant (10) fields.
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return str(uuid.UUID(int=value))
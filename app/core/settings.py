@@ -2,7 +2,6 @@
 from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,8 +9,6 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 ENV_FILE = BASE_DIR / ".env"
 
-load_dotenv(dotenv_path=ENV_FILE)
-
 
 class Settings(BaseSettings):
     """Central application configuration."""
@@ -22,10 +19,32 @@ class Settings(BaseSettings):
         default="sqlite:///./data/dev.db",
         description="SQLAlchemy database URL",
     )
+    db_pool_size: int = Field(default=20, ge=1, description="Persistent connections per worker")
+    db_max_overflow: int = Field(default=40, ge=0, description="Extra connections allowed under burst load")
+    db_pool_recycle: int = Field(default=1800, description="Seconds before a pooled connection is replaced")
+    db_pool_timeout: float = Field(
+        default=5.0, gt=0, description="Seconds to wait for a free connection before failing the request"
+    )
+    db_pool_pre_ping: bool = Field(
+        default=False,
+        description="Issue a liveness SELECT on every checkout; pool_recycle covers most stale connections",
+    )
+    run_migrations_on_startup: bool = Field(
+        default=False,
+        description="Apply migrations in every worker's lifespan instead of via `python -m app.cli migrate`",
+    )
+    reconcile_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Worker processes scoring reconciliation batches; 0 scores in the request thread",
+    )
     ai_api_key: str | None = Field(default=None)
     ai_model: str = Field(default="gpt-4o-mini")
 
     model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        extra="ignore",
         case_sensitive=False,
         populate_by_name=True,
         env_ignore_empty=True,
@@ -1,6 +1,8 @@
 """Tenant context utilities and multi-tenancy guardrails."""
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
@@ -45,10 +47,59 @@ class TenantContext:
         self.ensure_matches(entity_tenant_id)
 
 
+TENANT_CACHE_MAXSIZE = 4096
+SESSION_TENANT_KEY = "tenant_context"
+
+_tenant_cache: OrderedDict[str, TenantContext] = OrderedDict()
+_tenant_cache_lock = threading.Lock()
+
+
+def cached_tenant_context(tenant_id: str) -> TenantContext | None:
+    """Return the cached context for ``tenant_id`` without touching the database."""
+
+    with _tenant_cache_lock:
+        cached = _tenant_cache.get(tenant_id)
+        if cached is not None:
+            _tenant_cache.move_to_end(tenant_id)
+        return cached
+
+
 def load_tenant_context(session: Session, tenant_id: str) -> TenantContext:
-    """Load a tenant from persistence and return a context wrapper."""
+    """Load a tenant from persistence and return a context wrapper.
+
+    Contexts are immutable, so resolved tenants are cached by id and later
+    requests skip the lookup. Missing tenants are never cached. The resolved
+    context is also stored in ``session.info`` so repeated lookups on the same
+    session skip the shared cache and its lock.
+    """
+
+    bound = session.info.get(SESSION_TENANT_KEY)
+    if bound is not None and bound.tenant_id == tenant_id:
+        return bound
+
+    cached = cached_tenant_context(tenant_id)
+    if cached is not None:
+        session.info[SESSION_TENANT_KEY] = cached
+        return cached
 
     tenant = session.get(Tenant, tenant_id)
     if tenant is None:
         raise TenantNotFoundError(f"Tenant {tenant_id} not found")
-    return TenantContext(tenant_id=str(tenant.id), tenant_name=tenant.name)
+    context = TenantContext(tenant_id=str(tenant.id), tenant_name=tenant.name)
+
+    with _tenant_cache_lock:
+        _tenant_cache[tenant_id] = context
+        while len(_tenant_cache) > TENANT_CACHE_MAXSIZE:
+            _tenant_cache.popitem(last=False)
+    session.info[SESSION_TENANT_KEY] = context
+    return context
+
+
+def invalidate_tenant_context(tenant_id: str | None = None) -> None:
+    """Drop a cached tenant context, or every cached context when no id is given."""
+
+    with _tenant_cache_lock:
+        if tenant_id is None:
+            _tenant_cache.clear()
+        else:
+            _tenant_cache.pop(tenant_id, None)
@@ -0,0 +1,48 @@
+"""Covering (tenant_id, posted_at, id) index for bank transaction pagination.
+
+Revision ID: 0002_transaction_posted_index
+Revises: 0001_initial_schema
+Create Date: 2026-10-15
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002_transaction_posted_index"
+down_revision = "0001_initial_schema"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+TABLE = "banktransaction"
+NEW_INDEX = "ix_tx_tenant_posted_id"
+OLD_INDEX = "ix_banktransaction_posted_at"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                NEW_INDEX,
+                TABLE,
+                ["tenant_id", "posted_at", "id"],
+                postgresql_include=["amount", "currency"],
+                postgresql_concurrently=True,
+            )
+            op.drop_index(OLD_INDEX, table_name=TABLE, postgresql_concurrently=True)
+        return
+
+    op.create_index(NEW_INDEX, TABLE, ["tenant_id", "posted_at", "id"])
+    op.drop_index(OLD_INDEX, table_name=TABLE)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(OLD_INDEX, TABLE, ["tenant_id", "posted_at"], postgresql_concurrently=True)
+            op.drop_index(NEW_INDEX, table_name=TABLE, postgresql_concurrently=True)
+        return
+
+    op.create_index(OLD_INDEX, TABLE, ["tenant_id", "posted_at"])
+    op.drop_index(NEW_INDEX, table_name=TABLE)
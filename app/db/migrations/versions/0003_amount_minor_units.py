@@ -0,0 +1,32 @@
+"""Store invoice and bank transaction amounts as integer minor units.
+
+Revision ID: 0003_amount_minor_units
+Revises: 0002_transaction_posted_index
+Create Date: 2026-10-15
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_amount_minor_units"
+down_revision = "0002_transaction_posted_index"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+TABLES = ("invoice", "banktransaction")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column("amount_minor", sa.BigInteger(), nullable=True))
+        op.execute(f"UPDATE {table} SET amount_minor = CAST(ROUND(amount * 100) AS BIGINT)")
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column("amount_minor", existing_type=sa.BigInteger(), nullable=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column("amount_minor")
@@ -0,0 +1,45 @@
+"""(tenant_id, status, score DESC, id) index for top-scored match listings.
+
+Revision ID: 0004_match_status_score_index
+Revises: 0003_amount_minor_units
+Create Date: 2026-10-15
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_match_status_score_index"
+down_revision = "0003_amount_minor_units"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+TABLE = "matchcandidate"
+NEW_INDEX = "ix_match_tenant_status_score"
+OLD_INDEX = "ix_match_status"
+NEW_COLUMNS: list[str | sa.TextClause] = ["tenant_id", "status", sa.text("score DESC"), "id"]
+
+
+def upgrade() -> None:
+    # The new index leads with (tenant_id, status), so it also serves the old one's lookups.
+    if op.get_bind().dialect.name == "postgresql":
+        # CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            op.create_index(NEW_INDEX, TABLE, NEW_COLUMNS, postgresql_concurrently=True)
+            op.drop_index(OLD_INDEX, table_name=TABLE, postgresql_concurrently=True)
+        return
+
+    op.create_index(NEW_INDEX, TABLE, NEW_COLUMNS)
+    op.drop_index(OLD_INDEX, table_name=TABLE)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(OLD_INDEX, TABLE, ["tenant_id", "status"], postgresql_concurrently=True)
+            op.drop_index(NEW_INDEX, table_name=TABLE, postgresql_concurrently=True)
+        return
+
+    op.create_index(OLD_INDEX, TABLE, ["tenant_id", "status"])
+    op.drop_index(NEW_INDEX, table_name=TABLE)
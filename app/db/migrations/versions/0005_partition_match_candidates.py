@@ -0,0 +1,75 @@
+"""Hash-partition match candidates by tenant on PostgreSQL.
+
+Revision ID: 0005_partition_match_candidates
+Revises: 0004_match_status_score_index
+Create Date: 2026-10-15
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005_partition_match_candidates"
+down_revision = "0004_match_status_score_index"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+TABLE = "matchcandidate"
+STAGING = "matchcandidate_staging"
+PARTITIONS = 16
+INDEX = "ix_match_tenant_status_score"
+INDEX_COLUMNS: list[str | sa.TextClause] = ["tenant_id", "status", sa.text("score DESC"), "id"]
+
+
+def _rebuild(partitioned: bool) -> None:
+    """Copy matchcandidate into a freshly built table and swap it into place.
+
+    PostgreSQL cannot convert an existing table to a partitioned one in place.
+    """
+
+    partition_clause = " PARTITION BY HASH (tenant_id)" if partitioned else ""
+    op.execute(f"CREATE TABLE {STAGING} (LIKE {TABLE} INCLUDING DEFAULTS){partition_clause}")
+    if partitioned:
+        for remainder in range(PARTITIONS):
+            op.execute(
+                f"CREATE TABLE {TABLE}_p{remainder} PARTITION OF {STAGING} "
+                f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+            )
+    op.execute(f"INSERT INTO {STAGING} SELECT * FROM {TABLE}")
+    op.drop_table(TABLE)
+    op.rename_table(STAGING, TABLE)
+
+    primary_key = ["id", "tenant_id"] if partitioned else ["id"]
+    op.create_primary_key(f"{TABLE}_pkey", TABLE, primary_key)
+    op.create_unique_constraint(
+        "uq_match_unique_pair", TABLE, ["tenant_id", "invoice_id", "bank_transaction_id"]
+    )
+    op.create_foreign_key(
+        f"{TABLE}_tenant_id_fkey", TABLE, "tenant", ["tenant_id"], ["id"], ondelete="CASCADE"
+    )
+    op.create_foreign_key(
+        f"{TABLE}_invoice_id_fkey", TABLE, "invoice", ["invoice_id"], ["id"], ondelete="CASCADE"
+    )
+    op.create_foreign_key(
+        f"{TABLE}_bank_transaction_id_fkey",
+        TABLE,
+        "banktransaction",
+        ["bank_transaction_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_index(INDEX, TABLE, INDEX_COLUMNS)
+
+
+def upgrade() -> None:
+    # Partitioning is PostgreSQL-only; SQLite keeps the plain table.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _rebuild(partitioned=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _rebuild(partitioned=False)
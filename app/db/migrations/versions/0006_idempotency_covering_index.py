@@ -0,0 +1,55 @@
+"""Covering unique (tenant_id, endpoint, key) index for idempotency lookups.
+
+Revision ID: 0006_idempotency_covering_index
+Revises: 0005_partition_match_candidates
+Create Date: 2026-10-15
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0006_idempotency_covering_index"
+down_revision = "0005_partition_match_candidates"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+TABLE = "idempotencykey"
+NEW_INDEX = "ix_idemp_tenant_endpoint_key"
+OLD_CONSTRAINT = "uq_idempotency_key"
+COLUMNS = ["tenant_id", "endpoint", "key"]
+# response_body stays out: large import responses would overflow the index tuple.
+INCLUDE = ["id", "payload_hash", "response_status"]
+
+
+def upgrade() -> None:
+    # The unique index enforces the same rule, so the constraint is dropped after it exists.
+    if op.get_bind().dialect.name == "postgresql":
+        # CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                NEW_INDEX,
+                TABLE,
+                COLUMNS,
+                unique=True,
+                postgresql_include=INCLUDE,
+                postgresql_concurrently=True,
+            )
+            op.drop_constraint(OLD_CONSTRAINT, TABLE, type_="unique")
+        return
+
+    with op.batch_alter_table(TABLE) as batch:
+        batch.drop_constraint(OLD_CONSTRAINT, type_="unique")
+    op.create_index(NEW_INDEX, TABLE, COLUMNS, unique=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_unique_constraint(OLD_CONSTRAINT, TABLE, COLUMNS)
+            op.drop_index(NEW_INDEX, table_name=TABLE, postgresql_concurrently=True)
+        return
+
+    op.drop_index(NEW_INDEX, table_name=TABLE)
+    with op.batch_alter_table(TABLE) as batch:
+        batch.create_unique_constraint(OLD_CONSTRAINT, COLUMNS)
@@ -0,0 +1,39 @@
+"""(tenant_id, invoice_date DESC, id DESC) index for keyset invoice paging.
+
+Revision ID: 0007_invoice_date_keyset_index
+Revises: 0006_idempotency_covering_index
+Create Date: 2026-10-15
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0007_invoice_date_keyset_index"
+down_revision = "0006_idempotency_covering_index"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+TABLE = "invoice"
+INDEX = "ix_invoice_tenant_date_id"
+COLUMNS: list[str | sa.TextClause] = ["tenant_id", sa.text("invoice_date DESC"), sa.text("id DESC")]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            op.create_index(INDEX, TABLE, COLUMNS, postgresql_concurrently=True)
+        return
+
+    op.create_index(INDEX, TABLE, COLUMNS)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(INDEX, table_name=TABLE, postgresql_concurrently=True)
+        return
+
+    op.drop_index(INDEX, table_name=TABLE)
@@ -0,0 +1,34 @@
+"""Per-tenant reconcile state so unchanged tenants reuse the last reconciliation.
+
+Revision ID: 0008_tenant_reconcile_state
+Revises: 0007_invoice_date_keyset_index
+Create Date: 2026-10-16
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0008_tenant_reconcile_state"
+down_revision = "0007_invoice_date_keyset_index"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+TABLE = "tenantreconcilestate"
+
+
+def upgrade() -> None:
+    # Rows are created by each tenant's first reconcile, so nothing is backfilled.
+    op.create_table(
+        TABLE,
+        sa.Column("tenant_id", sa.String(length=36), primary_key=True, nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+        sa.Column("reconciled_version", sa.BigInteger(), nullable=True),
+        sa.Column("response_body", sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenant.id"], ondelete="CASCADE"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE)
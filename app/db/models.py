@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
 from uuid import uuid4
 
-from sqlalchemy import Date, DateTime, Enum as SQLEnum, ForeignKey, Index, Numeric, String, UniqueConstraint, JSON
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import BigInteger, Date, DateTime, Enum as SQLEnum, ForeignKey, Index, Numeric, PrimaryKeyConstraint, String, Table, UniqueConstraint, JSON, event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+
+from app.core.ids import new_id
 
 from .base import Base, TimestampMixin
 
@@ -16,6 +19,13 @@ DELETE_CASCADE = "all, delete-orphan"
 UUID_STR = String(36)
 CURRENCY_CODE = String(3)
 DEFAULT_CURRENCY = "USD"
+MATCH_PARTITIONS = 16
+
+
+def to_minor_units(amount: Decimal | float | int) -> int:
+    """Convert a two-decimal currency amount to integer minor units (cents)."""
+
+    return int((Decimal(str(amount)) * 100).to_integral_value(rounding=ROUND_HALF_UP))
 
 
 class InvoiceStatus(str, Enum):
@@ -74,10 +84,11 @@ class Vendor(TenantScopedMixin, Base):
 class Invoice(TenantScopedMixin, Base):
     """Invoice issued by a tenant."""
 
-    id: Mapped[str] = mapped_column(UUID_STR, primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(UUID_STR, primary_key=True, default=new_id)
     vendor_id: Mapped[str | None] = mapped_column(UUID_STR, ForeignKey("vendor.id", ondelete="set null"), nullable=True)
     invoice_number: Mapped[str | None] = mapped_column(String(64), nullable=True)
     amount: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    amount_minor: Mapped[int] = mapped_column(BigInteger, nullable=False)
     currency: Mapped[str] = mapped_column(CURRENCY_CODE, nullable=False, default=DEFAULT_CURRENCY)
     invoice_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     description: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -89,9 +100,15 @@ class Invoice(TenantScopedMixin, Base):
     vendor: Mapped[Vendor | None] = relationship("Vendor", back_populates="invoices")
     matches: Mapped[list["MatchCandidate"]] = relationship("MatchCandidate", back_populates="invoice")
 
+    @validates("amount")
+    def _sync_amount_minor(self, _key: str, value: Decimal) -> Decimal:
+        self.amount_minor = to_minor_units(value)
+        return value
+
     __table_args__ = (
         Index("ix_invoice_status", "tenant_id", "status"),
         Index("ix_invoice_vendor", "tenant_id", "vendor_id"),
+        Index("ix_invoice_tenant_date_id", "tenant_id", text("invoice_date DESC"), text("id DESC")),
         UniqueConstraint("tenant_id", "invoice_number", name="uq_invoice_number_per_tenant"),
     )
 
@@ -99,26 +116,42 @@ class Invoice(TenantScopedMixin, Base):
 class BankTransaction(TenantScopedMixin, Base):
     """Bank transaction imported for reconciliation."""
 
-    id: Mapped[str] = mapped_column(UUID_STR, primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(UUID_STR, primary_key=True, default=new_id)
     external_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
     posted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     amount: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    amount_minor: Mapped[int] = mapped_column(BigInteger, nullable=False)
     currency: Mapped[str] = mapped_column(CURRENCY_CODE, nullable=False, default=DEFAULT_CURRENCY)
     description: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
     tenant: Mapped[Tenant] = relationship("Tenant", back_populates="bank_transactions")
     matches: Mapped[list["MatchCandidate"]] = relationship("MatchCandidate", back_populates="bank_transaction")
 
+    @validates("amount")
+    def _sync_amount_minor(self, _key: str, value: Decimal) -> Decimal:
+        self.amount_minor = to_minor_units(value)
+        return value
+
     __table_args__ = (
         UniqueConstraint("tenant_id", "external_id", name="uq_transaction_external_id"),
-        Index("ix_transaction_posted_at", "tenant_id", "posted_at"),
+        Index(
+            "ix_tx_tenant_posted_id",
+            "tenant_id",
+            "posted_at",
+            "id",
+            postgresql_include=["amount", "currency"],
+        ),
     )
 
 
 class MatchCandidate(TenantScopedMixin, Base):
-    """Proposed or finalized match between invoice and bank transaction."""
+    """Proposed or finalized match between invoice and bank transaction.
 
-    id: Mapped[str] = mapped_column(UUID_STR, primary_key=True, default=lambda: str(uuid4()))
+    On PostgreSQL the table is hash-partitioned by ``tenant_id`` so each
+    partition's indexes and vacuum work stay proportional to its tenants.
+    """
+
+    id: Mapped[str] = mapped_column(UUID_STR, default=new_id)
     invoice_id: Mapped[str] = mapped_column(UUID_STR, ForeignKey("invoice.id", ondelete="cascade"), nullable=False)
     bank_transaction_id: Mapped[str] = mapped_column(UUID_STR, ForeignKey("banktransaction.id", ondelete="cascade"), nullable=False)
     score: Mapped[Decimal] = mapped_column(Numeric(5, 4), nullable=False)
@@ -132,20 +165,53 @@ class MatchCandidate(TenantScopedMixin, Base):
     bank_transaction: Mapped[BankTransaction] = relationship("BankTransaction", back_populates="matches")
 
     __table_args__ = (
+        # Partitioned tables must include the partition key in their primary key.
+        PrimaryKeyConstraint("id", "tenant_id", name="matchcandidate_pkey"),
         UniqueConstraint(
             "tenant_id",
             "invoice_id",
             "bank_transaction_id",
             name="uq_match_unique_pair",
         ),
-        Index("ix_match_status", "tenant_id", "status"),
+        # Serves status filters and the top-scored listing as an ordered index walk.
+        Index("ix_match_tenant_status_score", "tenant_id", "status", text("score DESC"), "id"),
+        {"postgresql_partition_by": "HASH (tenant_id)"},
     )
+    # ids are globally unique, so identity lookups stay keyed on id alone.
+    __mapper_args__ = {"primary_key": [id]}
+
+
+@event.listens_for(MatchCandidate.__table__, "after_create")
+def _create_match_partitions(target: Table, connection: Connection, **_kw: object) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+    for remainder in range(MATCH_PARTITIONS):
+        connection.execute(
+            text(
+                f"CREATE TABLE {target.name}_p{remainder} PARTITION OF {target.name} "
+                f"FOR VALUES WITH (MODULUS {MATCH_PARTITIONS}, REMAINDER {remainder})"
+            )
+        )
+
+
+class TenantReconcileState(Base):
+    """Version of a tenant's reconcile inputs and the response last computed for it.
+
+    Invoice, bank transaction and match writes bump ``version`` in their own
+    transaction; reconcile returns ``response_body`` while
+    ``reconciled_version`` still equals it.
+    """
+
+    tenant_id: Mapped[str] = mapped_column(UUID_STR, ForeignKey("tenant.id", ondelete="cascade"), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    reconciled_version: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    response_body: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
 
 class IdempotencyKey(TenantScopedMixin, Base):
     """Persisted idempotency key usage for POST operations."""
 
-    id: Mapped[str] = mapped_column(UUID_STR, primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(UUID_STR, primary_key=True, default=new_id)
     key: Mapped[str] = mapped_column(String(128), nullable=False)
     endpoint: Mapped[str] = mapped_column(String(128), nullable=False)
     payload_hash: Mapped[str] = mapped_column(String(128), nullable=False)
@@ -153,7 +219,16 @@ class IdempotencyKey(TenantScopedMixin, Base):
     response_body: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
     __table_args__ = (
-        UniqueConstraint("tenant_id", "endpoint", "key", name="uq_idempotency_key"),
+        # Unique lookup index; on PostgreSQL it also covers what the import
+        # preflight reads, so replay checks are index-only scans.
+        Index(
+            "ix_idemp_tenant_endpoint_key",
+            "tenant_id",
+            "endpoint",
+            "key",
+            unique=True,
+            postgresql_include=["id", "payload_hash", "response_status"],
+        ),
     )
 
 
@@ -164,6 +239,7 @@ __all__ = [
     "BankTransaction",
     "MatchCandidate",
     "IdempotencyKey",
+    "TenantReconcileState",
     "InvoiceStatus",
     "MatchStatus",
 ]
@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from strawberry.fastapi import BaseContext
 
 from app.core.database import SessionLocal
-from app.core.tenant import TenantContext, load_tenant_context
+from app.core.tenant import TenantContext, cached_tenant_context, load_tenant_context
 
 
 @dataclass(slots=True)
@@ -25,10 +25,15 @@ class GraphQLContext(BaseContext):
 
 
 def build_context(tenant_id: str) -> GraphQLContext:
-    """Construct a GraphQL context with resolved tenant."""
+    """Construct a GraphQL context with resolved tenant.
 
-    with SessionLocal() as session:
-        tenant_context = load_tenant_context(session, tenant_id)
+    A session is only opened when the tenant is not already cached.
+    """
+
+    tenant_context = cached_tenant_context(tenant_id)
+    if tenant_context is None:
+        with SessionLocal() as session:
+            tenant_context = load_tenant_context(session, tenant_id)
     return GraphQLContext(tenant=tenant_context, session_factory=SessionLocal)
 
 
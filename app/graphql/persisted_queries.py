@@ -0,0 +1,63 @@
+"""Automatic persisted queries (APQ) for the GraphQL endpoint."""
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+
+from graphql import GraphQLError
+from strawberry.extensions import SchemaExtension
+
+PERSISTED_QUERY_CACHE_SIZE = 1024
+
+
+class PersistedQueries(SchemaExtension):
+    """Resolve ``extensions.persistedQuery.sha256Hash`` to a previously sent query.
+
+    Follows the Apollo APQ protocol: a hash-only request for an unknown hash
+    fails with ``PERSISTED_QUERY_NOT_FOUND`` so the client retries with the full
+    query, which is then registered under its hash. Parsing and validation of
+    the resolved query are cached by ``ParserCache`` and ``ValidationCache``.
+    """
+
+    def __init__(self, maxsize: int = PERSISTED_QUERY_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._queries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_operation(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        persisted = (execution_context.operation_extensions or {}).get("persistedQuery")
+        digest = persisted.get("sha256Hash") if isinstance(persisted, dict) else None
+        if digest:
+            if execution_context.query:
+                if hashlib.sha256(execution_context.query.encode()).hexdigest() != digest:
+                    raise GraphQLError(
+                        "provided sha does not match query",
+                        extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+                    )
+                self._store(digest, execution_context.query)
+            else:
+                query = self._lookup(digest)
+                if query is None:
+                    raise GraphQLError(
+                        "PersistedQueryNotFound",
+                        extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+                    )
+                execution_context.query = query
+        yield
+
+    def _lookup(self, digest: str) -> str | None:
+        with self._lock:
+            query = self._queries.get(digest)
+            if query is not None:
+                self._queries.move_to_end(digest)
+            return query
+
+    def _store(self, digest: str, query: str) -> None:
+        with self._lock:
+            self._queries[digest] = query
+            self._queries.move_to_end(digest)
+            while len(self._queries) > self.maxsize:
+                self._queries.popitem(last=False)
@@ -3,20 +3,26 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from datetime import date, datetime
+from operator import attrgetter
 from typing import TypeVar
+
 import strawberry
 from graphql import GraphQLError
+from strawberry.extensions import ParserCache, ValidationCache
 from strawberry.types import Info
 
 from app.db.models import InvoiceStatus, MatchStatus
 from app.graphql.context import GraphQLContext
+from app.graphql.persisted_queries import PERSISTED_QUERY_CACHE_SIZE, PersistedQueries
 from app.repositories.bank_transaction import BankTransactionRepository
 from app.repositories.match import MatchRepository
 from app.schemas.bank_transaction import (
     BankTransactionImportItem,
     BankTransactionImportRequest,
     BankTransactionImportResponse,
+    BankTransactionPage,
     BankTransactionRead,
 )
 from app.schemas.invoice import InvoiceCreate, InvoiceFilterParams, InvoiceListResponse, InvoiceRead
@@ -42,6 +48,11 @@ ResultType = TypeVar("ResultType")
 InvoiceStatusEnum = strawberry.enum(InvoiceStatus, name="InvoiceStatus")
 MatchStatusEnum = strawberry.enum(MatchStatus, name="MatchStatus")
 
+# Both enums are str-valued, so these accept either a member or its raw value
+# with a single dict lookup instead of an Enum constructor call per row.
+_INVOICE_STATUS_BY_VALUE = {member.value: member for member in InvoiceStatus}
+_MATCH_STATUS_BY_VALUE = {member.value: member for member in MatchStatus}
+
 
 @contextmanager
 def _session_scope(context: GraphQLContext):
@@ -75,7 +86,9 @@ class HealthCheck:
     status: str
 
 
+# Output types built once per row are slotted to skip a per-instance __dict__.
 @strawberry.type
+@dataclass(slots=True)
 class TenantType:
     id: strawberry.ID
     name: str
@@ -83,6 +96,7 @@ class TenantType:
 
 
 @strawberry.type
+@dataclass(slots=True)
 class InvoiceType:
     id: strawberry.ID
     tenant_id: strawberry.ID
@@ -97,12 +111,15 @@ class InvoiceType:
 
 
 @strawberry.type
+@dataclass(slots=True)
 class InvoiceListType:
     items: list[InvoiceType]
     total: int
+    end_cursor: str | None = None
 
 
 @strawberry.type
+@dataclass(slots=True)
 class BankTransactionType:
     id: strawberry.ID
     tenant_id: strawberry.ID
@@ -115,6 +132,15 @@ class BankTransactionType:
 
 
 @strawberry.type
+@dataclass(slots=True)
+class BankTransactionPageType:
+    items: list[BankTransactionType]
+    end_cursor: str | None
+    has_next_page: bool
+
+
+@strawberry.type
+@dataclass(slots=True)
 class BankTransactionImportResult:
     created: int
     duplicates: int
@@ -123,6 +149,7 @@ class BankTransactionImportResult:
 
 
 @strawberry.type
+@dataclass(slots=True)
 class MatchCandidateType:
     id: strawberry.ID
     invoice_id: strawberry.ID
@@ -134,6 +161,7 @@ class MatchCandidateType:
 
 
 @strawberry.type
+@dataclass(slots=True)
 class ReconciliationResult:
     matches: list[MatchCandidateType]
 
@@ -189,8 +217,18 @@ class BankTransactionImportInput:
     transactions: list[BankTransactionImportItemInput]
 
 
+def _field_getter(graphql_type: type) -> attrgetter:
+    """Read a type's fields, in constructor order, from a schema model in one C call."""
+
+    return attrgetter(*(field.name for field in fields(graphql_type)))
+
+
+_tenant_values = _field_getter(TenantType)
+_bank_transaction_values = _field_getter(BankTransactionType)
+
+
 def _to_tenant_type(tenant: TenantRead) -> TenantType:
-    return TenantType(id=tenant.id, name=tenant.name, created_at=tenant.created_at)
+    return TenantType(*_tenant_values(tenant))
 
 
 def _to_invoice_type(invoice: InvoiceRead) -> InvoiceType:
@@ -203,25 +241,28 @@ def _to_invoice_type(invoice: InvoiceRead) -> InvoiceType:
         currency=invoice.currency,
         invoice_date=invoice.invoice_date,
         description=invoice.description,
-        status=InvoiceStatusEnum(invoice.status),
+        status=_INVOICE_STATUS_BY_VALUE[invoice.status],
         created_at=invoice.created_at,
     )
 
 
 def _to_invoice_list(response: InvoiceListResponse) -> InvoiceListType:
-    return InvoiceListType(items=[_to_invoice_type(item) for item in response.items], total=response.total)
+    return InvoiceListType(
+        items=list(map(_to_invoice_type, response.items)),
+        total=response.total,
+        end_cursor=response.next_cursor,
+    )
 
 
 def _to_bank_transaction_type(transaction: BankTransactionRead) -> BankTransactionType:
-    return BankTransactionType(
-        id=transaction.id,
-        tenant_id=transaction.tenant_id,
-        external_id=transaction.external_id,
-        posted_at=transaction.posted_at,
-        amount=transaction.amount,
-        currency=transaction.currency,
-        description=transaction.description,
-        created_at=transaction.created_at,
+    return BankTransactionType(*_bank_transaction_values(transaction))
+
+
+def _to_bank_transaction_page(page: BankTransactionPage) -> BankTransactionPageType:
+    return BankTransactionPageType(
+        items=list(map(_to_bank_transaction_type, page.items)),
+        end_cursor=page.next_cursor,
+        has_next_page=page.next_cursor is not None,
     )
 
 
@@ -230,7 +271,7 @@ def _to_import_result(response: BankTransactionImportResponse) -> BankTransactio
         created=response.created,
         duplicates=response.duplicates,
         conflicts=response.conflicts,
-        transactions=[_to_bank_transaction_type(txn) for txn in response.transactions],
+        transactions=list(map(_to_bank_transaction_type, response.transactions)),
     )
 
 
@@ -240,14 +281,14 @@ def _to_match_type(candidate: MatchCandidateRead) -> MatchCandidateType:
         invoice_id=candidate.invoice_id,
         bank_transaction_id=candidate.bank_transaction_id,
         score=candidate.score,
-        status=MatchStatusEnum(candidate.status),
+        status=_MATCH_STATUS_BY_VALUE[candidate.status],
         reasoning=candidate.reasoning,
         created_at=candidate.created_at,
     )
 
 
 def _to_reconciliation_result(response: ReconciliationResponse) -> ReconciliationResult:
-    return ReconciliationResult(matches=[_to_match_type(item) for item in response.matches])
+    return ReconciliationResult(matches=list(map(_to_match_type, response.matches)))
 
 
 def _to_confirmation_result(response: MatchConfirmationResponse) -> MatchConfirmationResult:
@@ -261,9 +302,11 @@ def _to_ai_explanation(response: AIExplanationResponse) -> AIExplanationType:
     return AIExplanationType(explanation=response.explanation, confidence=response.confidence)
 
 
-def _build_invoice_filters(filters: InvoiceFilterInput | None) -> InvoiceFilterParams:
+def _build_invoice_filters(
+    filters: InvoiceFilterInput | None, cursor: str | None = None
+) -> InvoiceFilterParams:
     if filters is None:
-        return InvoiceFilterParams()
+        return InvoiceFilterParams(cursor=cursor)
     return InvoiceFilterParams(
         status=filters.status,
         vendor_id=str(filters.vendor_id) if filters.vendor_id is not None else None,
@@ -271,6 +314,7 @@ def _build_invoice_filters(filters: InvoiceFilterInput | None) -> InvoiceFilterP
         end_date=filters.end_date,
         min_amount=filters.min_amount,
         max_amount=filters.max_amount,
+        cursor=cursor,
     )
 
 
@@ -304,7 +348,7 @@ class Query:
             lambda session, _context: TenantService(session),
             lambda service: service.list(),
         )
-        return [_to_tenant_type(item) for item in result]
+        return list(map(_to_tenant_type, result))
 
     @strawberry.field(description="List tenant invoices with optional filters")
     def invoices(
@@ -313,11 +357,14 @@ class Query:
         filters: InvoiceFilterInput | None = None,
         offset: int = 0,
         limit: int = 100,
+        after: str | None = None,
     ) -> InvoiceListType:
         response = _execute_with_service(
             info,
             lambda session, context: InvoiceService(session, context.tenant),
-            lambda service: service.list(_build_invoice_filters(filters), offset=offset, limit=limit),
+            lambda service: service.list(
+                _build_invoice_filters(filters, after), offset=offset, limit=limit
+            ),
         )
         return _to_invoice_list(response)
 
@@ -333,21 +380,37 @@ class Query:
             lambda session, context: BankTransactionService(session, context.tenant),
             lambda service: service.list_transactions(offset=offset, limit=limit),
         )
-        return [_to_bank_transaction_type(item) for item in rows]
+        return list(map(_to_bank_transaction_type, rows))
 
-    @strawberry.field(description="List match candidates, optionally filtered by status")
+    @strawberry.field(description="Page through bank transactions by posting time using a cursor")
+    def bank_transactions_page(
+        self,
+        info: Info[GraphQLContext, None],
+        after: str | None = None,
+        limit: int = 100,
+    ) -> BankTransactionPageType:
+        page = _execute_with_service(
+            info,
+            lambda session, context: BankTransactionService(session, context.tenant),
+            lambda service: service.list_transactions_page(after=after, limit=limit),
+        )
+        return _to_bank_transaction_page(page)
+
+    @strawberry.field(description="List match candidates best-scored first, optionally filtered by status")
     def match_candidates(
         self,
         info: Info[GraphQLContext, None],
         status: MatchStatusEnum | None = None,
+        limit: int | None = None,
     ) -> list[MatchCandidateType]:
-        status_filter = status if status is None else MatchStatus(status.value)
+        # strawberry.enum registers MatchStatus itself, so the argument already
+        # arrives as the model enum.
         rows = _execute_with_service(
             info,
             lambda session, context: ReconciliationService(session, context.tenant),
-            lambda service: service.list_matches(status=status_filter),
+            lambda service: service.list_matches(status=status, limit=limit),
         )
-        return [_to_match_type(item) for item in rows]
+        return list(map(_to_match_type, rows))
 
     @strawberry.field(description="Explain reconciliation for a specific invoice/transaction pair")
     def explain_reconciliation(
@@ -363,6 +426,19 @@ class Query:
         )
         return _to_ai_explanation(response)
 
+    @strawberry.field(description="Explain several reconciliation matches, in request order")
+    def explain_matches(
+        self,
+        info: Info[GraphQLContext, None],
+        match_ids: list[strawberry.ID],
+    ) -> list[AIExplanationType]:
+        responses = _execute_with_service(
+            info,
+            lambda session, context: ExplanationService(session, context.tenant),
+            lambda service: service.explain_matches([str(match_id) for match_id in match_ids]),
+        )
+        return list(map(_to_ai_explanation, responses))
+
 
 @strawberry.type
 class Mutation:
@@ -449,4 +525,12 @@ class Mutation:
         return _to_confirmation_result(response)
 
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[
+        PersistedQueries(),
+        ParserCache(maxsize=PERSISTED_QUERY_CACHE_SIZE),
+        ValidationCache(maxsize=PERSISTED_QUERY_CACHE_SIZE),
+    ],
+)
@@ -6,30 +6,17 @@ from pathlib import Path
 from typing import AsyncIterator
 
 from fastapi import FastAPI
-from alembic import command
-from alembic.config import Config
 from strawberry.fastapi import GraphQLRouter
 
+from app.ai.provider import close_ai_clients
 from app.api.router import router as api_router
-from app.core.database import ENGINE, create_database_schema
+from app.cli import migrate
+from app.core.database import ENGINE
 from app.core.settings import Settings, get_settings
 from app.graphql.context import context_getter
 from app.graphql.schema import schema
 
 
-def _run_migrations() -> None:
-    """Execute Alembic migrations; fallback to metadata create_all on failure."""
-
-    config = Config("alembic.ini")
-    try:
-        command.upgrade(config, "head")
-    except Exception:
-        create_database_schema()
-        return
-
-    create_database_schema()
-
-
 def _ensure_sqlite_directory(settings: Settings) -> None:
     """If using SQLite file storage, ensure parent directory exists."""
 
@@ -47,11 +34,15 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     settings = get_settings()
     _ensure_sqlite_directory(settings)
-    _run_migrations()
+    # Migrations normally run once per deploy via `python -m app.cli migrate`;
+    # running them here would repeat the upgrade in every worker.
+    if settings.run_migrations_on_startup:
+        migrate()
     app.state.settings = settings
     try:
         yield
     finally:
+        await close_ai_clients()
         ENGINE.dispose()
 
 
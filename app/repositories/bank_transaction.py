@@ -1,40 +1,185 @@
 """Repository for bank transaction entities."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from itertools import islice
+from typing import Any, NamedTuple, TypeVar
 
-from sqlalchemy import Select, select
+from sqlalchemy import (
+    CompoundSelect,
+    RowMapping,
+    Select,
+    bindparam,
+    literal,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import load_only
 
 from app.core.tenant import TenantContext
-from app.db.models import BankTransaction
+from app.db.models import BankTransaction, IdempotencyKey
 
 from .base import TenantScopedRepository
 
+EXTERNAL_ID_CHUNK_SIZE = 500
+# SQLite's default bind-parameter ceiling before 3.32; bulk inserts size their
+# chunks so that rows times columns stays under it on every backend.
+MAX_BIND_PARAMS = 999
+
+T = TypeVar("T")
+
+# Columns of ``BankTransactionRead``; read paths select these as plain rows.
+READ_COLUMNS = (
+    BankTransaction.id,
+    BankTransaction.tenant_id,
+    BankTransaction.external_id,
+    BankTransaction.posted_at,
+    BankTransaction.amount,
+    BankTransaction.currency,
+    BankTransaction.description,
+    BankTransaction.created_at,
+)
+
+# Hot import lookups are built once; callers bind ``tenant_id`` and ``ids`` at
+# execution time so every chunk reuses the same compiled-SQL cache entry.
+_EXISTING_EXTERNAL_IDS = (
+    select(BankTransaction.external_id, BankTransaction.id)
+    .where(BankTransaction.tenant_id == bindparam("tenant_id"))
+    .where(BankTransaction.external_id.in_(bindparam("ids", expanding=True)))
+)
+
+
+class ImportPreflight(NamedTuple):
+    """State needed before importing a batch, gathered in one round-trip."""
+
+    idempotency_id: str | None
+    payload_hash: str | None
+    existing: dict[str, str]
+
+
+def _chunked(values: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 
 class BankTransactionRepository(TenantScopedRepository[BankTransaction]):
     """Bank transaction repository with helper queries."""
 
     model = BankTransaction
 
-    def get_by_external_ids(
-        self, tenant: TenantContext, external_ids: Iterable[str]
-    ) -> dict[str, BankTransaction]:
+    def existing_external_ids(self, tenant: TenantContext, external_ids: Iterable[str]) -> dict[str, str]:
+        """Map already-imported external ids to transaction ids without loading entities.
+
+        Lookups run in chunks of ``EXTERNAL_ID_CHUNK_SIZE`` to stay under driver
+        bind-parameter limits on large imports.
+        """
+
+        found: dict[str, str] = {}
+        for chunk in _chunked((eid for eid in external_ids if eid), EXTERNAL_ID_CHUNK_SIZE):
+            rows = self.session.execute(
+                _EXISTING_EXTERNAL_IDS, {"tenant_id": tenant.tenant_id, "ids": chunk}
+            )
+            found.update((external_id, txn_id) for external_id, txn_id in rows)
+        return found
+
+    def bulk_create(self, rows: list[dict[str, Any]]) -> list[RowMapping]:
+        """Insert ``rows`` with one statement per chunk, skipping external-id conflicts.
+
+        Rows whose ``(tenant_id, external_id)`` already exists are dropped by the
+        database and are absent from the result, so callers should pre-generate
+        ``id`` values to map results back to their payload. Core inserts bypass
+        model validators, so each row must carry ``amount_minor`` itself.
+        Inserted rows come back as ``READ_COLUMNS`` mappings, not entities.
+        Chunks hold as many rows as fit in ``MAX_BIND_PARAMS`` with every
+        table column bound, since client-side defaults add parameters too.
+        """
+
+        dialect = postgresql if self.session.get_bind().dialect.name == "postgresql" else sqlite
+        chunk_size = max(1, MAX_BIND_PARAMS // len(self.model.__table__.columns))
+        created: list[RowMapping] = []
+        for chunk in _chunked(rows, chunk_size):
+            statement = (
+                dialect.insert(self.model)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=["tenant_id", "external_id"])
+                .returning(*READ_COLUMNS)
+            )
+            created.extend(self.session.execute(statement).mappings())
+        return created
+
+    def preflight_import(
+        self,
+        tenant: TenantContext,
+        endpoint: str,
+        idempotency_key: str,
+        external_ids: Iterable[str],
+    ) -> ImportPreflight:
+        """Look up the idempotency record and already-imported external ids together.
+
+        Both lookups are combined with ``UNION ALL`` so a typical import pays a
+        single round-trip; ids beyond the first chunk fall back to
+        :meth:`existing_external_ids`.
+        """
+
         ids = [eid for eid in external_ids if eid]
-        if not ids:
-            return {}
-        statement = (
-            self._base_query()
-            .where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
-            .where(self.model.external_id.in_(ids))  # type: ignore[attr-defined]
+        first, rest = ids[:EXTERNAL_ID_CHUNK_SIZE], ids[EXTERNAL_ID_CHUNK_SIZE:]
+
+        statement: Select[Any] | CompoundSelect = (
+            select(
+                literal("idempotency").label("source"),
+                IdempotencyKey.payload_hash.label("lookup"),
+                IdempotencyKey.id.label("row_id"),
+            )
+            .where(IdempotencyKey.tenant_id == tenant.tenant_id)
+            .where(IdempotencyKey.endpoint == endpoint)
+            .where(IdempotencyKey.key == idempotency_key)
         )
-        rows = self.session.scalars(statement).all()
-        return {row.external_id: row for row in rows if row.external_id}
+        params: dict[str, Any] = {}
+        if first:
+            params["ids"] = first
+            statement = union_all(
+                statement,
+                select(literal("transaction"), self.model.external_id, self.model.id)
+                .where(self.model.tenant_id == tenant.tenant_id)
+                .where(self.model.external_id.in_(bindparam("ids", expanding=True))),
+            )
+
+        idempotency_id: str | None = None
+        payload_hash: str | None = None
+        existing: dict[str, str] = {}
+        for source, lookup, row_id in self.session.execute(statement, params):
+            if source == "idempotency":
+                idempotency_id, payload_hash = row_id, lookup
+            else:
+                existing[lookup] = row_id
+        if rest:
+            existing.update(self.existing_external_ids(tenant, rest))
+        return ImportPreflight(idempotency_id, payload_hash, existing)
 
     def list_for_invoice_matching(self, tenant: TenantContext) -> list[BankTransaction]:
-        """Return bank transactions eligible for matching."""
+        """Return bank transactions eligible for matching, with only the columns scoring reads.
+
+        Amounts come back as integer ``amount_minor`` only; the ``Numeric``
+        ``amount`` column is not loaded, so no ``Decimal`` is built per row.
+        Any column outside the ``load_only`` set raises on access.
+        """
 
         statement: Select[tuple[BankTransaction]] = (
-            self._base_query()
+            self._base_query(
+                load_only(
+                    self.model.id,
+                    self.model.tenant_id,
+                    self.model.amount_minor,
+                    self.model.currency,
+                    self.model.posted_at,
+                    self.model.description,
+                    raiseload=True,
+                )
+            )
             .where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
         )
         return self.session.scalars(statement).all()
@@ -44,11 +189,51 @@ class BankTransactionRepository(TenantScopedRepository[BankTransaction]):
         tenant: TenantContext,
         offset: int = 0,
         limit: int = 100,
+        after_id: str | None = None,
+        after_posted_at: datetime | None = None,
     ) -> list[BankTransaction]:
-        statement: Select[tuple[BankTransaction]] = (
-            self._base_query()
-            .where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
-            .offset(offset)
+        """List transactions by ``(posted_at, id)``.
+
+        When both ``after_posted_at`` and ``after_id`` are given the query seeks
+        past that position on ``ix_tx_tenant_posted_id``, so deep pages cost the
+        same as the first one.
+        """
+
+        statement = self._page(self._base_query(), tenant, offset, limit, after_id, after_posted_at)
+        return self.session.scalars(statement).all()
+
+    def list_for_tenant_rows(
+        self,
+        tenant: TenantContext,
+        offset: int = 0,
+        limit: int = 100,
+        after_id: str | None = None,
+        after_posted_at: datetime | None = None,
+    ) -> Sequence[RowMapping]:
+        """Same page as :meth:`list_for_tenant`, as plain ``READ_COLUMNS`` mappings.
+
+        Skips ORM identity-map and instance construction for read-only callers.
+        """
+
+        statement = self._page(select(*READ_COLUMNS), tenant, offset, limit, after_id, after_posted_at)
+        return self.session.execute(statement).mappings().all()
+
+    def _page(
+        self,
+        statement: Select[Any],
+        tenant: TenantContext,
+        offset: int,
+        limit: int,
+        after_id: str | None,
+        after_posted_at: datetime | None,
+    ) -> Select[Any]:
+        statement = (
+            statement.where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
+            .order_by(self.model.posted_at, self.model.id)  # type: ignore[attr-defined]
             .limit(limit)
         )
-        return self.session.scalars(statement).all()
+        if after_id is not None and after_posted_at is not None:
+            return statement.where(
+                tuple_(self.model.posted_at, self.model.id) > tuple_(after_posted_at, after_id)
+            )
+        return statement.offset(offset)
@@ -4,7 +4,8 @@ from __future__ import annotations
 from typing import Generic, Sequence, TypeVar
 
 from sqlalchemy import Select, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.db.base import Base
 from app.core.tenant import TenantContext, TenantMismatchError
@@ -35,16 +36,44 @@ class Repository(Generic[ModelT]):
     def delete(self, instance: ModelT) -> None:
         self.session.delete(instance)
 
-    def _base_query(self) -> Select[tuple[ModelT]]:
-        return select(self.model)
+    def _base_query(self, *loader_options: LoaderOption) -> Select[tuple[ModelT]]:
+        """Select the model, eagerly loading ``loader_options``.
+
+        When loaders are given, every other relationship raises on access so an
+        unplanned lazy load cannot silently turn a list query into N+1 selects.
+        Collections must use ``selectinload``: a joined collection repeats the
+        parent row per child and would force a Python-side ``.unique()`` pass
+        over every result, so it is rejected here.
+        """
+
+        statement = select(self.model)
+        if loader_options:
+            _reject_joined_collections(loader_options)
+            statement = statement.options(*loader_options, raiseload("*"))
+        return statement
+
+
+def _reject_joined_collections(loader_options: tuple[LoaderOption, ...]) -> None:
+    for option in loader_options:
+        for element in getattr(option, "context", ()):
+            if ("lazy", "joined") not in (getattr(element, "strategy", None) or ()):
+                continue
+            path = list(element.path)
+            # Paths alternate mapper, relationship, mapper; the loaded one is second to last.
+            if len(path) >= 2 and getattr(path[-2], "uselist", False):
+                raise ValueError(
+                    f"joinedload on collection {path[-2]} duplicates parent rows; use selectinload"
+                )
 
 
 class TenantScopedRepository(Repository[ModelT]):
     """Repository enforcing tenant-based filtering."""
 
-    def get_for_tenant(self, tenant: TenantContext, obj_id: int | str) -> ModelT | None:
+    def get_for_tenant(
+        self, tenant: TenantContext, obj_id: int | str, *loader_options: LoaderOption
+    ) -> ModelT | None:
         statement = (
-            self._base_query()
+            self._base_query(*loader_options)
             .where(self.model.id == obj_id)  # type: ignore[attr-defined]
             .where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
         )
@@ -55,13 +84,20 @@ class TenantScopedRepository(Repository[ModelT]):
         tenant: TenantContext,
         offset: int = 0,
         limit: int = 100,
+        after_id: str | None = None,
     ) -> Sequence[ModelT]:
+        """List tenant rows by id; ``after_id`` seeks past a key instead of offsetting."""
+
         statement = (
             self._base_query()
             .where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
-            .offset(offset)
+            .order_by(self.model.id)  # type: ignore[attr-defined]
             .limit(limit)
         )
+        if after_id is not None:
+            statement = statement.where(self.model.id > after_id)  # type: ignore[attr-defined]
+        else:
+            statement = statement.offset(offset)
         return self.session.scalars(statement).all()
 
     def assert_entity_tenant(self, tenant: TenantContext, entity: ModelT) -> None:
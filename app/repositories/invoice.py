@@ -1,21 +1,33 @@
 """Invoice repository handling tenant-scoped queries."""
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import date
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, StatementLambdaElement, func, lambda_stmt, select, tuple_
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.core.tenant import TenantContext
-from app.db.models import Invoice, InvoiceStatus
+from app.db.models import Invoice, InvoiceStatus, Vendor
 
 from .base import TenantScopedRepository
 
+OPEN_INVOICE_BATCH_SIZE = 1000
+
 
 class InvoiceRepository(TenantScopedRepository[Invoice]):
     """Invoice repository with filtering helpers."""
 
     model = Invoice
 
+    def get_for_tenant(
+        self, tenant: TenantContext, obj_id: int | str, *loader_options: LoaderOption
+    ) -> Invoice | None:
+        """Fetch an invoice with its vendor joined into the same query."""
+
+        return super().get_for_tenant(tenant, obj_id, joinedload(self.model.vendor), *loader_options)
+
     def build_filter_query(
         self,
         tenant: TenantContext,
@@ -27,21 +39,24 @@ class InvoiceRepository(TenantScopedRepository[Invoice]):
         max_amount: float | None = None,
         offset: int = 0,
         limit: int = 100,
-    ) -> Select[tuple[Invoice]]:
-        statement = self._base_query().where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
-        if status is not None:
-            statement = statement.where(self.model.status == status)  # type: ignore[attr-defined]
-        if vendor_id:
-            statement = statement.where(self.model.vendor_id == vendor_id)  # type: ignore[attr-defined]
-        if start_date:
-            statement = statement.where(self.model.invoice_date >= start_date)  # type: ignore[attr-defined]
-        if end_date:
-            statement = statement.where(self.model.invoice_date <= end_date)  # type: ignore[attr-defined]
-        if min_amount is not None:
-            statement = statement.where(self.model.amount >= min_amount)  # type: ignore[attr-defined]
-        if max_amount is not None:
-            statement = statement.where(self.model.amount <= max_amount)  # type: ignore[attr-defined]
-        return statement.offset(offset).limit(limit)
+    ) -> StatementLambdaElement:
+        """Select a filtered page of invoices, each row carrying ``total_count``.
+
+        ``COUNT(*) OVER ()`` is evaluated before ``LIMIT``/``OFFSET``, so the
+        column holds the unpaged total. ``session.scalars`` still yields invoices.
+        """
+
+        statement = self._apply_filters(
+            lambda_stmt(lambda: select(Invoice, func.count().over().label("total_count"))),
+            tenant,
+            status,
+            vendor_id,
+            start_date,
+            end_date,
+            min_amount,
+            max_amount,
+        )
+        return statement + (lambda s: s.offset(offset).limit(limit))
 
     def count_filtered(
         self,
@@ -53,25 +68,228 @@ class InvoiceRepository(TenantScopedRepository[Invoice]):
         min_amount: float | None = None,
         max_amount: float | None = None,
     ) -> int:
-        statement = select(func.count()).select_from(self.model).where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
+        statement = self._apply_filters(
+            lambda_stmt(lambda: select(func.count()).select_from(Invoice)),
+            tenant,
+            status,
+            vendor_id,
+            start_date,
+            end_date,
+            min_amount,
+            max_amount,
+        )
+        return int(self.session.scalar(statement) or 0)
+
+    def list_filtered_with_total(
+        self,
+        tenant: TenantContext,
+        status: InvoiceStatus | None = None,
+        vendor_id: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        min_amount: float | None = None,
+        max_amount: float | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[Invoice], int]:
+        """Return a page of filtered invoices and the unpaged total in one query.
+
+        A page past the end has no rows to carry the total, and only then is a
+        separate count issued.
+        """
+
+        statement = self.build_filter_query(
+            tenant, status, vendor_id, start_date, end_date, min_amount, max_amount, offset, limit
+        )
+        rows = self.session.execute(statement).all()
+        if rows:
+            return [row.Invoice for row in rows], int(rows[0].total_count)
+        if offset == 0:
+            return [], 0
+        total = self.count_filtered(
+            tenant, status, vendor_id, start_date, end_date, min_amount, max_amount
+        )
+        return [], total
+
+    def list_filtered_keyset(
+        self,
+        tenant: TenantContext,
+        status: InvoiceStatus | None = None,
+        vendor_id: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        min_amount: float | None = None,
+        max_amount: float | None = None,
+        *,
+        after: tuple[date | None, str] | None = None,
+        limit: int = 100,
+    ) -> list[Invoice]:
+        """Return filtered invoices newest first, seeking past the ``after`` key.
+
+        Ordered by ``(invoice_date DESC NULLS FIRST, id DESC)`` to walk
+        ``ix_invoice_tenant_date_id``, so any page costs the same as the first.
+        Undated invoices come first, and a cursor inside them stays there
+        until their ids run out.
+        """
+
+        statement = self._keyset_query(
+            lambda_stmt(lambda: select(Invoice)),
+            tenant,
+            status,
+            vendor_id,
+            start_date,
+            end_date,
+            min_amount,
+            max_amount,
+            after,
+            limit,
+        )
+        return list(self.session.scalars(statement))
+
+    def list_filtered_keyset_with_total(
+        self,
+        tenant: TenantContext,
+        status: InvoiceStatus | None = None,
+        vendor_id: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        min_amount: float | None = None,
+        max_amount: float | None = None,
+        *,
+        after: tuple[date | None, str] | None = None,
+        limit: int = 100,
+    ) -> tuple[list[Invoice], int]:
+        """Return a keyset page of filtered invoices and the unseeked total.
+
+        The first page has no seek predicate, so ``COUNT(*) OVER ()`` carries
+        the total in the same query. Later pages keep the cheap index seek and
+        count separately, since a window there would only count what is left.
+        """
+
+        if after is not None:
+            invoices = self.list_filtered_keyset(
+                tenant,
+                status,
+                vendor_id,
+                start_date,
+                end_date,
+                min_amount,
+                max_amount,
+                after=after,
+                limit=limit,
+            )
+            total = self.count_filtered(
+                tenant, status, vendor_id, start_date, end_date, min_amount, max_amount
+            )
+            return invoices, total
+
+        statement = self._keyset_query(
+            lambda_stmt(lambda: select(Invoice, func.count().over().label("total_count"))),
+            tenant,
+            status,
+            vendor_id,
+            start_date,
+            end_date,
+            min_amount,
+            max_amount,
+            None,
+            limit,
+        )
+        rows = self.session.execute(statement).all()
+        if not rows:
+            return [], 0
+        return [row.Invoice for row in rows], int(rows[0].total_count)
+
+    def _keyset_query(
+        self,
+        statement: StatementLambdaElement,
+        tenant: TenantContext,
+        status: InvoiceStatus | None,
+        vendor_id: str | None,
+        start_date: date | None,
+        end_date: date | None,
+        min_amount: float | None,
+        max_amount: float | None,
+        after: tuple[date | None, str] | None,
+        limit: int,
+    ) -> StatementLambdaElement:
+        statement = self._apply_filters(
+            statement, tenant, status, vendor_id, start_date, end_date, min_amount, max_amount
+        )
+        if after is not None:
+            after_date, after_id = after
+            if after_date is None:
+                statement += lambda s: s.where(
+                    Invoice.invoice_date.is_not(None)
+                    | (Invoice.invoice_date.is_(None) & (Invoice.id < after_id))
+                )
+            else:
+                statement += lambda s: s.where(
+                    tuple_(Invoice.invoice_date, Invoice.id) < tuple_(after_date, after_id)
+                )
+        return statement + (
+            lambda s: s.order_by(Invoice.invoice_date.desc().nulls_first(), Invoice.id.desc()).limit(
+                limit
+            )
+        )
+
+    def _apply_filters(
+        self,
+        statement: StatementLambdaElement,
+        tenant: TenantContext,
+        status: InvoiceStatus | None,
+        vendor_id: str | None,
+        start_date: date | None,
+        end_date: date | None,
+        min_amount: float | None,
+        max_amount: float | None,
+    ) -> StatementLambdaElement:
+        """Append the requested filters as lambdas.
+
+        Each lambda's compiled SQL is cached by its code location, so every
+        combination of filters compiles once and later calls only bind values.
+        """
+
+        tenant_id = tenant.tenant_id
+        statement += lambda s: s.where(Invoice.tenant_id == tenant_id)
         if status is not None:
-            statement = statement.where(self.model.status == status)  # type: ignore[attr-defined]
+            statement += lambda s: s.where(Invoice.status == status)
         if vendor_id:
-            statement = statement.where(self.model.vendor_id == vendor_id)  # type: ignore[attr-defined]
+            statement += lambda s: s.where(Invoice.vendor_id == vendor_id)
         if start_date:
-            statement = statement.where(self.model.invoice_date >= start_date)  # type: ignore[attr-defined]
+            statement += lambda s: s.where(Invoice.invoice_date >= start_date)
         if end_date:
-            statement = statement.where(self.model.invoice_date <= end_date)  # type: ignore[attr-defined]
+            statement += lambda s: s.where(Invoice.invoice_date <= end_date)
         if min_amount is not None:
-            statement = statement.where(self.model.amount >= min_amount)  # type: ignore[attr-defined]
+            statement += lambda s: s.where(Invoice.amount >= min_amount)
         if max_amount is not None:
-            statement = statement.where(self.model.amount <= max_amount)  # type: ignore[attr-defined]
-        return int(self.session.scalar(statement) or 0)
+            statement += lambda s: s.where(Invoice.amount <= max_amount)
+        return statement
+
+    def list_open_invoices(self, tenant: TenantContext) -> Iterator[Invoice]:
+        """Stream open invoices with only the columns scoring reads.
+
+        Rows are fetched ``OPEN_INVOICE_BATCH_SIZE`` at a time, with vendors
+        selectin-loaded per batch, so memory stays flat however many invoices
+        are open. Any column outside the ``load_only`` set raises on access.
+        """
 
-    def list_open_invoices(self, tenant: TenantContext) -> list[Invoice]:
         statement: Select[tuple[Invoice]] = (
-            self._base_query()
+            self._base_query(
+                load_only(
+                    self.model.id,
+                    self.model.tenant_id,
+                    self.model.vendor_id,
+                    self.model.amount_minor,
+                    self.model.currency,
+                    self.model.invoice_date,
+                    self.model.description,
+                    raiseload=True,
+                ),
+                selectinload(self.model.vendor).load_only(Vendor.name),
+            )
             .where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
             .where(self.model.status == InvoiceStatus.OPEN)  # type: ignore[attr-defined]
+            .execution_options(yield_per=OPEN_INVOICE_BATCH_SIZE)
         )
-        return self.session.scalars(statement).all()
+        yield from self.session.scalars(statement)
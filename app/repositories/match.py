@@ -1,70 +1,162 @@
 """Repository for match candidate entities."""
 from __future__ import annotations
 
-from sqlalchemy import Select, delete, select
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+from sqlalchemy import (
+    RowMapping,
+    Select,
+    StatementLambdaElement,
+    case,
+    cast,
+    delete,
+    insert,
+    lambda_stmt,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.core.tenant import TenantContext
-from app.db.models import MatchCandidate, MatchStatus
+from app.db.models import Invoice, MatchCandidate, MatchStatus
 
 from .base import TenantScopedRepository
 
+# Columns of ``MatchCandidateRead``; read paths select these as plain rows.
+READ_COLUMNS = (
+    MatchCandidate.id,
+    MatchCandidate.invoice_id,
+    MatchCandidate.bank_transaction_id,
+    MatchCandidate.score,
+    MatchCandidate.status,
+    MatchCandidate.reasoning,
+    MatchCandidate.created_at,
+)
+
+
+class ReconciliationState(NamedTuple):
+    """Existing match facts a reconcile run needs, read in one scan."""
+
+    confirmed_invoice_ids: set[str]
+    confirmed_transaction_ids: set[str]
+    # Transaction ids each invoice has a confirmed or rejected match with.
+    settled_pairs: dict[str, frozenset[str]]
+
 
 class MatchRepository(TenantScopedRepository[MatchCandidate]):
     """Match candidate persistence helpers."""
 
     model = MatchCandidate
 
-    def list_proposed(self, tenant: TenantContext) -> list[MatchCandidate]:
-        statement: Select[tuple[MatchCandidate]] = (
-            self._base_query()
-            .where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
-            .where(self.model.status == MatchStatus.PROPOSED)  # type: ignore[attr-defined]
+    def get_for_tenant(
+        self, tenant: TenantContext, obj_id: int | str, *loader_options: LoaderOption
+    ) -> MatchCandidate | None:
+        """Fetch a match with its invoice, vendor and bank transaction in one query."""
+
+        return super().get_for_tenant(
+            tenant,
+            obj_id,
+            joinedload(self.model.invoice).joinedload(Invoice.vendor),
+            joinedload(self.model.bank_transaction),
+            *loader_options,
         )
-        return self.session.scalars(statement).all()
+
+    def bulk_create(self, rows: Sequence[dict[str, Any]]) -> list[RowMapping]:
+        """Insert ``rows`` in one batched statement and return them as ``READ_COLUMNS`` mappings.
+
+        Column defaults such as ``id`` and ``created_at`` are filled in
+        client-side, and results come back in the order of ``rows``.
+        """
+
+        if not rows:
+            return []
+        statement = insert(self.model).returning(*READ_COLUMNS, sort_by_parameter_order=True)
+        return list(self.session.execute(statement, list(rows)).mappings())
 
     def clear_proposed(self, tenant: TenantContext) -> None:
-        statement: Select[tuple[MatchCandidate]] = (
-            self._base_query()
-            .where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
-            .where(self.model.status == MatchStatus.PROPOSED)  # type: ignore[attr-defined]
-        )
-        for candidate in self.session.scalars(statement).all():
-            self.session.delete(candidate)
-        self.session.flush()
+        """Delete the tenant's proposed matches in one statement.
+
+        ``synchronize_session=False`` skips scanning the identity map, so any
+        ``MatchCandidate`` already loaded in this session may be stale afterwards
+        and must not be relied on.
+        """
 
-    def reject_other_matches(self, tenant: TenantContext, invoice_id: str, exclude_match_id: str) -> None:
         statement = (
-            select(self.model)
+            delete(self.model)
             .where(self.model.tenant_id == tenant.tenant_id)
-            .where(self.model.invoice_id == invoice_id)
-            .where(self.model.id != exclude_match_id)
             .where(self.model.status == MatchStatus.PROPOSED)
+            .execution_options(synchronize_session=False)
         )
-        for candidate in self.session.scalars(statement).all():
-            candidate.status = MatchStatus.REJECTED
+        self.session.execute(statement)
 
-    def existing_pairs(self, tenant: TenantContext) -> set[tuple[str, str]]:
-        statement = (
-            select(self.model.invoice_id, self.model.bank_transaction_id)
-            .where(self.model.tenant_id == tenant.tenant_id)
-        )
-        return {(row[0], row[1]) for row in self.session.execute(statement)}
+    def confirm_exclusively(self, tenant: TenantContext, match: MatchCandidate) -> bool:
+        """Confirm ``match`` and reject its invoice's other proposals in one UPDATE.
 
-    def confirmed_invoice_ids(self, tenant: TenantContext) -> set[str]:
+        Returns ``False`` when ``match`` was no longer proposed in the database,
+        e.g. because a concurrent confirmation already rejected it; the caller
+        should roll back in that case. On success ``match`` is marked confirmed
+        in the session without another flush; other loaded candidates of the
+        invoice are stale until the commit expires them.
+        """
+
+        status_type = self.model.status.type
         statement = (
-            select(self.model.invoice_id)
+            update(self.model)
             .where(self.model.tenant_id == tenant.tenant_id)
-            .where(self.model.status == MatchStatus.CONFIRMED)
+            .where(self.model.invoice_id == match.invoice_id)
+            .where(self.model.status == MatchStatus.PROPOSED)
+            .values(
+                # Cast so PostgreSQL assigns the CASE result to the enum column
+                # rather than rejecting it as text.
+                status=cast(
+                    case(
+                        (self.model.id == match.id, literal(MatchStatus.CONFIRMED, status_type)),
+                        else_=literal(MatchStatus.REJECTED, status_type),
+                    ),
+                    status_type,
+                )
+            )
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
         )
-        return {row[0] for row in self.session.execute(statement)}
+        if match.id not in set(self.session.scalars(statement)):
+            return False
+        set_committed_value(match, "status", MatchStatus.CONFIRMED)
+        return True
 
-    def confirmed_transaction_ids(self, tenant: TenantContext) -> set[str]:
-        statement = (
-            select(self.model.bank_transaction_id)
-            .where(self.model.tenant_id == tenant.tenant_id)
-            .where(self.model.status == MatchStatus.CONFIRMED)
+    def reconciliation_state(self, tenant: TenantContext) -> ReconciliationState:
+        """Read confirmed ids and settled pairs from a single scan of the tenant's matches.
+
+        Proposed matches are left out of ``settled_pairs``: reconcile deletes
+        them before inserting the new proposals, so they may be proposed again.
+        """
+
+        tenant_id = tenant.tenant_id
+        statement: StatementLambdaElement = lambda_stmt(
+            lambda: select(
+                MatchCandidate.invoice_id, MatchCandidate.bank_transaction_id, MatchCandidate.status
+            ).where(MatchCandidate.tenant_id == tenant_id)
+        )
+        invoice_ids: set[str] = set()
+        transaction_ids: set[str] = set()
+        grouped: dict[str, set[str]] = defaultdict(set)
+        for invoice_id, transaction_id, status in self.session.execute(statement):
+            if status == MatchStatus.PROPOSED:
+                continue
+            grouped[invoice_id].add(transaction_id)
+            if status == MatchStatus.CONFIRMED:
+                invoice_ids.add(invoice_id)
+                transaction_ids.add(transaction_id)
+        return ReconciliationState(
+            invoice_ids,
+            transaction_ids,
+            {invoice_id: frozenset(ids) for invoice_id, ids in grouped.items()},
         )
-        return {row[0] for row in self.session.execute(statement)}
 
     def get_by_invoice_transaction(
         self,
@@ -72,22 +164,44 @@ class MatchRepository(TenantScopedRepository[MatchCandidate]):
         invoice_id: str,
         bank_transaction_id: str,
     ) -> MatchCandidate | None:
-        statement: Select[tuple[MatchCandidate]] = (
-            self._base_query()
-            .where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
-            .where(self.model.invoice_id == invoice_id)  # type: ignore[attr-defined]
-            .where(self.model.bank_transaction_id == bank_transaction_id)  # type: ignore[attr-defined]
+        tenant_id = tenant.tenant_id
+        statement: StatementLambdaElement = lambda_stmt(
+            lambda: select(MatchCandidate)
+            .where(MatchCandidate.tenant_id == tenant_id)
+            .where(MatchCandidate.invoice_id == invoice_id)
+            .where(MatchCandidate.bank_transaction_id == bank_transaction_id)
         )
         return self.session.scalar(statement)
 
-    def list_for_tenant_with_status(
-        self, tenant: TenantContext, status: MatchStatus | None = None
-    ) -> list[MatchCandidate]:
-        statement: Select[tuple[MatchCandidate]] = (
-            self._base_query().where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
+    def list_for_tenant_with_status_rows(
+        self,
+        tenant: TenantContext,
+        status: MatchStatus | None = None,
+        limit: int | None = None,
+    ) -> Sequence[RowMapping]:
+        """List matches best-scored first, as ``READ_COLUMNS`` mappings.
+
+        The ordering matches ``ix_match_tenant_status_score``.
+        """
+
+        statement = self._with_status(select(*READ_COLUMNS), tenant, status, limit)
+        return self.session.execute(statement).mappings().all()
+
+    def _with_status(
+        self,
+        statement: Select[Any],
+        tenant: TenantContext,
+        status: MatchStatus | None,
+        limit: int | None,
+    ) -> Select[Any]:
+        statement = (
+            statement.where(self.model.tenant_id == tenant.tenant_id)  # type: ignore[attr-defined]
+            .order_by(self.model.score.desc(), self.model.id)  # type: ignore[attr-defined]
         )
         if status is None:
             statement = statement.where(self.model.status != MatchStatus.REJECTED)  # type: ignore[attr-defined]
         else:
             statement = statement.where(self.model.status == status)  # type: ignore[attr-defined]
-        return self.session.scalars(statement).all()
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
@@ -0,0 +1,67 @@
+"""Repository for the per-tenant reconcile state row."""
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Row, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.core.tenant import TenantContext
+from app.db.models import TenantReconcileState
+
+from .base import Repository
+
+
+class ReconcileStateRepository(Repository[TenantReconcileState]):
+    """Track when a tenant's reconcile inputs change and cache the result per version."""
+
+    model = TenantReconcileState
+
+    def current(self, tenant: TenantContext) -> Row[tuple[int, int | None, dict | None]] | None:
+        """Return ``(version, reconciled_version, response_body)``, or ``None`` before the first run."""
+
+        statement = select(
+            self.model.version, self.model.reconciled_version, self.model.response_body
+        ).where(self.model.tenant_id == tenant.tenant_id)
+        return self.session.execute(statement).one_or_none()
+
+    def bump(self, tenant: TenantContext) -> None:
+        """Mark the tenant's reconcile inputs as changed.
+
+        Call in the same transaction as the write. Tenants that were never
+        reconciled have no row and nothing cached, so there is nothing to bump.
+        """
+
+        statement = (
+            update(self.model)
+            .where(self.model.tenant_id == tenant.tenant_id)
+            .values(version=self.model.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        self.session.execute(statement)
+
+    def store(self, tenant: TenantContext, version: int | None, response_body: dict[str, Any]) -> None:
+        """Cache ``response_body`` as the result for ``version`` read before the run.
+
+        The UPDATE only matches while ``version`` is unchanged, so a write that
+        committed during the run leaves the result uncached. A first run
+        (``version`` is ``None``) only creates the row: a concurrent write had
+        no row to bump, so its result cannot be trusted either.
+        """
+
+        if version is None:
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(insert(self.model).values(tenant_id=tenant.tenant_id, version=0))
+            except IntegrityError:
+                # Another first run created the row.
+                pass
+            return
+        statement = (
+            update(self.model)
+            .where(self.model.tenant_id == tenant.tenant_id)
+            .where(self.model.version == version)
+            .values(reconciled_version=version, response_body=response_body)
+            .execution_options(synchronize_session=False)
+        )
+        self.session.execute(statement)
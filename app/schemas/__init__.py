@@ -1,4 +1,6 @@
 """Pydantic schemas exposed by the API layer."""
+from pydantic import TypeAdapter
+
 from .tenant import TenantCreate, TenantRead
 from .invoice import (
     InvoiceCreate,
@@ -10,6 +12,7 @@ from .bank_transaction import (
     BankTransactionImportItem,
     BankTransactionImportRequest,
     BankTransactionImportResponse,
+    BankTransactionPage,
     BankTransactionRead,
 )
 from .match import (
@@ -17,8 +20,19 @@ from .match import (
     ReconciliationResponse,
     MatchConfirmationResponse,
     AIExplanationResponse,
+    AIExplanationBatchRequest,
+    AIExplanationBatchResponse,
+    ExplanationJobAccepted,
+    ExplanationJobStatus,
 )
 
+# Built once: validating or dumping a whole page through one adapter avoids
+# per-row model setup.
+TENANT_READ_LIST: TypeAdapter[list[TenantRead]] = TypeAdapter(list[TenantRead])
+BANK_TRANSACTION_READ_LIST: TypeAdapter[list[BankTransactionRead]] = TypeAdapter(list[BankTransactionRead])
+INVOICE_READ_LIST: TypeAdapter[list[InvoiceRead]] = TypeAdapter(list[InvoiceRead])
+MATCH_CANDIDATE_READ_LIST: TypeAdapter[list[MatchCandidateRead]] = TypeAdapter(list[MatchCandidateRead])
+
 __all__ = [
     "TenantCreate",
     "TenantRead",
@@ -30,8 +44,17 @@ __all__ = [
     "BankTransactionImportRequest",
     "BankTransactionRead",
     "BankTransactionImportResponse",
+    "BankTransactionPage",
     "MatchCandidateRead",
     "ReconciliationResponse",
     "MatchConfirmationResponse",
     "AIExplanationResponse",
+    "AIExplanationBatchRequest",
+    "AIExplanationBatchResponse",
+    "ExplanationJobAccepted",
+    "ExplanationJobStatus",
+    "TENANT_READ_LIST",
+    "BANK_TRANSACTION_READ_LIST",
+    "INVOICE_READ_LIST",
+    "MATCH_CANDIDATE_READ_LIST",
 ]
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from datetime import datetime
+from decimal import Decimal
 
-from pydantic import BaseModel, Field, PositiveFloat, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class BankTransactionRead(BaseModel):
@@ -22,8 +23,7 @@ class BankTransactionRead(BaseModel):
     def _serialize_datetime(self, value: datetime) -> str:
         return value.isoformat()
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class BankTransactionImportItem(BaseModel):
@@ -31,7 +31,8 @@ class BankTransactionImportItem(BaseModel):
 
     external_id: str | None = Field(default=None, max_length=128)
     posted_at: datetime
-    amount: PositiveFloat
+    # Parsed straight to Decimal and bounded to the Numeric(18, 2) column.
+    amount: Decimal = Field(gt=0, max_digits=18, decimal_places=2)
     currency: str = Field(default="USD", min_length=3, max_length=3)
     description: str | None = Field(default=None, max_length=500)
 
@@ -49,3 +50,10 @@ class BankTransactionImportResponse(BaseModel):
     duplicates: int
     conflicts: int
     transactions: list[BankTransactionRead]
+
+
+class BankTransactionPage(BaseModel):
+    """One keyset page of bank transactions ordered by posting time."""
+
+    items: list[BankTransactionRead]
+    next_cursor: str | None = None
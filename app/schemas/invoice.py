@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from pydantic import BaseModel, Field, PositiveFloat, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PositiveFloat, field_validator
 
 from app.db.models import InvoiceStatus
 
@@ -38,8 +38,7 @@ class InvoiceRead(BaseModel):
     status: InvoiceStatus
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore", use_enum_values=True)
 
 
 class InvoiceFilterParams(BaseModel):
@@ -51,6 +50,13 @@ class InvoiceFilterParams(BaseModel):
     end_date: date | None = None
     min_amount: float | None = Field(default=None, ge=0)
     max_amount: float | None = Field(default=None, ge=0)
+    cursor: str | None = Field(
+        default=None,
+        description=(
+            "Opaque ``next_cursor`` from a previous page (empty for the first keyset page);"
+            " supersedes ``offset``."
+        ),
+    )
 
 
 class InvoiceListResponse(BaseModel):
@@ -58,3 +64,4 @@ class InvoiceListResponse(BaseModel):
 
     items: list[InvoiceRead]
     total: int
+    next_cursor: str | None = None
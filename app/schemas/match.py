@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
@@ -19,7 +20,7 @@ class MatchCandidateRead(BaseModel):
     reasoning: str | None = None
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore", use_enum_values=True)
 
     @field_serializer("created_at")
     def _serialize_created_at(self, value: datetime) -> str:
@@ -56,6 +57,32 @@ class AIExplanationResponse(BaseModel):
         return stripped
 
 
+class AIExplanationBatchRequest(BaseModel):
+    """Match identifiers to explain in a single request."""
+
+    match_ids: list[str] = Field(min_length=1, max_length=100)
+
+
+class AIExplanationBatchResponse(BaseModel):
+    """Explanations returned in the same order as the requested matches."""
+
+    explanations: list[AIExplanationResponse]
+
+
+class ExplanationJobAccepted(BaseModel):
+    """Acknowledgement for an explanation queued in the background."""
+
+    job_id: str
+
+
+class ExplanationJobStatus(BaseModel):
+    """Progress of a background explanation job."""
+
+    job_id: str
+    status: Literal["pending", "completed", "failed"]
+    result: AIExplanationResponse | None = None
+
+
 def _isoformat_z(value: datetime) -> str:
     iso = value.isoformat()
     if iso.endswith("+00:00"):
@@ -1,25 +1,44 @@
 """Service handling bank transaction import and retrieval."""
 from __future__ import annotations
 
-from decimal import Decimal
+from datetime import datetime
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.ids import new_id
 from app.core.tenant import TenantContext
-from app.db.models import BankTransaction, IdempotencyKey
+from app.db.models import IdempotencyKey, to_minor_units
 from app.repositories.bank_transaction import BankTransactionRepository
 from app.repositories.idempotency import IdempotencyRepository
+from app.repositories.reconcile_state import ReconcileStateRepository
+from app.schemas import BANK_TRANSACTION_READ_LIST
 from app.schemas.bank_transaction import (
     BankTransactionImportItem,
     BankTransactionImportRequest,
     BankTransactionImportResponse,
+    BankTransactionPage,
     BankTransactionRead,
 )
-from app.utils.hash import stable_hash
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.hash import STABLE_HASH_BYTES_PREFIX, stable_hash, stable_hash_bytes
 
 from .exceptions import ConflictError, ValidationError
 
+IMPORT_REPLAY_TTL_SECONDS = 600.0
+IMPORT_REPLAY_CACHE_SIZE = 10_000
+
+# Tenant-namespaced, keyed by (endpoint, idempotency key, payload hash), so a
+# retried import is answered without touching the database.
+_import_replay_cache = TTLCache(ttl=IMPORT_REPLAY_TTL_SECONDS, maxsize=IMPORT_REPLAY_CACHE_SIZE)
+
+
+def forget_import_replays(tenant_id: str | None = None) -> None:
+    """Forget cached import responses for a tenant, or for every tenant."""
+
+    _import_replay_cache.clear(tenant_id)
+
 
 class BankTransactionService:
     """Coordinate tenant-scoped bank transaction operations."""
@@ -31,6 +50,7 @@ class BankTransactionService:
         self.tenant = tenant
         self.transactions = BankTransactionRepository(session)
         self.idempotency = IdempotencyRepository(session)
+        self.reconcile_states = ReconcileStateRepository(session)
 
     def import_transactions(
         self,
@@ -40,42 +60,56 @@ class BankTransactionService:
         if idempotency_key is None:
             raise ValidationError("Idempotency-Key header is required for imports")
 
-        payload_hash = stable_hash([item.model_dump() for item in payload.transactions])
-        existing = self.idempotency.get_key(self.tenant, self.IDEMPOTENCY_ENDPOINT, idempotency_key)
-        if existing:
-            if existing.payload_hash != payload_hash:
-                raise ConflictError("Idempotency key re-used with different payload")
-            return self._deserialize_response(existing)
-
-        external_map = self.transactions.get_by_external_ids(
-            self.tenant, (item.external_id for item in payload.transactions)
+        # Serialized in one pydantic-core pass instead of building a dict per row.
+        payload_hash = stable_hash_bytes(payload.model_dump_json().encode("utf-8"))
+        replay_key = (self.IDEMPOTENCY_ENDPOINT, idempotency_key, payload_hash)
+        cached = _import_replay_cache.get(self.tenant.tenant_id, replay_key)
+        if cached is not None:
+            return cached
+
+        external_ids = [self._normalize_external_id(item.external_id) for item in payload.transactions]
+        present_ids = [external_id for external_id in external_ids if external_id is not None]
+        preflight = self.transactions.preflight_import(
+            self.tenant,
+            self.IDEMPOTENCY_ENDPOINT,
+            idempotency_key,
+            present_ids,
         )
-
-        seen_external_ids: set[str] = set()
-        created_entities: list[BankTransaction] = []
-        duplicates = 0
-
-        for item in payload.transactions:
-            normalized_id = self._normalize_external_id(item.external_id)
-            duplicate_reason = self._duplicate_reason(normalized_id, external_map, seen_external_ids)
-            if duplicate_reason == "payload":
-                raise ConflictError("Duplicate external IDs found within import payload")
-            if duplicate_reason == "existing":
-                duplicates += 1
-                continue
-            created_entities.append(self._build_entity(item, normalized_id))
-
-        self.session.add_all(created_entities)
+        if preflight.idempotency_id is not None:
+            if not self._same_payload(preflight.payload_hash, payload_hash, payload):
+                raise ConflictError("Idempotency key re-used with different payload")
+            record = self.idempotency.get(preflight.idempotency_id)
+            if record is None:
+                # Deleted between the preflight and this read; re-importing could
+                # duplicate rows without external ids, so ask the client to retry.
+                raise ConflictError("Idempotency record changed during import; retry the request")
+            response = self._deserialize_response(record)
+            _import_replay_cache.set(self.tenant.tenant_id, replay_key, response)
+            return response
+
+        unique_ids = set(present_ids)
+        if len(unique_ids) != len(present_ids):
+            raise ConflictError("Duplicate external IDs found within import payload")
+        already_imported = unique_ids & preflight.existing.keys()
+
+        rows = [
+            self._build_row(item, external_id)
+            for item, external_id in zip(payload.transactions, external_ids)
+            if external_id not in already_imported
+        ]
+        duplicates = len(already_imported)
 
         try:
-            self.session.flush()
-            for entity in created_entities:
-                self.session.refresh(entity)
+            inserted = {created["id"]: created for created in self.transactions.bulk_create(rows)}
+            # Rows inserted concurrently since the preflight lose the conflict and
+            # are reported as duplicates rather than failing the whole import.
+            duplicates += len(rows) - len(inserted)
+            created_rows = [inserted[row["id"]] for row in rows if row["id"] in inserted]
             response = BankTransactionImportResponse(
-                created=len(created_entities),
+                created=len(created_rows),
                 duplicates=duplicates,
                 conflicts=0,
-                transactions=[self._serialize_entity(entity) for entity in created_entities],
+                transactions=BANK_TRANSACTION_READ_LIST.validate_python(created_rows),
             )
 
             serialized_response = response.model_dump(mode="json")
@@ -89,13 +123,29 @@ class BankTransactionService:
                 response_body=serialized_response,
             )
             self.session.add(record)
+            if created_rows:
+                self.reconcile_states.bump(self.tenant)
             self.session.commit()
         except IntegrityError as exc:
             self.session.rollback()
             raise ConflictError("Failed to import transactions due to database constraint") from exc
 
+        _import_replay_cache.set(self.tenant.tenant_id, replay_key, response)
         return response
 
+    @staticmethod
+    def _same_payload(
+        stored_hash: str | None, payload_hash: str, payload: BankTransactionImportRequest
+    ) -> bool:
+        """Compare against a stored hash, which may predate the ``v2:`` scheme."""
+
+        if stored_hash is None or stored_hash.startswith(STABLE_HASH_BYTES_PREFIX):
+            return stored_hash == payload_hash
+        # Legacy hashes were taken while amounts were still floats.
+        return stored_hash == stable_hash(
+            [item.model_dump() | {"amount": float(item.amount)} for item in payload.transactions]
+        )
+
     @staticmethod
     def _normalize_external_id(external_id: str | None) -> str | None:
         if external_id is None:
@@ -103,39 +153,22 @@ class BankTransactionService:
         trimmed = external_id.strip()
         return trimmed or None
 
-    def _build_entity(
+    def _build_row(
         self,
         item: BankTransactionImportItem,
         external_id: str | None,
-    ) -> BankTransaction:
-        entity = BankTransaction(
-            tenant_id=self.tenant.tenant_id,
-            external_id=external_id,
-            posted_at=item.posted_at,
-            amount=Decimal(str(item.amount)),
-            currency=item.currency.upper(),
-            description=item.description,
-        )
-        return entity
-
-    @staticmethod
-    def _duplicate_reason(
-        external_id: str | None,
-        existing_ids: dict[str, BankTransaction],
-        seen_external_ids: set[str],
-    ) -> str | None:
-        if external_id is None:
-            return None
-        if external_id in seen_external_ids:
-            return "payload"
-        if external_id in existing_ids:
-            return "existing"
-        seen_external_ids.add(external_id)
-        return None
-
-    @staticmethod
-    def _serialize_entity(entity: BankTransaction) -> BankTransactionRead:
-        return BankTransactionRead.model_validate(entity)
+    ) -> dict[str, object]:
+        amount = item.amount
+        return {
+            "id": new_id(),
+            "tenant_id": self.tenant.tenant_id,
+            "external_id": external_id,
+            "posted_at": item.posted_at,
+            "amount": amount,
+            "amount_minor": to_minor_units(amount),
+            "currency": item.currency.upper(),
+            "description": item.description,
+        }
 
     def _deserialize_response(self, record: IdempotencyKey) -> BankTransactionImportResponse:
         body = record.response_body or {}
@@ -146,5 +179,28 @@ class BankTransactionService:
         offset: int = 0,
         limit: int = 100,
     ) -> list[BankTransactionRead]:
-        rows = self.transactions.list_for_tenant(self.tenant, offset=offset, limit=limit)
-        return [BankTransactionRead.model_validate(row) for row in rows]
+        rows = self.transactions.list_for_tenant_rows(self.tenant, offset=offset, limit=limit)
+        return BANK_TRANSACTION_READ_LIST.validate_python(rows)
+
+    def list_transactions_page(self, after: str | None = None, limit: int = 100) -> BankTransactionPage:
+        """Return the page after the ``after`` cursor, with a cursor for the next one."""
+
+        after_posted_at: datetime | None = None
+        after_id: str | None = None
+        if after is not None:
+            try:
+                after_posted_at, after_id = decode_cursor(after)
+            except ValueError as exc:
+                raise ValidationError(str(exc)) from exc
+
+        rows = self.transactions.list_for_tenant_rows(
+            self.tenant, limit=limit + 1, after_id=after_id, after_posted_at=after_posted_at
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["posted_at"], rows[-1]["id"])
+        return BankTransactionPage(
+            items=BANK_TRANSACTION_READ_LIST.validate_python(rows),
+            next_cursor=next_cursor,
+        )
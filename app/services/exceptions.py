@@ -16,3 +16,7 @@ class ConflictError(ServiceError):
 
 class ValidationError(ServiceError):
     """Raised when business validation fails."""
+
+
+class CapacityError(ServiceError):
+    """Raised when a bounded in-process resource is full."""
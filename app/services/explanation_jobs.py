@@ -0,0 +1,53 @@
+"""In-process registry for background explanation jobs.
+
+Jobs live in the memory of the process that accepted them, so a poll routed to
+another worker answers 404. Run the API with a single worker (or sticky
+routing) when relying on background explanations.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Coroutine
+from typing import Any
+from uuid import uuid4
+
+from app.schemas.match import AIExplanationResponse
+
+from .exceptions import CapacityError
+
+
+class ExplanationJobStore:
+    """Track explanation tasks per tenant so results can be polled later.
+
+    At most ``max_jobs`` are held; finished jobs are evicted oldest first to
+    make room, and a submission that still finds the store full is rejected.
+    """
+
+    def __init__(self, max_jobs: int = 1024) -> None:
+        self.max_jobs = max_jobs
+        self._jobs: OrderedDict[tuple[str, str], asyncio.Task[AIExplanationResponse]] = OrderedDict()
+
+    def submit(self, tenant_id: str, work: Coroutine[Any, Any, AIExplanationResponse]) -> str:
+        """Schedule ``work`` on the running loop and return its job id."""
+
+        self._evict_finished()
+        if len(self._jobs) >= self.max_jobs:
+            work.close()
+            raise CapacityError("Too many explanation jobs in progress; retry later")
+        job_id = str(uuid4())
+        self._jobs[(tenant_id, job_id)] = asyncio.ensure_future(work)
+        return job_id
+
+    def get(self, tenant_id: str, job_id: str) -> asyncio.Task[AIExplanationResponse] | None:
+        return self._jobs.get((tenant_id, job_id))
+
+    def _evict_finished(self) -> None:
+        overflow = len(self._jobs) - self.max_jobs + 1
+        if overflow <= 0:
+            return
+        for key in [key for key, task in self._jobs.items() if task.done()][:overflow]:
+            del self._jobs[key]
+
+
+explanation_jobs = ExplanationJobStore()
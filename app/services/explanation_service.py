@@ -1,7 +1,9 @@
 """Service responsible for explaining reconciliation matches."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Sequence
 
 from sqlalchemy.orm import Session
 
@@ -12,10 +14,11 @@ from app.db.models import BankTransaction, Invoice, MatchCandidate
 from app.repositories.bank_transaction import BankTransactionRepository
 from app.repositories.invoice import InvoiceRepository
 from app.repositories.match import MatchRepository
-from app.schemas.match import AIExplanationResponse
+from app.schemas.match import AIExplanationResponse, ExplanationJobStatus
 from app.services.scoring import format_reasoning, score_match
 
 from .exceptions import NotFoundError
+from .explanation_jobs import ExplanationJobStore
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,8 @@ logger = logging.getLogger(__name__)
 class ExplanationService:
     """Generate explainability output for reconciliation decisions."""
 
+    MAX_CONCURRENT_EXPLANATIONS = 10
+
     def __init__(self, session: Session, tenant: TenantContext) -> None:
         self.session = session
         self.tenant = tenant
@@ -35,6 +40,56 @@ class ExplanationService:
         self.fallback = fallback_client()
 
     def explain_match(self, match_id: str) -> AIExplanationResponse:
+        context = self.match_context(match_id)
+        return self._to_response(self._generate_explanation(context))
+
+    def explain_matches(self, match_ids: Sequence[str]) -> list[AIExplanationResponse]:
+        """Explain several matches one pair at a time."""
+
+        contexts = self.match_contexts(match_ids)
+        return [self._to_response(self._generate_explanation(context)) for context in contexts]
+
+    def explain_pair(self, invoice_id: str, bank_transaction_id: str) -> AIExplanationResponse:
+        context = self.pair_context(invoice_id, bank_transaction_id)
+        return self._to_response(self._generate_explanation(context))
+
+    async def aexplain_context(self, context: ExplanationContext) -> AIExplanationResponse:
+        """Explain an already resolved context; only the AI call is awaited."""
+
+        return self._to_response(await self._agenerate_explanation(context))
+
+    async def aexplain_contexts(self, contexts: Sequence[ExplanationContext]) -> list[AIExplanationResponse]:
+        """Explain several resolved contexts, overlapping the AI round-trips."""
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_EXPLANATIONS)
+
+        async def bounded(context: ExplanationContext) -> tuple[str, str | None]:
+            async with semaphore:
+                return await self._agenerate_explanation(context)
+
+        results = await asyncio.gather(*(bounded(context) for context in contexts))
+        return [self._to_response(result) for result in results]
+
+    def submit_job(self, jobs: ExplanationJobStore, context: ExplanationContext) -> str:
+        """Generate the explanation for a resolved context in the background."""
+
+        return jobs.submit(self.tenant.tenant_id, self.aexplain_context(context))
+
+    def job_status(self, jobs: ExplanationJobStore, job_id: str) -> ExplanationJobStatus:
+        """Return the state of a background job owned by this tenant."""
+
+        task = jobs.get(self.tenant.tenant_id, job_id)
+        if task is None:
+            raise NotFoundError("Explanation job not found")
+        if not task.done():
+            return ExplanationJobStatus(job_id=job_id, status="pending")
+        if task.cancelled() or task.exception() is not None:
+            return ExplanationJobStatus(job_id=job_id, status="failed")
+        return ExplanationJobStatus(job_id=job_id, status="completed", result=task.result())
+
+    def match_context(self, match_id: str) -> ExplanationContext:
+        """Load a match and its pair into an explanation context (blocking DB I/O)."""
+
         match = self._get_match(match_id)
         invoice = match.invoice
         bank_transaction = match.bank_transaction
@@ -45,9 +100,14 @@ class ExplanationService:
         reasoning = match.reasoning or self._generate_reasoning(invoice, bank_transaction)
         score_value = float(match.score)
 
-        return self._explain_with_context(invoice, bank_transaction, reasoning, score_value)
+        return self._build_context(invoice, bank_transaction, reasoning, score_value)
+
+    def match_contexts(self, match_ids: Sequence[str]) -> list[ExplanationContext]:
+        return [self.match_context(match_id) for match_id in match_ids]
+
+    def pair_context(self, invoice_id: str, bank_transaction_id: str) -> ExplanationContext:
+        """Load an invoice/transaction pair into an explanation context (blocking DB I/O)."""
 
-    def explain_pair(self, invoice_id: str, bank_transaction_id: str) -> AIExplanationResponse:
         invoice = self._get_invoice(invoice_id)
         bank_transaction = self._get_transaction(bank_transaction_id)
 
@@ -63,7 +123,7 @@ class ExplanationService:
             reasoning = format_reasoning(match_score)
             score_value = float(match_score.total)
 
-        return self._explain_with_context(invoice, bank_transaction, reasoning, score_value)
+        return self._build_context(invoice, bank_transaction, reasoning, score_value)
 
     def _get_match(self, match_id: str) -> MatchCandidate:
         match = self.matches.get_for_tenant(self.tenant, match_id)
@@ -86,20 +146,20 @@ class ExplanationService:
     def _generate_reasoning(self, invoice: Invoice, bank_transaction: BankTransaction) -> str:
         return format_reasoning(score_match(invoice, bank_transaction))
 
-    def _explain_with_context(
+    def _build_context(
         self,
         invoice: Invoice,
         bank_transaction: BankTransaction,
         reasoning: str,
         score_value: float,
-    ) -> AIExplanationResponse:
-        context = ExplanationContext(
-            invoice_amount=float(invoice.amount),
+    ) -> ExplanationContext:
+        return ExplanationContext(
+            invoice_amount=invoice.amount_minor / 100,
             invoice_currency=invoice.currency,
             invoice_date=invoice.invoice_date.isoformat() if invoice.invoice_date else None,
             invoice_description=invoice.description,
             vendor_name=getattr(getattr(invoice, "vendor", None), "name", None),
-            transaction_amount=float(bank_transaction.amount),
+            transaction_amount=bank_transaction.amount_minor / 100,
             transaction_currency=bank_transaction.currency,
             transaction_date=bank_transaction.posted_at.isoformat(),
             transaction_description=bank_transaction.description,
@@ -107,8 +167,9 @@ class ExplanationService:
             reasoning=reasoning,
         )
 
-        explanation, confidence = self._generate_explanation(context)
-
+    @staticmethod
+    def _to_response(result: tuple[str, str | None]) -> AIExplanationResponse:
+        explanation, confidence = result
         return AIExplanationResponse(explanation=explanation, confidence=confidence)
 
     def _generate_explanation(self, context: ExplanationContext) -> tuple[str, str | None]:
@@ -120,3 +181,13 @@ class ExplanationService:
         except Exception as exc:  # pragma: no cover - defensive fallback
             logger.exception("AI explanation failed; falling back: %s", exc)
             return self.fallback.explain(context)
+
+    async def _agenerate_explanation(self, context: ExplanationContext) -> tuple[str, str | None]:
+        if self.ai_client is None:
+            return await self.fallback.aexplain(context)
+
+        try:
+            return await self.ai_client.aexplain(context)
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            logger.exception("AI explanation failed; falling back: %s", exc)
+            return await self.fallback.aexplain(context)
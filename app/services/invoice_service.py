@@ -5,17 +5,29 @@ from decimal import Decimal
 
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
 from app.core.tenant import TenantContext
 from app.db.models import InvoiceStatus
 from app.repositories.invoice import InvoiceRepository
+from app.repositories.reconcile_state import ReconcileStateRepository
+from app.schemas import INVOICE_READ_LIST
 from app.schemas.invoice import (
     InvoiceCreate,
     InvoiceFilterParams,
     InvoiceListResponse,
     InvoiceRead,
 )
+from app.utils.cursor import decode_date_cursor, encode_date_cursor
 
-from .exceptions import NotFoundError
+from .exceptions import NotFoundError, ValidationError
+
+_invoice_list_cache = TTLCache()
+
+
+def invalidate_invoice_lists(tenant_id: str | None = None) -> None:
+    """Forget cached invoice pages for a tenant, or for every tenant."""
+
+    _invoice_list_cache.clear(tenant_id)
 
 
 class InvoiceService:
@@ -25,6 +37,7 @@ class InvoiceService:
         self.session = session
         self.tenant = tenant
         self.invoices = InvoiceRepository(session)
+        self.reconcile_states = ReconcileStateRepository(session)
 
     def create(self, payload: InvoiceCreate) -> InvoiceRead:
         invoice = self.invoices.model(
@@ -38,8 +51,10 @@ class InvoiceService:
             status=InvoiceStatus.OPEN,
         )
         self.session.add(invoice)
+        self.reconcile_states.bump(self.tenant)
         self.session.commit()
         self.session.refresh(invoice)
+        invalidate_invoice_lists(self.tenant.tenant_id)
         return InvoiceRead.model_validate(invoice)
 
     def list(
@@ -48,7 +63,24 @@ class InvoiceService:
         offset: int = 0,
         limit: int = 100,
     ) -> InvoiceListResponse:
-        statement = self.invoices.build_filter_query(
+        """List invoices, serving identical repeat queries from a short-lived cache.
+
+        With ``filters.cursor`` set the page is found by keyset seek and
+        ``offset`` is ignored; ``offset`` paging is kept for existing clients
+        but is deprecated, since deep offsets rescan every skipped row.
+        """
+
+        cache_key = (tuple(filters.model_dump().items()), offset, limit)
+        cached = _invoice_list_cache.get(self.tenant.tenant_id, cache_key)
+        if cached is not None:
+            return cached
+
+        if filters.cursor is not None:
+            response = self._list_keyset(filters, limit)
+            _invoice_list_cache.set(self.tenant.tenant_id, cache_key, response)
+            return response
+
+        rows, total = self.invoices.list_filtered_with_total(
             tenant=self.tenant,
             status=filters.status,
             vendor_id=filters.vendor_id,
@@ -59,19 +91,31 @@ class InvoiceService:
             offset=offset,
             limit=limit,
         )
-        rows = self.session.scalars(statement).all()
-        total = self.invoices.count_filtered(
-            tenant=self.tenant,
-            status=filters.status,
-            vendor_id=filters.vendor_id,
-            start_date=filters.start_date,
-            end_date=filters.end_date,
-            min_amount=filters.min_amount,
-            max_amount=filters.max_amount,
+        response = InvoiceListResponse(
+            items=INVOICE_READ_LIST.validate_python(rows, from_attributes=True),
+            total=total,
+        )
+        _invoice_list_cache.set(self.tenant.tenant_id, cache_key, response)
+        return response
+
+    def _list_keyset(self, filters: InvoiceFilterParams, limit: int) -> InvoiceListResponse:
+        try:
+            after = decode_date_cursor(filters.cursor) if filters.cursor else None
+        except ValueError as exc:
+            raise ValidationError(str(exc)) from exc
+
+        criteria = filters.model_dump(exclude={"cursor"})
+        rows, total = self.invoices.list_filtered_keyset_with_total(
+            self.tenant, **criteria, after=after, limit=limit + 1
         )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_date_cursor(rows[-1].invoice_date, rows[-1].id)
         return InvoiceListResponse(
-            items=[InvoiceRead.model_validate(row) for row in rows],
+            items=INVOICE_READ_LIST.validate_python(rows, from_attributes=True),
             total=total,
+            next_cursor=next_cursor,
         )
 
     def delete(self, invoice_id: str) -> None:
@@ -79,4 +123,6 @@ class InvoiceService:
         if invoice is None:
             raise NotFoundError("Invoice not found")
         self.session.delete(invoice)
+        self.reconcile_states.bump(self.tenant)
         self.session.commit()
+        invalidate_invoice_lists(self.tenant.tenant_id)
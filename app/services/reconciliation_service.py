@@ -1,19 +1,163 @@
 """Reconciliation service implementing deterministic matching logic."""
 from __future__ import annotations
 
+import heapq
+import multiprocessing
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from decimal import Decimal
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.core.settings import get_settings
 from app.core.tenant import TenantContext
-from app.db.models import MatchCandidate, MatchStatus, InvoiceStatus
+from app.db.models import BankTransaction, Invoice, InvoiceStatus, MatchStatus
 from app.repositories.bank_transaction import BankTransactionRepository
 from app.repositories.invoice import InvoiceRepository
 from app.repositories.match import MatchRepository
-from app.schemas.match import MatchCandidateRead, MatchConfirmationResponse, ReconciliationResponse
-from app.services.scoring import format_reasoning, score_match
+from app.repositories.reconcile_state import ReconcileStateRepository
+from app.schemas import MATCH_CANDIDATE_READ_LIST
+from app.schemas.match import (
+    MatchCandidateRead,
+    MatchConfirmationResponse,
+    ReconciliationResponse,
+)
+from app.services.scoring import (
+    AMOUNT_TOLERANCE_MINOR,
+    InvoiceFeatures,
+    TransactionFeatures,
+    format_reasoning,
+    score_features,
+    score_match,
+)
 
 from .exceptions import ConflictError, NotFoundError
+from .invoice_service import invalidate_invoice_lists
+
+_NO_PAIRS: frozenset[int] = frozenset()
+
+SCORING_BATCH_SIZE = 500
+# Batches queued per scoring worker; bounds how many streamed invoices are held.
+_BATCHES_IN_FLIGHT_PER_WORKER = 2
+
+# (invoice id, its features, index positions of transactions it is already paired with)
+_ScoringJob = tuple[str, InvoiceFeatures, frozenset[int]]
+# (score, invoice id, position in the transaction index)
+_ScoredPair = tuple[float, str, int]
+
+
+@dataclass(slots=True, frozen=True)
+class _TransactionIndex:
+    """Scoring features of the eligible transactions, with positions ordered by amount."""
+
+    ids: tuple[str, ...]
+    features: tuple[TransactionFeatures, ...]
+    by_amount: tuple[int, ...]
+    sorted_amounts: tuple[int, ...]
+
+    def positions_of(self, pairs: Mapping[str, frozenset[str]]) -> dict[str, frozenset[int]]:
+        """Translate each invoice's paired transaction ids into index positions.
+
+        Done once per run so the per-pair check probes a small int set rather
+        than hashing UUID strings; transactions outside the index are dropped.
+        """
+
+        position_by_id = {transaction_id: position for position, transaction_id in enumerate(self.ids)}
+        translated: dict[str, frozenset[int]] = {}
+        for invoice_id, transaction_ids in pairs.items():
+            positions = frozenset(
+                position_by_id[transaction_id]
+                for transaction_id in transaction_ids
+                if transaction_id in position_by_id
+            )
+            if positions:
+                translated[invoice_id] = positions
+        return translated
+
+    @classmethod
+    def build(cls, transactions: Sequence[BankTransaction]) -> _TransactionIndex:
+        features = tuple(TransactionFeatures.from_transaction(transaction) for transaction in transactions)
+        by_amount = tuple(sorted(range(len(features)), key=lambda position: features[position].amount_minor))
+        return cls(
+            ids=tuple(transaction.id for transaction in transactions),
+            features=features,
+            by_amount=by_amount,
+            sorted_amounts=tuple(features[position].amount_minor for position in by_amount),
+        )
+
+
+def _score_invoices(
+    jobs: Sequence[_ScoringJob], index: _TransactionIndex, threshold: float, limit: int
+) -> list[_ScoredPair]:
+    """Return each invoice's top ``limit`` pairs scoring at least ``threshold``.
+
+    Pairs further apart than the amount tolerance score zero, so each invoice
+    only scores the transactions in its amount window, found by bisecting the
+    amounts in sorted order; no wider fallback window is needed because
+    nothing outside it can reach any threshold. Window positions are visited
+    in the original transaction order to keep tie-breaking unchanged. Takes
+    and returns plain data so it can run in a scoring worker process.
+    """
+
+    scored: list[_ScoredPair] = []
+    for invoice_id, features, already_paired in jobs:
+        low = bisect_left(index.sorted_amounts, features.amount_minor - AMOUNT_TOLERANCE_MINOR)
+        high = bisect_right(index.sorted_amounts, features.amount_minor + AMOUNT_TOLERANCE_MINOR)
+        if low == high:
+            continue
+        per_invoice: list[_ScoredPair] = []
+        for position in sorted(index.by_amount[low:high]):
+            if position in already_paired:
+                continue
+            total = score_features(features, index.features[position], minimum=threshold)
+            if total >= threshold:
+                per_invoice.append((total, invoice_id, position))
+        scored.extend(heapq.nlargest(limit, per_invoice, key=itemgetter(0)))
+    return scored
+
+
+# Set once in each scoring worker by ``_init_scoring_worker``, so submitted
+# batches carry only their invoices rather than another copy of the index.
+_worker_scoring: tuple[_TransactionIndex, float, int] | None = None
+
+
+def _init_scoring_worker(index: _TransactionIndex, threshold: float, limit: int) -> None:
+    global _worker_scoring
+    _worker_scoring = (index, threshold, limit)
+
+
+def _score_in_worker(jobs: Sequence[_ScoringJob]) -> list[_ScoredPair]:
+    """Score ``jobs`` against the index this worker was initialised with."""
+
+    assert _worker_scoring is not None, "scoring worker was not initialised"
+    return _score_invoices(jobs, *_worker_scoring)
+
+
+def _scoring_executor(
+    index: _TransactionIndex, threshold: float, limit: int
+) -> tuple[ProcessPoolExecutor, int] | None:
+    """Start a scoring pool for one run and return it with its size, or ``None`` when disabled.
+
+    Each worker receives ``index`` once, through its initializer.
+    """
+
+    workers = get_settings().reconcile_workers
+    if workers == 0:
+        return None
+    # Spawned workers avoid forking a process that is running threads.
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_scoring_worker,
+        initargs=(index, threshold, limit),
+    )
+    return pool, workers
 
 
 class ReconciliationService:
@@ -28,111 +172,159 @@ class ReconciliationService:
         self.invoices = InvoiceRepository(session)
         self.transactions = BankTransactionRepository(session)
         self.matches = MatchRepository(session)
+        self.reconcile_states = ReconcileStateRepository(session)
 
     def reconcile(self) -> ReconciliationResponse:
-        """Run deterministic reconciliation and return proposed matches."""
+        """Run deterministic reconciliation and return proposed matches.
 
-        open_invoices = self.invoices.list_open_invoices(self.tenant)
-        candidate_transactions = self.transactions.list_for_invoice_matching(self.tenant)
+        While no invoice, transaction or match write has bumped the tenant's
+        reconcile state since the last run, that run's response is returned
+        without reading or rewriting any matches.
+        """
+
+        cached = self.reconcile_states.current(self.tenant)
+        if cached is not None and cached.reconciled_version == cached.version:
+            return ReconciliationResponse.model_validate(cached.response_body)
 
-        if not open_invoices or not candidate_transactions:
+        response = self._reconcile()
+        version = None if cached is None else cached.version
+        self.reconcile_states.store(self.tenant, version, response.model_dump(mode="json"))
+        self.session.commit()
+        return response
+
+    def _reconcile(self) -> ReconciliationResponse:
+        # Transactions are scanned once per invoice, so they are held in memory;
+        # invoices are streamed and each is visited exactly once.
+        candidate_transactions = self.transactions.list_for_invoice_matching(self.tenant)
+        if not candidate_transactions:
             return self._clear_and_return_empty()
+        open_invoices = self.invoices.list_open_invoices(self.tenant)
 
-        confirmed_invoice_ids = self.matches.confirmed_invoice_ids(self.tenant)
-        confirmed_transaction_ids = self.matches.confirmed_transaction_ids(self.tenant)
-        existing_pairs = self.matches.existing_pairs(self.tenant)
+        state = self.matches.reconciliation_state(self.tenant)
 
         self.matches.clear_proposed(self.tenant)
 
-        proposed_entities = self._build_proposed_entities(
+        proposed_rows = self._build_proposed_rows(
             open_invoices,
             candidate_transactions,
-            confirmed_invoice_ids,
-            confirmed_transaction_ids,
-            existing_pairs,
+            state.confirmed_invoice_ids,
+            state.confirmed_transaction_ids,
+            state.settled_pairs,
         )
 
-        if not proposed_entities:
-            self.session.commit()
-            return ReconciliationResponse(matches=[])
-
-        for entity in proposed_entities:
-            self.session.add(entity)
-        self.session.commit()
-        for entity in proposed_entities:
-            self.session.refresh(entity)
-
-        return ReconciliationResponse(
-            matches=[MatchCandidateRead.model_validate(candidate) for candidate in proposed_entities]
-        )
+        # One batched INSERT ... RETURNING in the same transaction as the
+        # clear; the returned rows are the response, so nothing is re-read.
+        created = self.matches.bulk_create(proposed_rows)
+        return ReconciliationResponse(matches=MATCH_CANDIDATE_READ_LIST.validate_python(created))
 
     def _clear_and_return_empty(self) -> ReconciliationResponse:
         self.matches.clear_proposed(self.tenant)
-        self.session.commit()
         return ReconciliationResponse(matches=[])
 
-    def _build_proposed_entities(
+    def _build_proposed_rows(
         self,
-        invoices,
-        transactions,
+        invoices: Iterable[Invoice],
+        transactions: Sequence[BankTransaction],
         confirmed_invoice_ids: set[str],
         confirmed_transaction_ids: set[str],
-        existing_pairs: set[tuple[str, str]],
-    ) -> list[MatchCandidate]:
-        candidate_pool: list[tuple[float, MatchCandidate]] = []
-
-        for invoice in invoices:
-            if invoice.id in confirmed_invoice_ids:
-                continue
-
-            per_invoice_candidates: list[tuple[float, MatchCandidate]] = []
-            for transaction in transactions:
-                if transaction.id in confirmed_transaction_ids:
-                    continue
-                if (invoice.id, transaction.id) in existing_pairs:
-                    continue
-
-                match_score = score_match(invoice, transaction)
-                if match_score.total < self.SCORE_THRESHOLD:
-                    continue
-
-                candidate = MatchCandidate(
-                    tenant_id=self.tenant.tenant_id,
-                    invoice_id=invoice.id,
-                    bank_transaction_id=transaction.id,
-                    score=Decimal(str(match_score.total)),
-                    status=MatchStatus.PROPOSED,
-                    reasoning=format_reasoning(match_score),
-                )
-                per_invoice_candidates.append((match_score.total, candidate))
-
-            if per_invoice_candidates:
-                per_invoice_candidates.sort(key=lambda item: item[0], reverse=True)
-                candidate_pool.extend(per_invoice_candidates[: self.CANDIDATES_PER_INVOICE])
+        existing_pairs: Mapping[str, frozenset[str]],
+    ) -> list[dict[str, Any]]:
+        eligible = [
+            transaction for transaction in transactions if transaction.id not in confirmed_transaction_ids
+        ]
+        index = _TransactionIndex.build(eligible)
+        candidate_pool: list[tuple[float, Invoice, BankTransaction]] = []
+        for batch, scored in self._score_batches(invoices, index, confirmed_invoice_ids, existing_pairs):
+            candidate_pool.extend(
+                (total, batch[invoice_id], eligible[position]) for total, invoice_id, position in scored
+            )
 
         if not candidate_pool:
             return []
 
-        sorted_pool = sorted(candidate_pool, key=lambda item: item[0], reverse=True)
-        used_transactions = set(confirmed_transaction_ids)
-        per_invoice_counts: dict[str, int] = {}
-        selected: list[MatchCandidate] = []
-
-        for score_value, candidate in sorted_pool:
-            invoice_id = candidate.invoice_id
-            txn_id = candidate.bank_transaction_id
-
+        # Greedy assignment: best scores first, each transaction proposed once.
+        # Only the survivors are turned into insert rows, and only they pay for
+        # the component breakdown behind the reasoning text. The pool already
+        # holds at most CANDIDATES_PER_INVOICE entries per invoice and no
+        # confirmed transactions, so neither needs re-checking here.
+        candidate_pool.sort(key=itemgetter(0), reverse=True)
+        used_transactions: set[str] = set()
+        selected: list[dict[str, Any]] = []
+
+        for score_value, invoice, transaction in candidate_pool:
+            txn_id = transaction.id
             if txn_id in used_transactions:
                 continue
-            if per_invoice_counts.get(invoice_id, 0) >= self.CANDIDATES_PER_INVOICE:
-                continue
 
-            selected.append(candidate)
+            selected.append(
+                {
+                    "tenant_id": self.tenant.tenant_id,
+                    "invoice_id": invoice.id,
+                    "bank_transaction_id": txn_id,
+                    "score": Decimal(str(score_value)),
+                    "status": MatchStatus.PROPOSED,
+                    "reasoning": format_reasoning(score_match(invoice, transaction)),
+                }
+            )
             used_transactions.add(txn_id)
-            per_invoice_counts[invoice_id] = per_invoice_counts.get(invoice_id, 0) + 1
 
         return selected
 
+    def _score_batches(
+        self,
+        invoices: Iterable[Invoice],
+        index: _TransactionIndex,
+        confirmed_invoice_ids: set[str],
+        existing_pairs: Mapping[str, frozenset[str]],
+    ) -> Iterator[tuple[dict[str, Invoice], list[_ScoredPair]]]:
+        """Score streamed invoices batch by batch, in stream order.
+
+        With ``reconcile_workers`` configured and more than one batch, batches
+        are scored in a process pool started for this run, with a bounded
+        number in flight; otherwise inline.
+        """
+
+        paired_positions = index.positions_of(existing_pairs)
+
+        def batches() -> Iterator[tuple[dict[str, Invoice], list[_ScoringJob]]]:
+            pending = (invoice for invoice in invoices if invoice.id not in confirmed_invoice_ids)
+            while batch := list(islice(pending, SCORING_BATCH_SIZE)):
+                yield (
+                    {invoice.id: invoice for invoice in batch},
+                    [
+                        (
+                            invoice.id,
+                            InvoiceFeatures.from_invoice(invoice),
+                            paired_positions.get(invoice.id, _NO_PAIRS),
+                        )
+                        for invoice in batch
+                    ],
+                )
+
+        arguments = (index, self.SCORE_THRESHOLD, self.CANDIDATES_PER_INVOICE)
+        pending = batches()
+        # A single batch is scored inline: starting workers would cost more than it saves.
+        head = list(islice(pending, 2))
+        executor = _scoring_executor(*arguments) if len(head) > 1 else None
+        if executor is None:
+            for by_id, jobs in chain(head, pending):
+                yield by_id, _score_invoices(jobs, *arguments)
+            return
+
+        pool, workers = executor
+        try:
+            in_flight: deque[tuple[dict[str, Invoice], Future[list[_ScoredPair]]]] = deque()
+            for by_id, jobs in chain(head, pending):
+                in_flight.append((by_id, pool.submit(_score_in_worker, jobs)))
+                if len(in_flight) >= workers * _BATCHES_IN_FLIGHT_PER_WORKER:
+                    done_by_id, future = in_flight.popleft()
+                    yield done_by_id, future.result()
+            while in_flight:
+                done_by_id, future = in_flight.popleft()
+                yield done_by_id, future.result()
+        finally:
+            pool.shutdown(cancel_futures=True)
+
     def confirm_match(self, match_id: str) -> MatchConfirmationResponse:
         """Confirm a proposed match, updating invoice state and rejecting others."""
 
@@ -142,21 +334,25 @@ class ReconciliationService:
         if match.status != MatchStatus.PROPOSED:
             raise ConflictError("Only proposed matches can be confirmed")
 
-        match.status = MatchStatus.CONFIRMED
+        if not self.matches.confirm_exclusively(self.tenant, match):
+            self.session.rollback()
+            raise ConflictError("Only proposed matches can be confirmed")
         invoice = match.invoice
         invoice.status = InvoiceStatus.MATCHED
+        self.reconcile_states.bump(self.tenant)
 
-        self.matches.reject_other_matches(self.tenant, match.invoice_id, match.id)
-
-        self.session.commit()
-        self.session.refresh(match)
-        self.session.refresh(invoice)
-
-        return MatchConfirmationResponse(
+        # Everything the response needs is already loaded; building it before
+        # the commit avoids refreshing both rows afterwards.
+        response = MatchConfirmationResponse(
             match=MatchCandidateRead.model_validate(match),
             invoice_status=invoice.status.value,
         )
-
-    def list_matches(self, status: MatchStatus | None = None) -> list[MatchCandidateRead]:
-        rows = self.matches.list_for_tenant_with_status(self.tenant, status=status)
-        return [MatchCandidateRead.model_validate(row) for row in rows]
+        self.session.commit()
+        invalidate_invoice_lists(self.tenant.tenant_id)
+        return response
+
+    def list_matches(
+        self, status: MatchStatus | None = None, limit: int | None = None
+    ) -> list[MatchCandidateRead]:
+        rows = self.matches.list_for_tenant_with_status_rows(self.tenant, status=status, limit=limit)
+        return MATCH_CANDIDATE_READ_LIST.validate_python(rows)
@@ -5,8 +5,12 @@ from dataclasses import dataclass
 from datetime import date
 from difflib import SequenceMatcher
 from decimal import Decimal
+from functools import lru_cache
 
-from app.db.models import BankTransaction, Invoice
+from app.db.models import BankTransaction, Invoice, to_minor_units
+
+# Pairs whose amounts differ by more than this (in cents) always score zero.
+AMOUNT_TOLERANCE_MINOR = 100
 
 
 @dataclass(slots=True)
@@ -20,8 +24,11 @@ class ScoreComponent:
 
     @property
     def contribution(self) -> float:
-        normalized = max(0.0, min(self.achieved, 1.0))
-        return self.weight * normalized
+        return _weighted(self.weight, self.achieved)
+
+
+def _weighted(weight: float, achieved: float) -> float:
+    return weight * max(0.0, min(achieved, 1.0))
 
 
 @dataclass(slots=True)
@@ -44,77 +51,134 @@ class MatchScore:
         return "; ".join(parts)
 
 
+def _amount_minor(entity: Invoice | BankTransaction) -> int:
+    minor = getattr(entity, "amount_minor", None)
+    if minor is None:
+        return to_minor_units(getattr(entity, "amount", Decimal("0")))
+    return minor
+
+
+_EXACT_WEIGHT = 0.5
+_TOLERANCE_WEIGHT = 0.2
+_DATE_WEIGHT = 0.2
+_DESCRIPTION_WEIGHT = 0.1
+_VENDOR_WEIGHT = 0.05
+
+
+def _exact_amount_achieved(amount_diff: float) -> float:
+    return 1.0 if amount_diff <= 0.01 else 0.0
+
+
+def _tolerance_achieved(amount_diff: float) -> float:
+    return max(0.0, 1.0 - amount_diff) if amount_diff <= 1.0 else 0.0
+
+
+def _date_achieved(invoice_date: date | None, posted_at: date) -> tuple[float, int | None]:
+    if invoice_date is None:
+        return 0.3, None
+    days = abs((posted_at - invoice_date).days)
+    if days <= 3:
+        return 1.0, days
+    if days <= 7:
+        return 0.5, days
+    return 0.0, days
+
+
+def _lower(text: str | None) -> str | None:
+    return text.lower() if text else text
+
+
+@lru_cache(maxsize=100_000)
+def _text_similarity(invoice_description: str, txn_description: str) -> float:
+    """Ratcliff/Obershelp ratio of two lowercased strings, memoised across pairs.
+
+    One reconcile run compares each invoice description with many memos and
+    the same memos recur across invoices. The memo is keyed on content and
+    outlives the run, so a repeat reconcile only compares text it has not seen;
+    edited descriptions simply miss. The arguments are not swapped into a
+    canonical order because ``ratio()`` is not symmetric.
+    """
+
+    return SequenceMatcher(None, invoice_description, txn_description).ratio()
+
+
+def _description_achieved(invoice_lower: str | None, txn_lower: str | None) -> float:
+    if not invoice_lower or not txn_lower:
+        return 0.3 if invoice_lower or txn_lower else 0.0
+    return _text_similarity(invoice_lower, txn_lower)
+
+
+def _vendor_achieved(vendor_lower: str | None, txn_lower: str | None) -> float:
+    """Substring check on text the features already lowercased once per entity."""
+
+    if not vendor_lower:
+        return 0.0
+    if not txn_lower:
+        return 0.2
+    return 1.0 if vendor_lower in txn_lower else 0.0
+
+
 def _exact_amount_component(amount_diff: float) -> ScoreComponent:
-    achieved = 1.0 if amount_diff <= 0.01 else 0.0
+    achieved = _exact_amount_achieved(amount_diff)
     detail = "Exact amount match" if achieved else f"Amount diff ${amount_diff:.2f}"
-    return ScoreComponent(name="amount_exact", weight=0.5, achieved=achieved, detail=detail)
+    return ScoreComponent(name="amount_exact", weight=_EXACT_WEIGHT, achieved=achieved, detail=detail)
 
 
 def _tolerance_component(amount_diff: float) -> ScoreComponent:
+    achieved = _tolerance_achieved(amount_diff)
     if amount_diff <= 1.0:
-        achieved = max(0.0, 1.0 - amount_diff)
         detail = f"Within $1 tolerance (difference ${amount_diff:.2f})"
     else:
-        achieved = 0.0
         detail = f"Outside $1 tolerance (difference ${amount_diff:.2f})"
-    return ScoreComponent(name="amount_tolerance", weight=0.2, achieved=achieved, detail=detail)
+    return ScoreComponent(name="amount_tolerance", weight=_TOLERANCE_WEIGHT, achieved=achieved, detail=detail)
 
 
 def _date_component(invoice_date: date | None, posted_at: date) -> ScoreComponent:
-    if invoice_date is None:
-        return ScoreComponent(
-            name="date",
-            weight=0.2,
-            achieved=0.3,
-            detail="Invoice date missing; partial credit",
-        )
-    days = abs((posted_at - invoice_date).days)
-    if days <= 3:
-        achieved = 1.0
+    achieved, days = _date_achieved(invoice_date, posted_at)
+    if days is None:
+        detail = "Invoice date missing; partial credit"
+    elif days <= 3:
         detail = "Transaction within ±3 days"
     elif days <= 7:
-        achieved = 0.5
         detail = f"Transaction within ±7 days ({days} days apart)"
     else:
-        achieved = 0.0
         detail = f"Transaction {days} days apart"
-    return ScoreComponent(name="date", weight=0.2, achieved=achieved, detail=detail)
+    return ScoreComponent(name="date", weight=_DATE_WEIGHT, achieved=achieved, detail=detail)
 
 
 def _description_component(invoice_description: str | None, txn_description: str | None) -> ScoreComponent:
+    achieved = _description_achieved(_lower(invoice_description), _lower(txn_description))
     if not invoice_description or not txn_description:
-        return ScoreComponent(
-            name="description",
-            weight=0.1,
-            achieved=0.3 if invoice_description or txn_description else 0.0,
-            detail="Limited description data",
-        )
-    ratio = SequenceMatcher(None, invoice_description.lower(), txn_description.lower()).ratio()
-    detail = f"Text similarity {ratio:.2f}"
-    return ScoreComponent(name="description", weight=0.1, achieved=ratio, detail=detail)
+        detail = "Limited description data"
+    else:
+        detail = f"Text similarity {achieved:.2f}"
+    return ScoreComponent(name="description", weight=_DESCRIPTION_WEIGHT, achieved=achieved, detail=detail)
 
 
 def _vendor_component(vendor_name: str | None, txn_description: str | None) -> ScoreComponent:
+    achieved = _vendor_achieved(_lower(vendor_name), _lower(txn_description))
     if not vendor_name:
-        return ScoreComponent(name="vendor_boost", weight=0.05, achieved=0.0, detail="No vendor specified")
-    if not txn_description:
-        return ScoreComponent(
-            name="vendor_boost",
-            weight=0.05,
-            achieved=0.2,
-            detail="Vendor known but transaction lacks memo",
-        )
-    achieved = 1.0 if vendor_name.lower() in txn_description.lower() else 0.0
-    detail = "Vendor name present in transaction memo" if achieved else "Vendor not referenced in memo"
-    return ScoreComponent(name="vendor_boost", weight=0.05, achieved=achieved, detail=detail)
+        detail = "No vendor specified"
+    elif not txn_description:
+        detail = "Vendor known but transaction lacks memo"
+    elif achieved:
+        detail = "Vendor name present in transaction memo"
+    else:
+        detail = "Vendor not referenced in memo"
+    return ScoreComponent(name="vendor_boost", weight=_VENDOR_WEIGHT, achieved=achieved, detail=detail)
+
+
+def _finalize_total(total: float, amount_diff_minor: int) -> float:
+    if amount_diff_minor > AMOUNT_TOLERANCE_MINOR:
+        return 0.0
+    return round(min(total, 1.0), 4)
 
 
 def score_match(invoice: Invoice, transaction: BankTransaction) -> MatchScore:
     """Compute heuristic score for an invoice/transaction pair."""
 
-    invoice_amount = getattr(invoice, "amount", Decimal("0"))
-    txn_amount = getattr(transaction, "amount", Decimal("0"))
-    amount_diff = abs(float(invoice_amount) - float(txn_amount))
+    amount_diff_minor = abs(_amount_minor(invoice) - _amount_minor(transaction))
+    amount_diff = amount_diff_minor / 100
     components: list[ScoreComponent] = [
         _exact_amount_component(amount_diff),
         _tolerance_component(amount_diff),
@@ -126,11 +190,79 @@ def score_match(invoice: Invoice, transaction: BankTransaction) -> MatchScore:
     components.append(_vendor_component(vendor_name, transaction.description))
 
     total = sum(component.contribution for component in components)
-    if amount_diff > 1.0:
-        total = 0.0
+    return MatchScore(total=_finalize_total(total, amount_diff_minor), components=components)
+
+
+@dataclass(slots=True, frozen=True)
+class InvoiceFeatures:
+    """The parts of an invoice that scoring reads, with text already lowercased."""
+
+    amount_minor: int
+    invoice_date: date | None
+    description: str | None
+    vendor_name: str | None
+
+    @classmethod
+    def from_invoice(cls, invoice: Invoice) -> InvoiceFeatures:
+        return cls(
+            amount_minor=_amount_minor(invoice),
+            invoice_date=invoice.invoice_date,
+            description=_lower(invoice.description),
+            vendor_name=_lower(getattr(getattr(invoice, "vendor", None), "name", None)),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionFeatures:
+    """The parts of a bank transaction that scoring reads, with text already lowercased."""
+
+    amount_minor: int
+    posted_on: date
+    description: str | None
+
+    @classmethod
+    def from_transaction(cls, transaction: BankTransaction) -> TransactionFeatures:
+        return cls(
+            amount_minor=_amount_minor(transaction),
+            posted_on=transaction.posted_at.date(),
+            description=_lower(transaction.description),
+        )
+
+
+def score_features(
+    invoice: InvoiceFeatures, transaction: TransactionFeatures, minimum: float | None = None
+) -> float:
+    """Return the :func:`score_match` total for pre-extracted features.
+
+    Reconciliation extracts features once per invoice and per transaction, so
+    the pairwise loop does no attribute loading or lowercasing, and builds no
+    components; reasoning is rendered with :func:`score_match` for the few
+    pairs that are kept.
+
+    With ``minimum`` set, a pair that cannot reach it even with a perfect
+    description match scores ``0.0`` without running the text comparison.
+    """
+
+    amount_diff_minor = abs(invoice.amount_minor - transaction.amount_minor)
+    if amount_diff_minor > AMOUNT_TOLERANCE_MINOR:
+        return 0.0
+    # Every achieved value already lies in [0, 1], so the weighted terms are
+    # plain products; the terms and their summation order match score_match,
+    # so the totals agree to the last bit.
+    exact = _EXACT_WEIGHT if amount_diff_minor <= 1 else 0.0
+    tolerance = _TOLERANCE_WEIGHT * (1.0 - amount_diff_minor / 100)
+    if invoice.invoice_date is None:
+        dated = _DATE_WEIGHT * 0.3
     else:
-        total = round(min(total, 1.0), 4)
-    return MatchScore(total=total, components=components)
+        days = abs((transaction.posted_on - invoice.invoice_date).days)
+        dated = _DATE_WEIGHT if days <= 3 else _DATE_WEIGHT * 0.5 if days <= 7 else 0.0
+    vendor = _VENDOR_WEIGHT * _vendor_achieved(invoice.vendor_name, transaction.description)
+    if minimum is not None and exact + tolerance + dated + vendor + _DESCRIPTION_WEIGHT < minimum - 1e-9:
+        return 0.0
+    description = _DESCRIPTION_WEIGHT * _description_achieved(invoice.description, transaction.description)
+    # sum() rather than chained +: it compensates rounding on 3.12+, as in score_match.
+    total = sum((exact, tolerance, dated, description, vendor))
+    return round(min(total, 1.0), 4)
 
 
 def format_reasoning(match_score: MatchScore) -> str:
@@ -4,11 +4,22 @@ from __future__ import annotations
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.tenant import invalidate_tenant_context
 from app.repositories.tenant import TenantRepository
+from app.schemas import TENANT_READ_LIST
 from app.schemas.tenant import TenantCreate, TenantRead
 
 from .exceptions import ConflictError, NotFoundError
 
+_tenant_list_cache = TTLCache()
+
+
+def invalidate_tenant_list() -> None:
+    """Forget the cached tenant listing."""
+
+    _tenant_list_cache.clear()
+
 
 class TenantService:
     """Service responsible for tenant lifecycle actions."""
@@ -26,11 +37,17 @@ class TenantService:
             self.session.rollback()
             raise ConflictError("Tenant name already exists") from exc
         self.session.refresh(tenant)
+        invalidate_tenant_context(tenant.id)
+        invalidate_tenant_list()
         return TenantRead.model_validate(tenant)
 
     def list(self) -> list[TenantRead]:
-        results = self.tenants.list()
-        return [TenantRead.model_validate(row) for row in results]
+        cached = _tenant_list_cache.get("tenants", "all")
+        if cached is not None:
+            return list(cached)
+        results = TENANT_READ_LIST.validate_python(self.tenants.list())
+        _tenant_list_cache.set("tenants", "all", results)
+        return list(results)
 
     def get(self, tenant_id: str) -> TenantRead:
         tenant = self.tenants.get(tenant_id)
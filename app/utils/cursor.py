@@ -0,0 +1,48 @@
+"""Opaque cursor helpers for keyset pagination."""
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import date, datetime
+
+
+def encode_cursor(posted_at: datetime, row_id: str) -> str:
+    """Encode a ``(posted_at, id)`` keyset position as an opaque token."""
+
+    raw = f"{posted_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a token produced by :func:`encode_cursor`.
+
+    Raises ``ValueError`` when the token is malformed.
+    """
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        posted_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(posted_at), row_id
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Malformed pagination cursor") from exc
+
+
+def encode_date_cursor(value: date | None, row_id: str) -> str:
+    """Encode a ``(date, id)`` keyset position whose date may be ``NULL``."""
+
+    raw = f"{value.isoformat() if value is not None else ''}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_date_cursor(cursor: str) -> tuple[date | None, str]:
+    """Decode a token produced by :func:`encode_date_cursor`.
+
+    Raises ``ValueError`` when the token is malformed.
+    """
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        value, row_id = raw.split("|", 1)
+        return (date.fromisoformat(value) if value else None), row_id
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Malformed pagination cursor") from exc
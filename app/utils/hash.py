@@ -1,13 +1,32 @@
 """Hashing utilities for deterministic idempotency."""
 from __future__ import annotations
 
-import json
 import hashlib
+import json
 from typing import Any
 
 
 def stable_hash(data: Any) -> str:
-    """Return a SHA-256 hash for the provided data structure."""
+    """Return a SHA-256 hash for the provided data structure.
+
+    Kept only to verify digests stored before :func:`stable_hash_bytes`; its
+    output must not change, so the serializer (ASCII-escaped stdlib JSON,
+    ``default=str``) and hash stay as they are. New hashes should use
+    :func:`stable_hash_bytes` over already-serialized bytes.
+    """
 
     serialized = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
     return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+STABLE_HASH_BYTES_PREFIX = "v2:"
+
+
+def stable_hash_bytes(data: bytes) -> str:
+    """Return a versioned 128-bit BLAKE2b digest of already-serialized bytes.
+
+    The ``v2:`` prefix keeps these digests distinguishable from
+    :func:`stable_hash` values stored before the scheme changed.
+    """
+
+    return STABLE_HASH_BYTES_PREFIX + hashlib.blake2b(data, digest_size=16).hexdigest()
@@ -1,20 +1,61 @@
 """Unit tests for app.ai provider utilities."""
 from __future__ import annotations
 
+import dataclasses
 import importlib
+import json
+from collections.abc import AsyncIterator, Iterator
 from typing import Any, Dict, List
 
 import pytest
 
 from app.ai.provider import (
     DeterministicFallbackClient,
+    ExplanationCache,
     ExplanationContext,
     OpenAIClient,
+    _band,
+    _render_fallback,
+    _render_user_prompt,
+    _stream_delta,
+    close_ai_clients,
     fallback_client,
     resolve_ai_client,
 )
 
 
+class DummyStreamResponse:
+    """Server-sent event stream split into two content deltas."""
+
+    def __init__(self, content: str) -> None:
+        middle = len(content) // 2
+        chunks = [{"role": "assistant"}, {"content": content[:middle]}, {"content": content[middle:]}]
+        self.lines = [f"data: {json.dumps({'choices': [{'delta': chunk}]})}" for chunk in chunks]
+        self.lines += ["", "data: [DONE]"]
+
+    def __enter__(self) -> "DummyStreamResponse":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def __aenter__(self) -> "DummyStreamResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:  # pragma: no cover - trivial
+        return None
+
+    def iter_lines(self) -> Iterator[str]:
+        yield from self.lines
+
+    async def aiter_lines(self) -> AsyncIterator[str]:
+        for line in self.lines:
+            yield line
+
+
 def make_context(**overrides: Any) -> ExplanationContext:
     data: Dict[str, Any] = {
         "invoice_amount": 200.0,
@@ -33,6 +74,16 @@ def make_context(**overrides: Any) -> ExplanationContext:
     return ExplanationContext(**data)
 
 
+def test_explanation_context_is_immutable_and_hashable() -> None:
+    context = make_context()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        context.score = 0.1  # type: ignore[misc]
+
+    assert hash(context) == hash(make_context())
+    assert dataclasses.replace(context, score=0.9).score == 0.9
+
+
 def test_ai_module_docstring_present() -> None:
     module = importlib.import_module("app.ai")
     assert module.__doc__ is not None
@@ -51,12 +102,26 @@ def test_resolve_ai_client_with_key_returns_openai_client() -> None:
     assert client.timeout == pytest.approx(8.0)
 
 
-def test_fallback_client_returns_new_instances() -> None:
+@pytest.mark.asyncio
+async def test_resolve_ai_client_reuses_instance_per_credentials() -> None:
+    first = resolve_ai_client("gpt-4o-mini", "shared-token")
+    second = resolve_ai_client("gpt-4o-mini", "shared-token")
+    other = resolve_ai_client("gpt-4o", "shared-token")
+
+    assert first is second
+    assert other is not first
+
+    await close_ai_clients()
+
+    assert resolve_ai_client("gpt-4o-mini", "shared-token") is not first
+    await close_ai_clients()
+
+
+def test_fallback_client_returns_shared_instance() -> None:
     first = fallback_client()
     second = fallback_client()
     assert isinstance(first, DeterministicFallbackClient)
-    assert isinstance(second, DeterministicFallbackClient)
-    assert first is not second
+    assert first is second
 
 
 @pytest.mark.parametrize(
@@ -97,30 +162,52 @@ def test_deterministic_fallback_client_confidence_bands(
     assert explanation == template.format(reasoning="Reasoning text")
 
 
-def test_openai_client_explain_posts_payload(monkeypatch: pytest.MonkeyPatch) -> None:
-    init_kwargs: List[Dict[str, Any]] = []
-    post_calls: List[Dict[str, Any]] = []
+def test_deterministic_fallback_client_reuses_rendered_explanations() -> None:
+    _render_fallback.cache_clear()
+    client = DeterministicFallbackClient()
+
+    first, _ = client.explain(make_context(score=0.9, reasoning="Cached reasoning"))
+    second, _ = client.explain(make_context(score=0.95, reasoning="Cached reasoning"))
+
+    assert first is second
+    assert _render_fallback.cache_info().hits == 1
 
-    class DummyResponse:
-        def raise_for_status(self) -> None:  # pragma: no cover - trivial
-            return None
 
-        def json(self) -> Dict[str, Any]:
-            return {"choices": [{"message": {"content": "AI explanation"}}]}
+@pytest.mark.parametrize(
+    ("score", "expected_band"),
+    [(0.0, "low"), (0.5499, "low"), (0.55, "medium"), (0.7999, "medium"), (0.8, "high"), (1.0, "high")],
+)
+def test_band_thresholds(score: float, expected_band: str) -> None:
+    assert _band(score) == expected_band
+
+
+def test_render_user_prompt_formats_context_and_defaults() -> None:
+    context = make_context(
+        invoice_date=None,
+        vendor_name=None,
+        transaction_description=None,
+        score=0.756,
+    )
+
+    assert _render_user_prompt(context) == (
+        "Invoice amount 200.0 USD, date unknown, vendor unknown vendor. "
+        "Transaction amount 200.0 USD, date 2023-01-02. "
+        "Transaction memo n/a. "
+        "Heuristic reasoning: Amounts closely aligned. Overall score 0.76."
+    )
+
+
+def test_openai_client_explain_posts_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    init_kwargs: List[Dict[str, Any]] = []
+    stream_calls: List[Dict[str, Any]] = []
 
     class DummyClient:
         def __init__(self, *args: Any, **kwargs: Any) -> None:
             init_kwargs.append(kwargs)
 
-        def __enter__(self) -> "DummyClient":
-            return self
-
-        def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
-            return False
-
-        def post(self, url: str, json: Dict[str, Any], headers: Dict[str, str]) -> DummyResponse:
-            post_calls.append({"url": url, "json": json, "headers": headers})
-            return DummyResponse()
+        def stream(self, method: str, url: str, content: bytes, headers: Dict[str, str]) -> DummyStreamResponse:
+            stream_calls.append({"method": method, "url": url, "json": json.loads(content), "headers": headers})
+            return DummyStreamResponse("AI explanation")
 
     monkeypatch.setattr("app.ai.provider.httpx.Client", DummyClient)
 
@@ -131,16 +218,19 @@ def test_openai_client_explain_posts_payload(monkeypatch: pytest.MonkeyPatch) ->
 
     assert explanation == "AI explanation"
     assert confidence == "high"
-    assert init_kwargs == [{"timeout": 3.5}]
+    assert len(init_kwargs) == 1
+    assert init_kwargs[0]["timeout"] == 3.5
+    assert init_kwargs[0]["headers"] == {"Authorization": "Bearer secret-token"}
 
-    assert len(post_calls) == 1
-    call = post_calls[0]
+    assert len(stream_calls) == 1
+    call = stream_calls[0]
+    assert call["method"] == "POST"
     assert call["url"] == "https://api.openai.com/v1/chat/completions"
-    assert call["headers"]["Authorization"] == "Bearer secret-token"
-    assert call["headers"]["Content-Type"] == "application/json"
+    assert call["headers"] == {"Content-Type": "application/json"}
 
     payload = call["json"]
     assert payload["model"] == "gpt-4o-mini"
+    assert payload["stream"] is True
     assert payload["temperature"] == pytest.approx(0.2)
     assert payload["max_tokens"] == 200
     assert payload["messages"][0]["role"] == "system"
@@ -158,29 +248,214 @@ def test_openai_client_explain_posts_payload(monkeypatch: pytest.MonkeyPatch) ->
 def test_openai_client_confidence_levels(
     monkeypatch: pytest.MonkeyPatch, score: float, expected_band: str
 ) -> None:
-    class DummyResponse:
-        def raise_for_status(self) -> None:  # pragma: no cover - trivial
+    class DummyClient:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
             return None
 
-        def json(self) -> Dict[str, Any]:
-            return {"choices": [{"message": {"content": "Result"}}]}
+        def stream(self, method: str, url: str, content: bytes, headers: Dict[str, str]) -> DummyStreamResponse:
+            return DummyStreamResponse("Result")
+
+    monkeypatch.setattr("app.ai.provider.httpx.Client", DummyClient)
+
+    client = OpenAIClient(model="gpt-4o", api_key="token")
+    _, confidence = client.explain(make_context(score=score))
+
+    assert confidence == expected_band
+
+
+@pytest.mark.asyncio
+async def test_openai_client_reuses_http_client_and_closes(monkeypatch: pytest.MonkeyPatch) -> None:
+    instances: List["DummyClient"] = []
 
     class DummyClient:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            self.requests = 0
+            self.closed = False
+            instances.append(self)
+
+        def stream(self, method: str, url: str, content: bytes, headers: Dict[str, str]) -> DummyStreamResponse:
+            self.requests += 1
+            return DummyStreamResponse("Result")
+
+        def close(self) -> None:
+            self.closed = True
+
+    async_instances: List["DummyAsyncClient"] = []
+
+    class DummyAsyncClient:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            self.closed = False
+            async_instances.append(self)
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr("app.ai.provider.httpx.Client", DummyClient)
+    monkeypatch.setattr("app.ai.provider.httpx.AsyncClient", DummyAsyncClient)
+
+    async with OpenAIClient(model="gpt-4o", api_key="token") as client:
+        client.explain(make_context(reasoning="First"))
+        client.explain(make_context(reasoning="Second"))
+
+    assert len(instances) == 1
+    assert instances[0].requests == 2
+    assert instances[0].closed is True
+    assert [instance.closed for instance in async_instances] == [True]
+
+
+@pytest.mark.asyncio
+async def test_openai_client_aexplain_uses_async_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    stream_calls: List[Dict[str, Any]] = []
+
+    class DummyAsyncClient:
         def __init__(self, *args: Any, **kwargs: Any) -> None:
             return None
 
-        def __enter__(self) -> "DummyClient":
-            return self
+        def stream(self, method: str, url: str, content: bytes, headers: Dict[str, str]) -> DummyStreamResponse:
+            stream_calls.append({"url": url, "json": json.loads(content)})
+            return DummyStreamResponse("  Async explanation  ")
+
+    monkeypatch.setattr("app.ai.provider.httpx.AsyncClient", DummyAsyncClient)
+
+    client = OpenAIClient(model="gpt-4o", api_key="token")
+    explanation, confidence = await client.aexplain(make_context(score=0.6))
+
+    assert explanation == "Async explanation"
+    assert confidence == "medium"
+    assert len(stream_calls) == 1
+    assert stream_calls[0]["json"]["model"] == "gpt-4o"
+    assert stream_calls[0]["json"]["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_openai_client_falls_back_without_caching_an_empty_completion(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requests: List[str] = []
+
+    class EmptyClient:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            return None
+
+        def stream(self, method: str, url: str, content: bytes, headers: Dict[str, str]) -> DummyStreamResponse:
+            requests.append(url)
+            return DummyStreamResponse("   ")
+
+    monkeypatch.setattr("app.ai.provider.httpx.Client", EmptyClient)
+    monkeypatch.setattr("app.ai.provider.httpx.AsyncClient", EmptyClient)
+
+    client = OpenAIClient(model="gpt-4o", api_key="token")
+    context = make_context(score=0.9)
+    expected = fallback_client().explain(context)
+
+    assert client.explain(context) == expected
+    assert await client.aexplain(context) == expected
+    assert client.explain(context) == expected
+    assert len(requests) == 3
+    assert len(client.cache) == 0
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ('data: {"choices": [{"delta": {"content": "Hi"}}]}', "Hi"),
+        ('data: {"choices": [{"delta": {"role": "assistant"}}]}', ""),
+        ('data: {"choices": []}', ""),
+        ("data: [DONE]", ""),
+        (": keep-alive", ""),
+        ("", ""),
+    ],
+)
+def test_stream_delta_extracts_content(line: str, expected: str) -> None:
+    assert _stream_delta(line) == expected
+
+
+@pytest.mark.asyncio
+async def test_deterministic_fallback_client_aexplain_matches_sync() -> None:
+    client = DeterministicFallbackClient()
+    context = make_context(score=0.9)
+
+    assert await client.aexplain(context) == client.explain(context)
+
+
+def test_explanation_cache_evicts_least_recently_used() -> None:
+    cache = ExplanationCache(maxsize=2)
+    cache.set("a", "first")
+    cache.set("b", "second")
+    assert cache.get("a") == "first"
 
-        def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
-            return False
+    cache.set("c", "third")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "first"
+    assert cache.get("c") == "third"
+
+
+def test_openai_client_serves_repeated_prompts_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    post_calls: List[str] = []
+
+    class DummyClient:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            return None
 
-        def post(self, url: str, json: Dict[str, Any], headers: Dict[str, str]) -> DummyResponse:
-            return DummyResponse()
+        def stream(self, method: str, url: str, content: bytes, headers: Dict[str, str]) -> DummyStreamResponse:
+            post_calls.append(json.loads(content)["messages"][1]["content"])
+            return DummyStreamResponse("Cached result")
 
     monkeypatch.setattr("app.ai.provider.httpx.Client", DummyClient)
 
     client = OpenAIClient(model="gpt-4o", api_key="token")
-    _, confidence = client.explain(make_context(score=score))
+    first = client.explain(make_context(reasoning="Same reasoning"))
+    second = client.explain(make_context(reasoning="Same reasoning"))
+    client.explain(make_context(reasoning="Different reasoning"))
 
-    assert confidence == expected_band
+    assert first == second == ("Cached result", "medium")
+    assert len(post_calls) == 2
+    assert len(client.cache) == 2
+
+
+def test_openai_client_reuses_precomputed_headers(monkeypatch: pytest.MonkeyPatch) -> None:
+    init_headers: List[Dict[str, str]] = []
+    request_headers: List[Dict[str, str]] = []
+
+    class DummyClient:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            init_headers.append(kwargs["headers"])
+
+        def stream(self, method: str, url: str, content: bytes, headers: Dict[str, str]) -> DummyStreamResponse:
+            request_headers.append(headers)
+            return DummyStreamResponse("Result")
+
+    monkeypatch.setattr("app.ai.provider.httpx.Client", DummyClient)
+
+    client = OpenAIClient(model="gpt-4o", api_key="token")
+    client.explain(make_context(reasoning="First"))
+    client.explain(make_context(reasoning="Second"))
+
+    assert init_headers == [{"Authorization": "Bearer token"}]
+    assert len(request_headers) == 2
+    assert request_headers[0] is request_headers[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_encode_payload_matches_full_serialization(stream: bool) -> None:
+    client = OpenAIClient(model="gpt-test", api_key="key")
+    prompt = 'Memo "ACME" \\ naïve \n line'
+
+    payload = json.loads(client._encode_payload(prompt, stream=stream))
+
+    expected: dict[str, Any] = {
+        "model": "gpt-test",
+        "messages": [
+            {"role": "system", "content": "You explain invoice and bank transaction matches succinctly."},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": 0.2,
+        "max_tokens": 200,
+    }
+    if stream:
+        expected["stream"] = True
+    assert payload == expected
+    await client.aclose()
@@ -0,0 +1,37 @@
+"""Shared fixtures for REST endpoint tests."""
+from __future__ import annotations
+
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.router import router
+
+
+@pytest.fixture(scope="session")
+def api_app() -> FastAPI:
+    """The REST router mounted once; tests only swap dependency overrides."""
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    return app
+
+
+@pytest.fixture(scope="module")
+def api_client(api_app: FastAPI) -> Generator[TestClient, None, None]:
+    """One client, and one lifespan startup, per endpoint test module.
+
+    Not session-scoped: the client's portal thread must be gone before later
+    tests fork worker processes.
+    """
+
+    with TestClient(api_app) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def reset_api_overrides(api_app: FastAPI) -> Generator[None, None, None]:
+    yield
+    api_app.dependency_overrides.clear()
@@ -2,14 +2,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from collections.abc import Generator
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.api.dependencies import get_bank_transaction_service
-from app.api.endpoints.bank_transactions import router
 from app.schemas.bank_transaction import (
     BankTransactionImportRequest,
     BankTransactionImportResponse,
@@ -56,20 +54,6 @@ def _response_fixture() -> BankTransactionImportResponse:
     )
 
 
-@pytest.fixture()
-def api_app() -> Generator[FastAPI, None, None]:
-    app = FastAPI()
-    app.include_router(router, prefix="/api")
-    yield app
-    app.dependency_overrides.clear()
-
-
-@pytest.fixture()
-def api_client(api_app: FastAPI) -> Generator[TestClient, None, None]:
-    with TestClient(api_app) as client:
-        yield client
-
-
 class RecordingService:
     def __init__(self, response: BankTransactionImportResponse) -> None:
         self.response = response
@@ -11,6 +11,12 @@ from app.core.tenant import TenantContext, TenantNotFoundError
 from app.schemas.invoice import InvoiceFilterParams
 
 
+class _DummyService:
+    def __init__(self, db_session, context=None):
+        self.db_session = db_session
+        self.context = context
+
+
 def test_tenant_id_path_returns_string() -> None:
     tenant_uuid = uuid4()
 
@@ -19,6 +25,16 @@ def test_tenant_id_path_returns_string() -> None:
     assert result == str(tenant_uuid)
 
 
+def test_get_tenant_db_session_binds_tenant_and_returns_session(session, monkeypatch) -> None:
+    bound: list[tuple[object, str]] = []
+    monkeypatch.setattr(dependencies, "bind_session_tenant", lambda db_session, tenant_id: bound.append((db_session, tenant_id)))
+
+    result = dependencies.get_tenant_db_session(tenant_id="tenant-1", session=session)
+
+    assert result is session
+    assert bound == [(session, "tenant-1")]
+
+
 def test_get_tenant_context_returns_loaded_context(session, monkeypatch) -> None:
     expected = TenantContext(tenant_id="tenant-1", tenant_name="Tenant One")
 
@@ -49,84 +65,51 @@ def test_get_tenant_context_missing_tenant_raises_http_exception(session, monkey
 
 
 def test_get_tenant_service_returns_service_instance(session, monkeypatch) -> None:
-    class DummyTenantService:
-        def __init__(self, db_session):
-            self.db_session = db_session
-
-    monkeypatch.setattr(dependencies, "TenantService", DummyTenantService)
+    monkeypatch.setattr(dependencies, "TenantService", _DummyService)
 
     result = dependencies.get_tenant_service(session=session)
 
-    assert isinstance(result, DummyTenantService)
+    assert isinstance(result, _DummyService)
     assert result.db_session is session
 
 
-def test_get_invoice_service_binds_session_and_tenant(session, monkeypatch) -> None:
+@pytest.mark.parametrize(
+    ("attr", "factory"),
+    [
+        ("InvoiceService", dependencies.get_invoice_service),
+        ("BankTransactionService", dependencies.get_bank_transaction_service),
+        ("ReconciliationService", dependencies.get_reconciliation_service),
+        ("ExplanationService", dependencies.get_explanation_service),
+    ],
+)
+def test_service_factories_bind_session_and_tenant(session, monkeypatch, attr, factory) -> None:
     tenant = TenantContext(tenant_id="tenant-1", tenant_name="Tenant One")
+    monkeypatch.setattr(dependencies, attr, _DummyService)
 
-    class DummyInvoiceService:
-        def __init__(self, db_session, context):
-            self.db_session = db_session
-            self.context = context
-
-    monkeypatch.setattr(dependencies, "InvoiceService", DummyInvoiceService)
-
-    result = dependencies.get_invoice_service(tenant=tenant, session=session)
-
-    assert isinstance(result, DummyInvoiceService)
-    assert result.db_session is session
-    assert result.context is tenant
-
-
-def test_get_bank_transaction_service_binds_session_and_tenant(session, monkeypatch) -> None:
-    tenant = TenantContext(tenant_id="tenant-99", tenant_name="Tenant Ninety-Nine")
+    result = factory(services=dependencies.ServiceBundle(session, tenant))
 
-    class DummyBankTransactionService:
-        def __init__(self, db_session, context):
-            self.db_session = db_session
-            self.context = context
-
-    monkeypatch.setattr(dependencies, "BankTransactionService", DummyBankTransactionService)
-
-    result = dependencies.get_bank_transaction_service(tenant=tenant, session=session)
-
-    assert isinstance(result, DummyBankTransactionService)
+    assert isinstance(result, _DummyService)
     assert result.db_session is session
     assert result.context is tenant
 
 
-def test_get_reconciliation_service_binds_session_and_tenant(session, monkeypatch) -> None:
-    tenant = TenantContext(tenant_id="tenant-42", tenant_name="Tenant Forty-Two")
+def test_get_service_bundle_builds_services_lazily_once(session, monkeypatch) -> None:
+    tenant = TenantContext(tenant_id="tenant-5", tenant_name="Tenant Five")
+    constructed: list[object] = []
 
-    class DummyReconciliationService:
-        def __init__(self, db_session, context):
-            self.db_session = db_session
-            self.context = context
-
-    monkeypatch.setattr(dependencies, "ReconciliationService", DummyReconciliationService)
-
-    result = dependencies.get_reconciliation_service(tenant=tenant, session=session)
-
-    assert isinstance(result, DummyReconciliationService)
-    assert result.db_session is session
-    assert result.context is tenant
-
-
-def test_get_explanation_service_binds_session_and_tenant(session, monkeypatch) -> None:
-    tenant = TenantContext(tenant_id="tenant-007", tenant_name="Tenant Seven")
-
-    class DummyExplanationService:
+    class DummyInvoiceService:
         def __init__(self, db_session, context):
-            self.db_session = db_session
-            self.context = context
+            constructed.append(self)
 
-    monkeypatch.setattr(dependencies, "ExplanationService", DummyExplanationService)
+    monkeypatch.setattr(dependencies, "InvoiceService", DummyInvoiceService)
 
-    result = dependencies.get_explanation_service(tenant=tenant, session=session)
+    bundle = dependencies.get_service_bundle(tenant=tenant, session=session)
 
-    assert isinstance(result, DummyExplanationService)
-    assert result.db_session is session
-    assert result.context is tenant
+    assert bundle.session is session
+    assert bundle.tenant is tenant
+    assert constructed == []
+    assert bundle.invoices is bundle.invoices
+    assert len(constructed) == 1
 
 
 def test_get_invoice_filters_returns_identity() -> None:
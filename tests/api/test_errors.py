@@ -5,7 +5,13 @@ import pytest
 from fastapi import HTTPException, status
 
 from app.api.errors import map_service_error
-from app.services.exceptions import ConflictError, NotFoundError, ServiceError, ValidationError
+from app.services.exceptions import (
+    CapacityError,
+    ConflictError,
+    NotFoundError,
+    ServiceError,
+    ValidationError,
+)
 
 
 @pytest.mark.parametrize(
@@ -14,6 +20,7 @@ from app.services.exceptions import ConflictError, NotFoundError, ServiceError,
         (NotFoundError, "resource missing", status.HTTP_404_NOT_FOUND),
         (ConflictError, "already exists", status.HTTP_409_CONFLICT),
         (ValidationError, "invalid payload", status.HTTP_400_BAD_REQUEST),
+        (CapacityError, "queue full", status.HTTP_503_SERVICE_UNAVAILABLE),
     ],
 )
 def test_map_service_error_known_types(exc_cls, message, expected_status) -> None:
@@ -34,3 +41,13 @@ def test_map_service_error_fallback_to_internal_error() -> None:
     assert isinstance(http_exc, HTTPException)
     assert http_exc.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     assert http_exc.detail == "Internal service error"
+
+
+def test_map_service_error_uses_parent_status_for_subclasses() -> None:
+    class MissingInvoiceError(NotFoundError):
+        pass
+
+    http_exc = map_service_error(MissingInvoiceError("invoice missing"))
+
+    assert http_exc.status_code == status.HTTP_404_NOT_FOUND
+    assert http_exc.detail == "invoice missing"
@@ -1,19 +1,23 @@
 """Unit tests for reconciliation REST endpoints."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Callable
-from uuid import uuid4
 
 import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
-from app.api.dependencies import get_explanation_service, get_reconciliation_service
-from app.api.endpoints import reconciliation
+from app.api.dependencies import (
+    get_explanation_jobs,
+    get_explanation_service,
+    get_reconciliation_service,
+)
 from app.db.models import MatchStatus
 from app.schemas.match import (
     AIExplanationResponse,
+    ExplanationJobStatus,
     MatchCandidateRead,
     MatchConfirmationResponse,
     ReconciliationResponse,
@@ -22,18 +26,26 @@ from app.services.exceptions import ConflictError, NotFoundError, ServiceError
 
 
 FIXED_TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+TENANT_ID = "11111111-1111-1111-1111-111111111111"
 
 
-def _sample_match_candidate() -> MatchCandidateRead:
-    return MatchCandidateRead(
-        id="match-1",
-        invoice_id="inv-1",
-        bank_transaction_id="txn-1",
-        score=0.93,
-        status=MatchStatus.PROPOSED,
-        reasoning="High confidence",
-        created_at=FIXED_TIMESTAMP,
-    )
+SAMPLE_MATCH_CANDIDATE = MatchCandidateRead(
+    id="match-1",
+    invoice_id="inv-1",
+    bank_transaction_id="txn-1",
+    score=0.93,
+    status=MatchStatus.PROPOSED,
+    reasoning="High confidence",
+    created_at=FIXED_TIMESTAMP,
+)
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
 
 
 class StubReconciliationService:
@@ -45,10 +57,10 @@ class StubReconciliationService:
         confirm_response: MatchConfirmationResponse | None = None,
         confirm_exception: Exception | None = None,
     ) -> None:
-        self.reconcile_response = reconcile_response or ReconciliationResponse(matches=[_sample_match_candidate()])
+        self.reconcile_response = reconcile_response or ReconciliationResponse(matches=[SAMPLE_MATCH_CANDIDATE])
         self.reconcile_exception = reconcile_exception
         self.confirm_response = confirm_response or MatchConfirmationResponse(
-            match=_sample_match_candidate(),
+            match=SAMPLE_MATCH_CANDIDATE,
             invoice_status="matched",
         )
         self.confirm_exception = confirm_exception
@@ -78,55 +90,81 @@ class StubExplanationService:
         self.response = response or AIExplanationResponse(explanation="AI rationale", confidence="high")
         self.exception = exception
         self.calls: list[str] = []
+        self.context_threads: list[bool] = []
 
-    def explain_match(self, match_id: str) -> AIExplanationResponse:
+    def match_context(self, match_id: str) -> str:
         self.calls.append(match_id)
+        self.context_threads.append(_on_event_loop())
         if self.exception:
             raise self.exception
+        return match_id
+
+    def match_contexts(self, match_ids: list[str]) -> list[str]:
+        return [self.match_context(match_id) for match_id in match_ids]
+
+    async def aexplain_context(self, context: str) -> AIExplanationResponse:
         return self.response
 
+    async def aexplain_contexts(self, contexts: list[str]) -> list[AIExplanationResponse]:
+        return [self.response for _ in contexts]
+
+    def submit_job(self, jobs: object, context: str) -> str:
+        return "job-1"
+
+    def job_status(self, jobs: object, job_id: str) -> ExplanationJobStatus:
+        self.calls.append(job_id)
+        if self.exception:
+            raise self.exception
+        return ExplanationJobStatus(job_id=job_id, status="completed", result=self.response)
+
+
+ClientFactory = Callable[..., tuple[TestClient, StubExplanationService | None]]
+
+
+@pytest.fixture()
+def create_client(api_app: FastAPI, api_client: TestClient) -> ClientFactory:
+    """Point the shared client at the given stubs for one test."""
 
-def _create_client(
-    reconciliation_service: StubReconciliationService,
-    explanation_service_factory: Callable[[], StubExplanationService] | None = None,
-) -> tuple[TestClient, StubExplanationService | None]:
-    app = FastAPI()
-    app.include_router(reconciliation.router, prefix="/api")
-    app.dependency_overrides[get_reconciliation_service] = lambda: reconciliation_service
+    def _create(
+        reconciliation_service: StubReconciliationService,
+        explanation_service_factory: Callable[[], StubExplanationService] | None = None,
+    ) -> tuple[TestClient, StubExplanationService | None]:
+        api_app.dependency_overrides[get_reconciliation_service] = lambda: reconciliation_service
 
-    explanation_stub: StubExplanationService | None = None
-    if explanation_service_factory is not None:
-        explanation_stub = explanation_service_factory()
-        app.dependency_overrides[get_explanation_service] = lambda: explanation_stub
+        explanation_stub: StubExplanationService | None = None
+        if explanation_service_factory is not None:
+            explanation_stub = explanation_service_factory()
+            api_app.dependency_overrides[get_explanation_service] = lambda: explanation_stub
+            api_app.dependency_overrides[get_explanation_jobs] = lambda: object()
 
-    return TestClient(app), explanation_stub
+        return api_client, explanation_stub
 
+    return _create
 
-def test_reconcile_returns_service_response() -> None:
+
+def test_reconcile_returns_service_response(create_client: ClientFactory) -> None:
     stub = StubReconciliationService(
-        reconcile_response=ReconciliationResponse(matches=[_sample_match_candidate()])
+        reconcile_response=ReconciliationResponse(matches=[SAMPLE_MATCH_CANDIDATE])
     )
-    client, _ = _create_client(stub, explanation_service_factory=lambda: StubExplanationService())
+    client, _ = create_client(stub, explanation_service_factory=lambda: StubExplanationService())
 
-    tenant_id = str(uuid4())
-    response = client.post(f"/api/tenants/{tenant_id}/reconcile")
+    response = client.post(f"/api/tenants/{TENANT_ID}/reconcile")
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == stub.reconcile_response.model_dump()
     assert stub.reconcile_calls == 1
 
 
-def test_confirm_match_returns_confirmation_payload() -> None:
+def test_confirm_match_returns_confirmation_payload(create_client: ClientFactory) -> None:
     confirmation = MatchConfirmationResponse(
-        match=_sample_match_candidate(),
+        match=SAMPLE_MATCH_CANDIDATE,
         invoice_status="matched",
     )
     stub = StubReconciliationService(confirm_response=confirmation)
-    client, _ = _create_client(stub, explanation_service_factory=lambda: StubExplanationService())
+    client, _ = create_client(stub, explanation_service_factory=lambda: StubExplanationService())
 
-    tenant_id = str(uuid4())
     match_id = "match-123"
-    response = client.post(f"/api/tenants/{tenant_id}/matches/{match_id}/confirm")
+    response = client.post(f"/api/tenants/{TENANT_ID}/matches/{match_id}/confirm")
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == confirmation.model_dump()
@@ -141,32 +179,32 @@ def test_confirm_match_returns_confirmation_payload() -> None:
         (ServiceError("unexpected"), status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal service error"),
     ],
 )
-def test_confirm_match_maps_service_errors(exception: ServiceError, expected_status: int, expected_detail: str) -> None:
+def test_confirm_match_maps_service_errors(
+    create_client: ClientFactory, exception: ServiceError, expected_status: int, expected_detail: str
+) -> None:
     stub = StubReconciliationService(confirm_exception=exception)
-    client, _ = _create_client(stub, explanation_service_factory=lambda: StubExplanationService())
+    client, _ = create_client(stub, explanation_service_factory=lambda: StubExplanationService())
 
-    tenant_id = str(uuid4())
-    response = client.post(f"/api/tenants/{tenant_id}/matches/m-1/confirm")
+    response = client.post(f"/api/tenants/{TENANT_ID}/matches/m-1/confirm")
 
     assert response.status_code == expected_status
     assert response.json()["detail"] == expected_detail
     assert stub.confirm_calls == ["m-1"]
 
 
-def test_explain_match_returns_service_payload() -> None:
+def test_explain_match_returns_service_payload(create_client: ClientFactory) -> None:
     recon_stub = StubReconciliationService()
     explanation_stub = StubExplanationService(
         response=AIExplanationResponse(explanation="Reasoned summary", confidence="medium")
     )
 
-    client, injected_explanation = _create_client(
+    client, injected_explanation = create_client(
         recon_stub, explanation_service_factory=lambda: explanation_stub
     )
 
-    tenant_id = str(uuid4())
     match_id = "match-789"
     response = client.get(
-        f"/api/tenants/{tenant_id}/reconcile/explain",
+        f"/api/tenants/{TENANT_ID}/reconcile/explain",
         params={"match_id": match_id},
     )
 
@@ -174,6 +212,7 @@ def test_explain_match_returns_service_payload() -> None:
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == explanation_stub.response.model_dump()
     assert explanation_stub.calls == [match_id]
+    assert explanation_stub.context_threads == [False]
 
 
 @pytest.mark.parametrize(
@@ -184,17 +223,16 @@ def test_explain_match_returns_service_payload() -> None:
     ],
 )
 def test_explain_match_maps_service_errors(
-    exception: ServiceError, expected_status: int, expected_detail: str
+    create_client: ClientFactory, exception: ServiceError, expected_status: int, expected_detail: str
 ) -> None:
     recon_stub = StubReconciliationService()
-    client, explanation_stub = _create_client(
+    client, explanation_stub = create_client(
         recon_stub,
         explanation_service_factory=lambda: StubExplanationService(exception=exception),
     )
 
-    tenant_id = str(uuid4())
     response = client.get(
-        f"/api/tenants/{tenant_id}/reconcile/explain",
+        f"/api/tenants/{TENANT_ID}/reconcile/explain",
         params={"match_id": "match-404"},
     )
 
@@ -202,3 +240,97 @@ def test_explain_match_maps_service_errors(
     assert response.status_code == expected_status
     assert response.json()["detail"] == expected_detail
     assert explanation_stub.calls == ["match-404"]
+
+
+def test_explain_matches_batch_returns_ordered_explanations(create_client: ClientFactory) -> None:
+    recon_stub = StubReconciliationService()
+    client, explanation_stub = create_client(
+        recon_stub, explanation_service_factory=lambda: StubExplanationService()
+    )
+
+    response = client.post(
+        f"/api/tenants/{TENANT_ID}/reconcile/explain/batch",
+        json={"match_ids": ["m-1", "m-2"]},
+    )
+
+    assert explanation_stub is not None
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "explanations": [explanation_stub.response.model_dump(), explanation_stub.response.model_dump()]
+    }
+    assert explanation_stub.calls == ["m-1", "m-2"]
+    assert explanation_stub.context_threads == [False, False]
+
+
+def test_explain_matches_batch_maps_service_errors(create_client: ClientFactory) -> None:
+    recon_stub = StubReconciliationService()
+    client, _ = create_client(
+        recon_stub,
+        explanation_service_factory=lambda: StubExplanationService(exception=NotFoundError("Match not found")),
+    )
+
+    response = client.post(
+        f"/api/tenants/{TENANT_ID}/reconcile/explain/batch",
+        json={"match_ids": ["missing"]},
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Match not found"
+
+
+def test_submit_explanation_returns_job_id(create_client: ClientFactory) -> None:
+    recon_stub = StubReconciliationService()
+    client, explanation_stub = create_client(
+        recon_stub, explanation_service_factory=lambda: StubExplanationService()
+    )
+
+    response = client.post(
+        f"/api/tenants/{TENANT_ID}/reconcile/explain",
+        params={"match_id": "match-1"},
+    )
+
+    assert explanation_stub is not None
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json() == {"job_id": "job-1"}
+    assert explanation_stub.calls == ["match-1"]
+    assert explanation_stub.context_threads == [False]
+
+
+def test_submit_explanation_requires_identifiers(create_client: ClientFactory) -> None:
+    client, _ = create_client(
+        StubReconciliationService(), explanation_service_factory=lambda: StubExplanationService()
+    )
+
+    response = client.post(f"/api/tenants/{TENANT_ID}/reconcile/explain")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_get_explanation_job_returns_status(create_client: ClientFactory) -> None:
+    client, explanation_stub = create_client(
+        StubReconciliationService(), explanation_service_factory=lambda: StubExplanationService()
+    )
+
+    response = client.get(f"/api/tenants/{TENANT_ID}/reconcile/explain/job-1")
+
+    assert explanation_stub is not None
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "job_id": "job-1",
+        "status": "completed",
+        "result": explanation_stub.response.model_dump(),
+    }
+
+
+def test_get_explanation_job_maps_missing_job(create_client: ClientFactory) -> None:
+    client, _ = create_client(
+        StubReconciliationService(),
+        explanation_service_factory=lambda: StubExplanationService(
+            exception=NotFoundError("Explanation job not found")
+        ),
+    )
+
+    response = client.get(f"/api/tenants/{TENANT_ID}/reconcile/explain/unknown")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Explanation job not found"
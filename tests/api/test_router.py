@@ -1,25 +1,14 @@
 """Unit tests for the root API router configuration."""
 from __future__ import annotations
 
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.api.endpoints import bank_transactions, invoices, reconciliation, tenants
-from app.api.router import router
+from app.api.router import build_router, router
 
 
-def _create_test_client() -> TestClient:
-    app = FastAPI()
-    app.include_router(router, prefix="/api")
-    return TestClient(app)
-
-
-def test_health_check_returns_ok() -> None:
-    client = _create_test_client()
-    try:
-        response = client.get("/api/health")
-    finally:
-        client.close()
+def test_health_check_returns_ok(api_client: TestClient) -> None:
+    response = api_client.get("/api/health")
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
@@ -44,3 +33,9 @@ def test_router_includes_all_endpoint_modules() -> None:
     assert reconciliation.reconcile in endpoints
     assert reconciliation.confirm_match in endpoints
     assert reconciliation.explain_match in endpoints
+    assert reconciliation.explain_matches in endpoints
+
+
+def test_build_router_returns_cached_instance() -> None:
+    assert build_router() is router
+    assert build_router() is build_router()
@@ -3,27 +3,20 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from fastapi import status
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from app.api.dependencies import get_tenant_service
-from app.main import create_app
 from app.schemas.tenant import TenantCreate, TenantRead
 from app.services.exceptions import ConflictError
 
 
-def _client_with_service(service) -> TestClient:
-    app = create_app()
-    app.dependency_overrides[get_tenant_service] = lambda: service
-    try:
-        client = TestClient(app)
-    except Exception:
-        app.dependency_overrides.clear()
-        raise
-    return client
+def _client_with_service(api_app: FastAPI, api_client: TestClient, service) -> TestClient:
+    api_app.dependency_overrides[get_tenant_service] = lambda: service
+    return api_client
 
 
-def test_create_tenant_success() -> None:
+def test_create_tenant_success(api_app: FastAPI, api_client: TestClient) -> None:
     created_at = datetime.now(timezone.utc)
     expected = TenantRead(id="tenant-1", name="Acme Corp", created_at=created_at)
 
@@ -39,16 +32,12 @@ def test_create_tenant_success() -> None:
             raise AssertionError("list should not be called")
 
     service = RecordingTenantService()
-    client = _client_with_service(service)
+    client = _client_with_service(api_app, api_client, service)
 
-    try:
-        response = client.post(
-            "/api/tenants",
-            json={"name": "Acme Corp"},
-        )
-    finally:
-        client.app.dependency_overrides.clear()
-        client.close()
+    response = client.post(
+        "/api/tenants",
+        json={"name": "Acme Corp"},
+    )
 
     assert response.status_code == status.HTTP_201_CREATED
     assert response.json() == {
@@ -59,7 +48,7 @@ def test_create_tenant_success() -> None:
     assert service.received == TenantCreate(name="Acme Corp")
 
 
-def test_create_tenant_conflict_error() -> None:
+def test_create_tenant_conflict_error(api_app: FastAPI, api_client: TestClient) -> None:
     class ConflictTenantService:
         def create(self, payload: TenantCreate) -> TenantRead:  # pragma: no cover - return unused
             raise ConflictError("Tenant name already exists")
@@ -67,22 +56,18 @@ def test_create_tenant_conflict_error() -> None:
         def list(self) -> list[TenantRead]:  # pragma: no cover - not used here
             raise AssertionError("list should not be called")
 
-    client = _client_with_service(ConflictTenantService())
+    client = _client_with_service(api_app, api_client, ConflictTenantService())
 
-    try:
-        response = client.post(
-            "/api/tenants",
-            json={"name": "Existing Tenant"},
-        )
-    finally:
-        client.app.dependency_overrides.clear()
-        client.close()
+    response = client.post(
+        "/api/tenants",
+        json={"name": "Existing Tenant"},
+    )
 
     assert response.status_code == status.HTTP_409_CONFLICT
     assert response.json() == {"detail": "Tenant name already exists"}
 
 
-def test_list_tenants_success() -> None:
+def test_list_tenants_success(api_app: FastAPI, api_client: TestClient) -> None:
     created_at = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
     tenants = [
         TenantRead(id="tenant-1", name="Acme Corp", created_at=created_at),
@@ -96,13 +81,9 @@ def test_list_tenants_success() -> None:
         def list(self) -> list[TenantRead]:
             return tenants
 
-    client = _client_with_service(ListingTenantService())
+    client = _client_with_service(api_app, api_client, ListingTenantService())
 
-    try:
-        response = client.get("/api/tenants")
-    finally:
-        client.app.dependency_overrides.clear()
-        client.close()
+    response = client.get("/api/tenants")
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == [
@@ -0,0 +1,42 @@
+"""Unit tests for :mod:`app.core.cache`."""
+from __future__ import annotations
+
+import pytest
+
+from app.core import cache
+from app.core.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+
+    store = TTLCache(ttl=5.0)
+    store.set("tenant-a", "page", ["row"])
+
+    assert store.get("tenant-a", "page") == ["row"]
+    now[0] += 5.0
+    assert store.get("tenant-a", "page") is None
+
+
+def test_ttl_cache_clears_single_namespace() -> None:
+    store = TTLCache()
+    store.set("tenant-a", "page", "a")
+    store.set("tenant-b", "page", "b")
+
+    store.clear("tenant-a")
+
+    assert store.get("tenant-a", "page") is None
+    assert store.get("tenant-b", "page") == "b"
+
+    store.clear()
+    assert store.get("tenant-b", "page") is None
+
+
+def test_ttl_cache_bounds_each_namespace() -> None:
+    store = TTLCache(maxsize=2)
+    for key in ("first", "second", "third"):
+        store.set("tenant-a", key, key)
+
+    assert store.get("tenant-a", "first") is None
+    assert store.get("tenant-a", "third") == "third"
@@ -0,0 +1,32 @@
+"""Unit tests for primary key generation."""
+from __future__ import annotations
+
+import time
+import uuid
+
+from app.core.ids import new_id
+
+
+def test_new_id_is_a_version_7_uuid() -> None:
+    value = uuid.UUID(new_id())
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert len(str(value)) == 36
+
+
+def test_new_id_embeds_current_millisecond_timestamp() -> None:
+    before = time.time_ns() // 1_000_000
+    value = uuid.UUID(new_id())
+    after = time.time_ns() // 1_000_000
+
+    assert before <= value.int >> 80 <= after
+
+
+def test_new_ids_sort_by_creation_time() -> None:
+    first = new_id()
+    time.sleep(0.002)
+    second = new_id()
+
+    assert first < second
+    assert first != new_id()
@@ -1,13 +1,17 @@
 """Unit tests for tenant context utilities."""
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from sqlalchemy.orm import Session
 
 from app.core.tenant import (
+    SESSION_TENANT_KEY,
     TenantContext,
     TenantMismatchError,
     TenantNotFoundError,
+    invalidate_tenant_context,
     load_tenant_context,
 )
 from app.db.models import Tenant
@@ -47,6 +51,15 @@ def test_ensure_entity_belongs_without_tenant_attribute_raises() -> None:
         context.ensure_entity_belongs(entity)
 
 
+def test_tenant_context_is_immutable_and_hashable() -> None:
+    context = TenantContext(tenant_id="tenant-123", tenant_name="Tenant")
+
+    with pytest.raises(FrozenInstanceError):
+        context.tenant_id = "tenant-999"  # type: ignore[misc]
+    assert not hasattr(context, "__dict__")
+    assert {context: True}[TenantContext(tenant_id="tenant-123", tenant_name="Tenant")]
+
+
 def test_load_tenant_context_returns_bound_context(session: Session) -> None:
     tenant = Tenant(name="Acme Corp")
     session.add(tenant)
@@ -63,3 +76,51 @@ def test_load_tenant_context_missing_tenant_raises(session: Session) -> None:
 
     with pytest.raises(TenantNotFoundError):
         load_tenant_context(session, missing_id)
+
+
+def test_load_tenant_context_serves_repeat_lookups_from_cache(session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    tenant = Tenant(name="Cached Corp")
+    session.add(tenant)
+    session.commit()
+
+    first = load_tenant_context(session, tenant.id)
+
+    def fail_get(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("cached tenant should not hit the database")
+
+    monkeypatch.setattr(session, "get", fail_get)
+
+    assert load_tenant_context(session, tenant.id) is first
+
+    invalidate_tenant_context(tenant.id)
+    session.info.pop(SESSION_TENANT_KEY)
+    monkeypatch.undo()
+
+    reloaded = load_tenant_context(session, tenant.id)
+    assert reloaded == first
+    assert reloaded is not first
+
+
+def test_load_tenant_context_binds_context_to_session(session: Session) -> None:
+    tenant = Tenant(name="Bound Corp")
+    session.add(tenant)
+    session.commit()
+
+    context = load_tenant_context(session, tenant.id)
+    invalidate_tenant_context(tenant.id)
+
+    assert session.info[SESSION_TENANT_KEY] is context
+    assert load_tenant_context(session, tenant.id) is context
+
+
+def test_load_tenant_context_ignores_session_binding_for_other_tenant(session: Session) -> None:
+    first = Tenant(name="First Corp")
+    second = Tenant(name="Second Corp")
+    session.add_all([first, second])
+    session.commit()
+
+    load_tenant_context(session, first.id)
+    context = load_tenant_context(session, second.id)
+
+    assert context.tenant_id == second.id
+    assert session.info[SESSION_TENANT_KEY] is context
@@ -5,9 +5,12 @@ from datetime import datetime, timezone
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
 
 from app.core.tenant import TenantContext
-from app.db.models import BankTransaction, Tenant
+from app.db.models import BankTransaction, IdempotencyKey, Tenant
+from app.repositories import bank_transaction
 from app.repositories.bank_transaction import BankTransactionRepository
 
 
@@ -34,59 +37,175 @@ def _create_transaction(
     )
 
 
-def test_get_by_external_ids_returns_map_for_matching_transactions(
-    session, tenant: Tenant, tenant_context: TenantContext
+def test_existing_external_ids_projects_ids_across_chunks(
+    session, tenant: Tenant, tenant_context: TenantContext, monkeypatch: pytest.MonkeyPatch
 ) -> None:
+    monkeypatch.setattr(bank_transaction, "EXTERNAL_ID_CHUNK_SIZE", 2)
     repository = BankTransactionRepository(session)
 
-    other_tenant = Tenant(name="Other Tenant")
-    session.add(other_tenant)
+    posted_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    transactions = [
+        _create_transaction(
+            tenant_id=tenant.id,
+            external_id=f"ext-{index}",
+            posted_at=posted_at,
+            amount=Decimal("10.00"),
+            description=f"Txn {index}",
+        )
+        for index in range(5)
+    ]
+    session.add_all(transactions)
     session.commit()
 
+    result = repository.existing_external_ids(
+        tenant_context, ["ext-0", "", "ext-2", "ext-4", "ext-missing", None]
+    )
+
+    expected = {"ext-0", "ext-2", "ext-4"}
+    assert result == {txn.external_id: txn.id for txn in transactions if txn.external_id in expected}
+
+
+def test_existing_external_ids_reuses_one_compiled_statement(
+    session, tenant_context: TenantContext
+) -> None:
+    repository = BankTransactionRepository(session)
+    repository.existing_external_ids(tenant_context, ["warm-up"])
+    cache = session.get_bind().engine._compiled_cache
+    before = len(cache)
+
+    repository.existing_external_ids(tenant_context, ["a", "b", "c"])
+    repository.existing_external_ids(tenant_context, [f"id-{n}" for n in range(7)])
+
+    assert len(cache) == before
+
+
+def test_bulk_create_skips_conflicting_external_ids(
+    session, tenant: Tenant, tenant_context: TenantContext
+) -> None:
+    repository = BankTransactionRepository(session)
     posted_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-    session.add_all(
-        [
-            _create_transaction(
-                tenant_id=tenant.id,
-                external_id="ext-1",
-                posted_at=posted_at,
-                amount=Decimal("10.00"),
-                description="First",
-            ),
-            _create_transaction(
-                tenant_id=tenant.id,
-                external_id="ext-2",
-                posted_at=posted_at,
-                amount=Decimal("20.00"),
-                description="Second",
-            ),
-            _create_transaction(
-                tenant_id=other_tenant.id,
-                external_id="ext-3",
-                posted_at=posted_at,
-                amount=Decimal("30.00"),
-                description="Other tenant",
-            ),
-        ]
+    session.add(
+        _create_transaction(
+            tenant_id=tenant.id,
+            external_id="ext-taken",
+            posted_at=posted_at,
+            amount=Decimal("5.00"),
+            description="Existing",
+        )
     )
     session.commit()
 
-    result = repository.get_by_external_ids(
-        tenant_context, ["ext-1", "ext-2", "ext-999", "", None]
+    rows = [
+        {
+            "id": f"00000000-0000-0000-0000-00000000000{index}",
+            "tenant_id": tenant.id,
+            "external_id": external_id,
+            "posted_at": posted_at,
+            "amount": Decimal("7.50"),
+            "amount_minor": 750,
+            "currency": "USD",
+            "description": None,
+        }
+        for index, external_id in enumerate(["ext-taken", "ext-new", None])
+    ]
+
+    created = repository.bulk_create(rows)
+
+    assert sorted(txn["id"] for txn in created) == [rows[1]["id"], rows[2]["id"]]
+    assert all(txn["created_at"] is not None for txn in created)
+    assert repository.bulk_create([]) == []
+
+
+def test_bulk_create_chunks_rows_under_the_bind_parameter_limit(
+    session, tenant: Tenant, tenant_context: TenantContext
+) -> None:
+    repository = BankTransactionRepository(session)
+    posted_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows = [
+        {
+            "tenant_id": tenant.id,
+            "external_id": f"ext-bulk-{index}",
+            "posted_at": posted_at,
+            "amount": Decimal("1.00"),
+            "amount_minor": 100,
+            "currency": "USD",
+            "description": None,
+        }
+        for index in range(250)
+    ]
+
+    inserts: list[int] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        if statement.lstrip().upper().startswith("INSERT"):
+            inserts.append(len(parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        created = repository.bulk_create(rows)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(created) == 250
+    assert len(inserts) > 1
+    assert max(inserts) <= bank_transaction.MAX_BIND_PARAMS
+
+
+def test_preflight_import_combines_idempotency_and_external_id_lookups(
+    session, tenant: Tenant, tenant_context: TenantContext, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(bank_transaction, "EXTERNAL_ID_CHUNK_SIZE", 2)
+    repository = BankTransactionRepository(session)
+
+    posted_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    transactions = [
+        _create_transaction(
+            tenant_id=tenant.id,
+            external_id=f"ext-{index}",
+            posted_at=posted_at,
+            amount=Decimal("10.00"),
+            description=f"Txn {index}",
+        )
+        for index in range(3)
+    ]
+    record = IdempotencyKey(
+        tenant_id=tenant.id,
+        key="batch-1",
+        endpoint="bank_transactions.import",
+        payload_hash="hash",
+        response_status=201,
+        response_body={},
+    )
+    session.add_all([*transactions, record])
+    session.commit()
+
+    result = repository.preflight_import(
+        tenant_context, "bank_transactions.import", "batch-1", ["ext-0", "ext-9", "ext-2"]
     )
 
-    assert set(result.keys()) == {"ext-1", "ext-2"}
-    assert all(tx.tenant_id == tenant.id for tx in result.values())
+    assert result.idempotency_id == record.id
+    assert result.payload_hash == "hash"
+    assert result.existing == {"ext-0": transactions[0].id, "ext-2": transactions[2].id}
+
+    miss = repository.preflight_import(tenant_context, "bank_transactions.import", "other", [])
+    assert miss.idempotency_id is None
+    assert miss.payload_hash is None
+    assert miss.existing == {}
 
 
-def test_get_by_external_ids_with_no_valid_identifiers_returns_empty_dict(
+def test_preflight_import_reuses_one_compiled_statement(
     session, tenant_context: TenantContext
 ) -> None:
     repository = BankTransactionRepository(session)
+    repository.preflight_import(tenant_context, "bank_transactions.import", "warm-up", ["warm-up"])
+    cache = session.get_bind().engine._compiled_cache
+    before = len(cache)
 
-    result = repository.get_by_external_ids(tenant_context, ["", None])
+    repository.preflight_import(tenant_context, "bank_transactions.import", "key-a", ["a", "b", "c"])
+    repository.preflight_import(tenant_context, "bank_transactions.import", "key-b", [f"id-{n}" for n in range(7)])
 
-    assert result == {}
+    assert len(cache) == before
 
 
 def test_list_for_invoice_matching_returns_only_tenant_transactions(
@@ -128,8 +247,11 @@ def test_list_for_invoice_matching_returns_only_tenant_transactions(
 
     transactions = repository.list_for_invoice_matching(tenant_context)
 
-    assert {tx.external_id for tx in transactions} == {"match-1", "match-2"}
+    assert {tx.amount_minor for tx in transactions} == {10000, 20000}
     assert all(tx.tenant_id == tenant.id for tx in transactions)
+    # Only the scoring columns are selected; the Decimal amount is never loaded.
+    with pytest.raises(InvalidRequestError):
+        _ = transactions[0].amount
 
 
 def test_list_for_tenant_applies_pagination(
@@ -160,3 +282,31 @@ def test_list_for_tenant_applies_pagination(
     assert len(second_page) == 1
     assert beyond == []
     assert all(tx.tenant_id == tenant.id for tx in first_page + second_page)
+
+
+def test_list_for_tenant_rows_matches_orm_page_without_entities(
+    session, tenant: Tenant, tenant_context: TenantContext
+) -> None:
+    repository = BankTransactionRepository(session)
+    session.add_all(
+        _create_transaction(
+            tenant_id=tenant.id,
+            external_id=f"rows-{index}",
+            posted_at=datetime(2024, 1, 4, tzinfo=timezone.utc),
+            amount=Decimal("20.00"),
+            description=f"Row {index}",
+        )
+        for index in range(3)
+    )
+    session.commit()
+    session.expunge_all()
+
+    rows = repository.list_for_tenant_rows(tenant_context, offset=1, limit=2)
+    identities = len(session.identity_map)
+    entities = repository.list_for_tenant(tenant_context, offset=1, limit=2)
+
+    assert identities == 0
+    assert [row["id"] for row in rows] == [entity.id for entity in entities]
+    assert set(rows[0].keys()) == {
+        "id", "tenant_id", "external_id", "posted_at", "amount", "currency", "description", "created_at"
+    }
@@ -4,10 +4,12 @@ from __future__ import annotations
 from types import SimpleNamespace
 
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.core.tenant import TenantContext, TenantMismatchError
-from app.db.models import Tenant, Vendor
+from app.db.models import Invoice, MatchCandidate, Tenant, Vendor
+from app.repositories.invoice import InvoiceRepository
+from app.repositories.match import MatchRepository
 from app.repositories.tenant import TenantRepository
 from app.repositories.vendor import VendorRepository
 
@@ -96,3 +98,13 @@ def test_assert_entity_tenant_raises_on_mismatch(session: Session) -> None:
 
     with pytest.raises(TenantMismatchError):
         repo.assert_entity_tenant(context, entity)
+
+
+def test_base_query_rejects_joined_collection_loaders(session: Session) -> None:
+    repository = InvoiceRepository(session)
+
+    with pytest.raises(ValueError, match="selectinload"):
+        repository._base_query(joinedload(Invoice.matches))
+
+    repository._base_query(selectinload(Invoice.matches).joinedload(MatchCandidate.bank_transaction))
+    MatchRepository(session)._base_query(joinedload(MatchCandidate.invoice).joinedload(Invoice.vendor))
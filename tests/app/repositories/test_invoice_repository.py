@@ -5,6 +5,8 @@ from datetime import date
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
 
 from app.core.tenant import TenantContext
 from app.db.models import Invoice, InvoiceStatus, Tenant, Vendor
@@ -156,6 +158,9 @@ def test_build_filter_query_respects_pagination(
     assert len(paged_results) == 1
     assert paged_results[0].id == all_results[1].id
 
+    paged_rows = session.execute(repository.build_filter_query(tenant_context, offset=1, limit=1)).all()
+    assert [row.total_count for row in paged_rows] == [3]
+
 
 def test_count_filtered_applies_filters(
     session,
@@ -221,6 +226,140 @@ def test_count_filtered_applies_filters(
     assert count == 1
 
 
+def test_list_filtered_with_total_counts_in_the_page_query(
+    session,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    repository = InvoiceRepository(session)
+    session.add_all(
+        [
+            _create_invoice(
+                tenant_id=tenant.id,
+                invoice_number=f"WIN-{index:03d}",
+                amount="10.00",
+                invoice_date=date(2024, 4, 1),
+                status=InvoiceStatus.OPEN if index < 5 else InvoiceStatus.PAID,
+            )
+            for index in range(6)
+        ]
+    )
+    session.flush()
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        rows, total = repository.list_filtered_with_total(
+            tenant_context, status=InvoiceStatus.OPEN, offset=1, limit=2
+        )
+        past_end, past_end_total = repository.list_filtered_with_total(
+            tenant_context, status=InvoiceStatus.OPEN, offset=10, limit=2
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(rows) == 2
+    assert all(isinstance(row, Invoice) for row in rows)
+    assert total == 5
+    assert past_end == []
+    assert past_end_total == 5
+    # One windowed query for the page; the empty page needs a fallback count.
+    assert len(statements) == 3
+
+
+def test_list_filtered_keyset_walks_dated_then_undated_invoices(
+    session,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    repository = InvoiceRepository(session)
+    invoices = [
+        _create_invoice(
+            tenant_id=tenant.id,
+            invoice_number=f"KEY-{index:03d}",
+            amount="10.00",
+            invoice_date=invoice_date,
+            status=InvoiceStatus.OPEN,
+        )
+        for index, invoice_date in enumerate(
+            [None, None, date(2024, 5, 1), date(2024, 5, 1), date(2024, 4, 1)]
+        )
+    ]
+    session.add_all(invoices)
+    session.flush()
+
+    seen: list[Invoice] = []
+    after = None
+    while True:
+        page = repository.list_filtered_keyset(tenant_context, after=after, limit=2)
+        if not page:
+            break
+        seen.extend(page)
+        after = (page[-1].invoice_date, page[-1].id)
+
+    expected = sorted(
+        invoices,
+        key=lambda invoice: (invoice.invoice_date is None, invoice.invoice_date or date.min, invoice.id),
+        reverse=True,
+    )
+    assert [invoice.id for invoice in seen] == [invoice.id for invoice in expected]
+    assert repository.list_filtered_keyset(
+        tenant_context, min_amount=20, after=None, limit=10
+    ) == []
+
+
+def test_list_filtered_keyset_with_total_counts_first_page_in_one_query(
+    session,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    repository = InvoiceRepository(session)
+    session.add_all(
+        [
+            _create_invoice(
+                tenant_id=tenant.id,
+                invoice_number=f"KWIN-{index:03d}",
+                amount="10.00",
+                invoice_date=date(2024, 4, 1 + index),
+                status=InvoiceStatus.OPEN if index < 5 else InvoiceStatus.PAID,
+            )
+            for index in range(6)
+        ]
+    )
+    session.flush()
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        first, first_total = repository.list_filtered_keyset_with_total(
+            tenant_context, status=InvoiceStatus.OPEN, limit=2
+        )
+        first_statements = len(statements)
+        after = (first[-1].invoice_date, first[-1].id)
+        second, second_total = repository.list_filtered_keyset_with_total(
+            tenant_context, status=InvoiceStatus.OPEN, after=after, limit=2
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert [invoice.invoice_date for invoice in first] == [date(2024, 4, 5), date(2024, 4, 4)]
+    assert [invoice.invoice_date for invoice in second] == [date(2024, 4, 3), date(2024, 4, 2)]
+    assert first_total == second_total == 5
+    assert first_statements == 1
+    assert len(statements) == 3
+    assert repository.list_filtered_keyset_with_total(tenant_context, min_amount=20) == ([], 0)
+
+
 def test_list_open_invoices_returns_only_open_for_tenant(
     session,
     tenant: Tenant,
@@ -267,7 +406,129 @@ def test_list_open_invoices_returns_only_open_for_tenant(
     session.add_all([open_one, open_two, non_open, external_open])
     session.flush()
 
-    results = repository.list_open_invoices(tenant_context)
+    results = list(repository.list_open_invoices(tenant_context))
 
     assert {invoice.id for invoice in results} == {open_one.id, open_two.id}
     assert all(invoice.tenant_id == tenant.id for invoice in results)
+
+
+def test_list_open_invoices_loads_vendors_without_per_row_queries(
+    session,
+    engine,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    repository = InvoiceRepository(session)
+    vendors = [Vendor(tenant_id=tenant.id, name=f"Vendor {index}") for index in range(5)]
+    session.add_all(vendors)
+    session.flush()
+    session.add_all(
+        _create_invoice(
+            tenant_id=tenant.id,
+            vendor_id=vendor.id,
+            invoice_number=f"VEND-{index}",
+            amount="10.00",
+            invoice_date=date(2024, 4, 1),
+            status=InvoiceStatus.OPEN,
+        )
+        for index, vendor in enumerate(vendors)
+    )
+    session.commit()
+    vendor_names = {vendor.name for vendor in vendors}
+    session.expunge_all()
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        results = list(repository.list_open_invoices(tenant_context))
+        names = {invoice.vendor.name for invoice in results}
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert names == vendor_names
+    assert len(statements) == 2
+    with pytest.raises(InvalidRequestError):
+        _ = results[0].matches
+    # Only the scoring columns are selected; anything else must not lazy load.
+    with pytest.raises(InvalidRequestError):
+        _ = results[0].invoice_number
+
+
+def test_get_for_tenant_joins_vendor_in_one_query(
+    session,
+    engine,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    repository = InvoiceRepository(session)
+    vendor = Vendor(tenant_id=tenant.id, name="Joined Vendor")
+    session.add(vendor)
+    session.flush()
+    invoice = _create_invoice(
+        tenant_id=tenant.id,
+        vendor_id=vendor.id,
+        invoice_number="JOIN-001",
+        amount="12.00",
+        invoice_date=date(2024, 4, 1),
+        status=InvoiceStatus.OPEN,
+    )
+    session.add(invoice)
+    session.commit()
+    invoice_id = invoice.id
+    session.expunge_all()
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        loaded = repository.get_for_tenant(tenant_context, invoice_id)
+        vendor_name = loaded.vendor.name
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert vendor_name == "Joined Vendor"
+    assert len(statements) == 1
+
+
+def test_filter_queries_reuse_compiled_sql_for_new_values(
+    session,
+    engine,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    repository = InvoiceRepository(session)
+    session.add(
+        _create_invoice(
+            tenant_id=tenant.id,
+            invoice_number="CACHE-001",
+            amount="40.00",
+            invoice_date=date(2024, 5, 1),
+            status=InvoiceStatus.OPEN,
+        )
+    )
+    session.flush()
+    repository.list_filtered_with_total(tenant_context, status=InvoiceStatus.PAID, min_amount=1.0)
+
+    cache_hits: list[bool] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        cache_hits.append(context.cache_hit is context.dialect.CACHE_HIT)
+
+    event.listen(engine, "after_cursor_execute", record)
+    try:
+        items, total = repository.list_filtered_with_total(
+            tenant_context, status=InvoiceStatus.OPEN, min_amount=30.0, limit=5
+        )
+    finally:
+        event.remove(engine, "after_cursor_execute", record)
+
+    assert [invoice.invoice_number for invoice in items] == ["CACHE-001"]
+    assert total == 1
+    assert cache_hits == [True]
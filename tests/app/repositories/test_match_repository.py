@@ -4,6 +4,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from decimal import Decimal
 
+from sqlalchemy import event, select, update
 from sqlalchemy.orm import Session
 
 from app.core.tenant import TenantContext
@@ -58,12 +59,13 @@ def _create_match(
     transaction: models.BankTransaction,
     *,
     status: MatchStatus = MatchStatus.PROPOSED,
+    score: Decimal = DEFAULT_SCORE,
 ) -> models.MatchCandidate:
     match = models.MatchCandidate(
         tenant_id=tenant.id,
         invoice=invoice,
         bank_transaction=transaction,
-        score=DEFAULT_SCORE,
+        score=score,
         status=status,
         reasoning="auto-generated",
     )
@@ -71,40 +73,6 @@ def _create_match(
     return match
 
 
-def test_list_proposed_returns_only_proposed_for_tenant(session: Session, tenant: models.Tenant) -> None:
-    repo = MatchRepository(session)
-    tenant_ctx = _tenant_context(tenant)
-
-    proposed_match = _create_match(
-        session,
-        tenant,
-        _create_invoice(session, tenant, "inv-proposed"),
-        _create_bank_transaction(session, tenant, "txn-proposed"),
-    )
-    _create_match(
-        session,
-        tenant,
-        _create_invoice(session, tenant, "inv-confirmed"),
-        _create_bank_transaction(session, tenant, "txn-confirmed"),
-        status=MatchStatus.CONFIRMED,
-    )
-
-    other_tenant = models.Tenant(name="Other Tenant")
-    _save(session, other_tenant)
-    _create_match(
-        session,
-        other_tenant,
-        _create_invoice(session, other_tenant, "inv-other"),
-        _create_bank_transaction(session, other_tenant, "txn-other"),
-    )
-
-    results = repo.list_proposed(tenant_ctx)
-
-    assert {match.id for match in results} == {proposed_match.id}
-    assert all(match.status is MatchStatus.PROPOSED for match in results)
-    assert all(match.tenant_id == tenant.id for match in results)
-
-
 def test_clear_proposed_removes_only_proposed_candidates(session: Session, tenant: models.Tenant) -> None:
     repo = MatchRepository(session)
     tenant_ctx = _tenant_context(tenant)
@@ -123,136 +91,146 @@ def test_clear_proposed_removes_only_proposed_candidates(session: Session, tenan
         status=MatchStatus.CONFIRMED,
     )
 
+    proposed_id, confirmed_id = proposed.id, confirmed.id
+
     repo.clear_proposed(tenant_ctx)
 
-    assert session.get(MatchCandidate, proposed.id) is None
-    assert session.get(MatchCandidate, confirmed.id) is not None
+    remaining = session.scalars(select(MatchCandidate.id).where(MatchCandidate.tenant_id == tenant.id)).all()
+    assert remaining == [confirmed_id]
+    assert proposed_id not in remaining
 
 
-def test_reject_other_matches_marks_remaining_as_rejected(session: Session, tenant: models.Tenant) -> None:
+def test_bulk_create_inserts_in_one_statement_and_returns_read_rows(
+    session: Session, tenant: models.Tenant
+) -> None:
+    repo = MatchRepository(session)
+    invoice = _create_invoice(session, tenant, "inv-bulk")
+    transactions = [_create_bank_transaction(session, tenant, f"txn-bulk-{index}") for index in range(3)]
+    rows = [
+        {
+            "tenant_id": tenant.id,
+            "invoice_id": invoice.id,
+            "bank_transaction_id": transaction.id,
+            "score": Decimal(f"0.{9 - index}"),
+            "status": MatchStatus.PROPOSED,
+            "reasoning": f"bulk {index}",
+        }
+        for index, transaction in enumerate(transactions)
+    ]
+
+    inserts: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        if statement.lstrip().upper().startswith("INSERT"):
+            inserts.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        created = repo.bulk_create(rows)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(inserts) == 1
+    assert [row["bank_transaction_id"] for row in created] == [t.id for t in transactions]
+    assert all(row["id"] and row["created_at"] is not None for row in created)
+    assert created[0]["status"] is MatchStatus.PROPOSED
+    persisted = session.scalars(select(MatchCandidate.id).where(MatchCandidate.invoice_id == invoice.id)).all()
+    assert sorted(persisted) == sorted(row["id"] for row in created)
+    assert repo.bulk_create([]) == []
+
+
+def test_reconciliation_state_reads_confirmed_ids_and_settled_pairs_in_one_query(
+    session: Session, tenant: models.Tenant
+) -> None:
     repo = MatchRepository(session)
     tenant_ctx = _tenant_context(tenant)
-
-    shared_invoice = _create_invoice(session, tenant, "inv-shared")
-    keep_match = _create_match(
-        session,
-        tenant,
-        shared_invoice,
-        _create_bank_transaction(session, tenant, "txn-keep"),
-    )
-    to_reject = _create_match(
-        session,
-        tenant,
-        shared_invoice,
-        _create_bank_transaction(session, tenant, "txn-reject"),
-    )
+    invoice = _create_invoice(session, tenant, "inv-state")
     confirmed = _create_match(
-        session,
-        tenant,
-        shared_invoice,
-        _create_bank_transaction(session, tenant, "txn-confirmed"),
+        session, tenant, invoice, _create_bank_transaction(session, tenant, "txn-state-confirmed"),
         status=MatchStatus.CONFIRMED,
     )
-
-    other_tenant = models.Tenant(name="Other Tenant For Reject")
-    _save(session, other_tenant)
-    other_match = _create_match(
-        session,
-        other_tenant,
-        _create_invoice(session, other_tenant, "inv-other-shared"),
-        _create_bank_transaction(session, other_tenant, "txn-other-shared"),
+    rejected = _create_match(
+        session, tenant, invoice, _create_bank_transaction(session, tenant, "txn-state-rejected"),
+        status=MatchStatus.REJECTED,
     )
+    _create_match(session, tenant, invoice, _create_bank_transaction(session, tenant, "txn-state-proposed"))
 
-    repo.reject_other_matches(tenant_ctx, invoice_id=shared_invoice.id, exclude_match_id=keep_match.id)
-    session.flush()
-    session.refresh(keep_match)
-    session.refresh(to_reject)
-    session.refresh(confirmed)
-    session.refresh(other_match)
+    statements: list[str] = []
 
-    assert keep_match.status is MatchStatus.PROPOSED
-    assert to_reject.status is MatchStatus.REJECTED
-    assert confirmed.status is MatchStatus.CONFIRMED
-    assert other_match.status is MatchStatus.PROPOSED
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
 
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        state = repo.reconciliation_state(tenant_ctx)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
 
-def test_existing_pairs_returns_invoice_transaction_pairs(session: Session, tenant: models.Tenant) -> None:
+    assert len(statements) == 1
+    assert state.confirmed_invoice_ids == {invoice.id}
+    assert state.confirmed_transaction_ids == {confirmed.bank_transaction_id}
+    assert state.settled_pairs == {
+        invoice.id: frozenset({confirmed.bank_transaction_id, rejected.bank_transaction_id})
+    }
+
+
+def test_confirm_exclusively_confirms_one_and_rejects_other_proposals(
+    session: Session, tenant: models.Tenant
+) -> None:
     repo = MatchRepository(session)
     tenant_ctx = _tenant_context(tenant)
-
-    first_match = _create_match(
+    invoice = _create_invoice(session, tenant, "inv-exclusive")
+    winner = _create_match(session, tenant, invoice, _create_bank_transaction(session, tenant, "txn-win"))
+    loser = _create_match(session, tenant, invoice, _create_bank_transaction(session, tenant, "txn-lose"))
+    other_invoice_match = _create_match(
         session,
         tenant,
-        _create_invoice(session, tenant, "inv-1"),
-        _create_bank_transaction(session, tenant, "txn-1"),
-    )
-    second_match = _create_match(
-        session,
-        tenant,
-        _create_invoice(session, tenant, "inv-2"),
-        _create_bank_transaction(session, tenant, "txn-2"),
+        _create_invoice(session, tenant, "inv-untouched"),
+        _create_bank_transaction(session, tenant, "txn-untouched"),
     )
 
-    other_tenant = models.Tenant(name="Pairs Tenant")
-    _save(session, other_tenant)
-    _create_match(
-        session,
-        other_tenant,
-        _create_invoice(session, other_tenant, "inv-x"),
-        _create_bank_transaction(session, other_tenant, "txn-x"),
-    )
+    updates: list[str] = []
 
-    pairs = repo.existing_pairs(tenant_ctx)
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        if statement.lstrip().upper().startswith("UPDATE"):
+            updates.append(statement)
 
-    assert pairs == {
-        (first_match.invoice_id, first_match.bank_transaction_id),
-        (second_match.invoice_id, second_match.bank_transaction_id),
-    }
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert repo.confirm_exclusively(tenant_ctx, winner) is True
+        session.commit()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(updates) == 1
+    assert winner.status is MatchStatus.CONFIRMED
+    assert loser.status is MatchStatus.REJECTED
+    assert other_invoice_match.status is MatchStatus.PROPOSED
 
 
-def test_confirmed_id_helpers_return_only_tenant_confirmed_records(session: Session, tenant: models.Tenant) -> None:
+def test_confirm_exclusively_reports_a_match_that_is_no_longer_proposed(
+    session: Session, tenant: models.Tenant
+) -> None:
     repo = MatchRepository(session)
     tenant_ctx = _tenant_context(tenant)
-
-    confirmed_one = _create_match(
-        session,
-        tenant,
-        _create_invoice(session, tenant, "inv-confirm-1"),
-        _create_bank_transaction(session, tenant, "txn-confirm-1"),
-        status=MatchStatus.CONFIRMED,
-    )
-    confirmed_two = _create_match(
-        session,
-        tenant,
-        _create_invoice(session, tenant, "inv-confirm-2"),
-        _create_bank_transaction(session, tenant, "txn-confirm-2"),
-        status=MatchStatus.CONFIRMED,
-    )
-    _create_match(
-        session,
-        tenant,
-        _create_invoice(session, tenant, "inv-proposed"),
-        _create_bank_transaction(session, tenant, "txn-proposed"),
+    invoice = _create_invoice(session, tenant, "inv-stale")
+    stale = _create_match(session, tenant, invoice, _create_bank_transaction(session, tenant, "txn-stale"))
+    _create_match(session, tenant, invoice, _create_bank_transaction(session, tenant, "txn-fresh"))
+    session.execute(
+        update(MatchCandidate)
+        .where(MatchCandidate.id == stale.id)
+        .values(status=MatchStatus.REJECTED)
+        .execution_options(synchronize_session=False)
     )
 
-    other_tenant = models.Tenant(name="Confirmed Tenant")
-    _save(session, other_tenant)
-    _create_match(
-        session,
-        other_tenant,
-        _create_invoice(session, other_tenant, "inv-other"),
-        _create_bank_transaction(session, other_tenant, "txn-other"),
-        status=MatchStatus.CONFIRMED,
-    )
-
-    invoice_ids = repo.confirmed_invoice_ids(tenant_ctx)
-    transaction_ids = repo.confirmed_transaction_ids(tenant_ctx)
-
-    assert invoice_ids == {confirmed_one.invoice_id, confirmed_two.invoice_id}
-    assert transaction_ids == {confirmed_one.bank_transaction_id, confirmed_two.bank_transaction_id}
+    assert repo.confirm_exclusively(tenant_ctx, stale) is False
+    assert stale.status is MatchStatus.PROPOSED
 
 
-def test_list_for_tenant_with_status_filters_when_requested(session: Session, tenant: models.Tenant) -> None:
+def test_list_for_tenant_with_status_rows_filters_when_requested(session: Session, tenant: models.Tenant) -> None:
     repo = MatchRepository(session)
     tenant_ctx = _tenant_context(tenant)
 
@@ -287,8 +265,79 @@ def test_list_for_tenant_with_status_filters_when_requested(session: Session, te
         status=MatchStatus.CONFIRMED,
     )
 
-    all_matches = repo.list_for_tenant_with_status(tenant_ctx)
-    confirmed_only = repo.list_for_tenant_with_status(tenant_ctx, status=MatchStatus.CONFIRMED)
+    all_rows = repo.list_for_tenant_with_status_rows(tenant_ctx)
+    confirmed_rows = repo.list_for_tenant_with_status_rows(tenant_ctx, status=MatchStatus.CONFIRMED)
+
+    assert {row["id"] for row in all_rows} == {m.id for m in [proposed, confirmed]}
+    assert [row["id"] for row in confirmed_rows] == [confirmed.id]
+    assert confirmed_rows[0]["status"] is MatchStatus.CONFIRMED
+
+
+def test_list_for_tenant_with_status_rows_returns_top_scored_first(
+    session: Session, tenant: models.Tenant
+) -> None:
+    repo = MatchRepository(session)
+    tenant_ctx = _tenant_context(tenant)
+    scores = [Decimal("0.4000"), Decimal("0.9500"), Decimal("0.7000")]
+    matches = [
+        _create_match(
+            session,
+            tenant,
+            _create_invoice(session, tenant, f"inv-score-{index}"),
+            _create_bank_transaction(session, tenant, f"txn-score-{index}"),
+            score=score,
+        )
+        for index, score in enumerate(scores)
+    ]
 
-    assert {match.id for match in all_matches} == {m.id for m in [proposed, confirmed]}
-    assert {match.id for match in confirmed_only} == {confirmed.id}
+    top_two = repo.list_for_tenant_with_status_rows(tenant_ctx, status=MatchStatus.PROPOSED, limit=2)
+
+    assert [row["id"] for row in top_two] == [matches[1].id, matches[2].id]
+
+
+def test_get_loads_related_entities_eagerly(session: Session, tenant: models.Tenant) -> None:
+    repo = MatchRepository(session)
+    context = _tenant_context(tenant)
+    invoice = _create_invoice(session, tenant, "inv-pair")
+    transaction = _create_bank_transaction(session, tenant, "txn-pair")
+    match = _create_match(session, tenant, invoice, transaction)
+    session.expunge_all()
+
+    loaded = repo.get_for_tenant(context, match.id)
+
+    assert loaded is not None
+    assert "invoice" in loaded.__dict__
+    assert "bank_transaction" in loaded.__dict__
+    assert loaded.invoice.id == "inv-pair"
+    assert loaded.bank_transaction.id == "txn-pair"
+    assert "vendor" in loaded.invoice.__dict__
+
+    other = _tenant_context(models.Tenant(id="other-tenant", name="Other"))
+    assert repo.get_for_tenant(other, match.id) is None
+
+
+def test_lambda_statements_hit_the_compiled_cache_across_tenants(
+    session: Session, engine, tenant: models.Tenant
+) -> None:
+    repo = MatchRepository(session)
+    other = models.Tenant(name="Other")
+    _save(session, other)
+    invoice = _create_invoice(session, tenant, "inv-cached")
+    transaction = _create_bank_transaction(session, tenant, "txn-cached")
+    _create_match(session, tenant, invoice, transaction, status=MatchStatus.CONFIRMED)
+    repo.reconciliation_state(_tenant_context(other))
+    context = _tenant_context(tenant)
+
+    cache_hits: list[bool] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        cache_hits.append(context.cache_hit is context.dialect.CACHE_HIT)
+
+    event.listen(engine, "after_cursor_execute", record)
+    try:
+        state = repo.reconciliation_state(context)
+    finally:
+        event.remove(engine, "after_cursor_execute", record)
+
+    assert state.settled_pairs == {"inv-cached": frozenset({"txn-cached"})}
+    assert cache_hits == [True]
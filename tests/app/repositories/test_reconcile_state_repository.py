@@ -0,0 +1,51 @@
+"""Tests for the ReconcileStateRepository."""
+from __future__ import annotations
+
+from app.core.tenant import TenantContext
+from app.db.models import Tenant
+from app.repositories.reconcile_state import ReconcileStateRepository
+
+
+def _tenant_context(tenant: Tenant) -> TenantContext:
+    return TenantContext(tenant_id=str(tenant.id), tenant_name=tenant.name)
+
+
+def test_first_store_creates_the_row_without_caching(session, tenant) -> None:
+    repository = ReconcileStateRepository(session)
+    tenant_context = _tenant_context(tenant)
+
+    assert repository.current(tenant_context) is None
+    repository.store(tenant_context, None, {"matches": []})
+    repository.store(tenant_context, None, {"matches": []})
+
+    assert tuple(repository.current(tenant_context)) == (0, None, None)
+
+
+def test_store_caches_the_response_for_an_unchanged_version(session, tenant) -> None:
+    repository = ReconcileStateRepository(session)
+    tenant_context = _tenant_context(tenant)
+    repository.store(tenant_context, None, {"matches": []})
+
+    repository.store(tenant_context, 0, {"matches": ["m"]})
+
+    assert tuple(repository.current(tenant_context)) == (0, 0, {"matches": ["m"]})
+
+
+def test_store_skips_a_response_computed_before_a_bump(session, tenant) -> None:
+    repository = ReconcileStateRepository(session)
+    tenant_context = _tenant_context(tenant)
+    repository.store(tenant_context, None, {"matches": []})
+
+    repository.bump(tenant_context)
+    repository.store(tenant_context, 0, {"matches": ["stale"]})
+
+    assert tuple(repository.current(tenant_context)) == (1, None, None)
+
+
+def test_bump_is_a_no_op_for_tenants_never_reconciled(session, tenant) -> None:
+    repository = ReconcileStateRepository(session)
+    tenant_context = _tenant_context(tenant)
+
+    repository.bump(tenant_context)
+
+    assert repository.current(tenant_context) is None
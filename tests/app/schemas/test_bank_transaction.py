@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from decimal import Decimal
 
 import pytest
 from pydantic import ValidationError
@@ -83,6 +84,22 @@ def test_bank_transaction_import_item_requires_positive_amount(amount: float) ->
         BankTransactionImportItem(posted_at=posted_at, amount=amount)
 
 
+def test_bank_transaction_import_item_parses_json_amount_as_exact_decimal() -> None:
+    item = BankTransactionImportItem.model_validate_json(
+        '{"posted_at": "2024-01-01T00:00:00Z", "amount": 19.99}'
+    )
+
+    assert item.amount == Decimal("19.99")
+
+
+@pytest.mark.parametrize("amount", ["10.005", "12345678901234567.00"])
+def test_bank_transaction_import_item_bounds_amount_to_column_precision(amount: str) -> None:
+    posted_at = datetime.now(tz=timezone.utc)
+
+    with pytest.raises(ValidationError):
+        BankTransactionImportItem(posted_at=posted_at, amount=Decimal(amount))
+
+
 @pytest.mark.parametrize("currency", ["US", "USDE"])
 def test_bank_transaction_import_item_enforces_currency_length(currency: str) -> None:
     posted_at = datetime.now(tz=timezone.utc)
@@ -23,10 +23,19 @@ def test_all_exports_match_expected() -> None:
         "BankTransactionImportRequest": ("app.schemas.bank_transaction", "BankTransactionImportRequest"),
         "BankTransactionRead": ("app.schemas.bank_transaction", "BankTransactionRead"),
         "BankTransactionImportResponse": ("app.schemas.bank_transaction", "BankTransactionImportResponse"),
+        "BankTransactionPage": ("app.schemas.bank_transaction", "BankTransactionPage"),
         "MatchCandidateRead": ("app.schemas.match", "MatchCandidateRead"),
         "ReconciliationResponse": ("app.schemas.match", "ReconciliationResponse"),
         "MatchConfirmationResponse": ("app.schemas.match", "MatchConfirmationResponse"),
         "AIExplanationResponse": ("app.schemas.match", "AIExplanationResponse"),
+        "AIExplanationBatchRequest": ("app.schemas.match", "AIExplanationBatchRequest"),
+        "AIExplanationBatchResponse": ("app.schemas.match", "AIExplanationBatchResponse"),
+        "ExplanationJobAccepted": ("app.schemas.match", "ExplanationJobAccepted"),
+        "ExplanationJobStatus": ("app.schemas.match", "ExplanationJobStatus"),
+        "TENANT_READ_LIST": ("app.schemas", "TENANT_READ_LIST"),
+        "BANK_TRANSACTION_READ_LIST": ("app.schemas", "BANK_TRANSACTION_READ_LIST"),
+        "INVOICE_READ_LIST": ("app.schemas", "INVOICE_READ_LIST"),
+        "MATCH_CANDIDATE_READ_LIST": ("app.schemas", "MATCH_CANDIDATE_READ_LIST"),
     }
 
     expected_order = list(export_sources)
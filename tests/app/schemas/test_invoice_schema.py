@@ -55,7 +55,9 @@ def test_invoice_read_from_attributes() -> None:
     invoice = InvoiceRead.model_validate(record)
 
     assert invoice.id == record.id
-    assert invoice.status is InvoiceStatus.OPEN
+    assert invoice.status == InvoiceStatus.OPEN.value
+    assert type(invoice.status) is str
+    assert "\"status\":\"open\"" in invoice.model_dump_json()
     assert invoice.created_at == record.created_at
 
 
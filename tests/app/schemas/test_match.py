@@ -37,7 +37,7 @@ def test_match_candidate_read_accepts_valid_payload() -> None:
 
     assert candidate.id == "match-1"
     assert candidate.score == pytest.approx(0.85)
-    assert candidate.status is MatchStatus.PROPOSED
+    assert candidate.status == MatchStatus.PROPOSED.value
     assert candidate.created_at == FIXED_TIMESTAMP
 
 
@@ -57,7 +57,7 @@ def test_match_candidate_read_supports_from_attributes() -> None:
 
     candidate = MatchCandidateRead.model_validate(orm_object)
 
-    assert candidate.status is MatchStatus.CONFIRMED
+    assert candidate.status == MatchStatus.CONFIRMED.value
     assert candidate.reasoning == "Solid metadata alignment"
 
 
@@ -49,3 +49,13 @@ def test_tenant_read_supports_model_validate_from_attributes() -> None:
     assert read_model.id == "tenant-123"
     assert read_model.name == "Acme Corp"
     assert read_model.created_at == created_at
+
+
+def test_tenant_read_is_frozen_and_ignores_extra_fields() -> None:
+    read_model = TenantRead.model_validate(
+        {"id": "tenant-1", "name": "Acme", "created_at": datetime.now(timezone.utc), "plan": "pro"}
+    )
+
+    assert not hasattr(read_model, "plan")
+    with pytest.raises(ValidationError):
+        read_model.name = "Renamed"
@@ -5,11 +5,13 @@ from datetime import datetime, timezone
 from decimal import Decimal
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
 
 from app.core.tenant import TenantContext
-from app.db.models import BankTransaction, IdempotencyKey
+from app.db.models import BankTransaction, IdempotencyKey, Tenant
+from app.repositories.bank_transaction import ImportPreflight
+from app.repositories.reconcile_state import ReconcileStateRepository
 from app.schemas.bank_transaction import (
     BankTransactionImportItem,
     BankTransactionImportRequest,
@@ -17,7 +19,7 @@ from app.schemas.bank_transaction import (
 )
 from app.services.bank_transaction_service import BankTransactionService
 from app.services.exceptions import ConflictError, ValidationError
-from app.utils.hash import stable_hash
+from app.utils.hash import stable_hash, stable_hash_bytes
 
 
 @pytest.fixture()
@@ -45,6 +47,14 @@ def _build_item(
     )
 
 
+def _legacy_hash(request: BankTransactionImportRequest) -> str:
+    """Hash idempotency records were stored with before the v2 scheme."""
+
+    return stable_hash(
+        [item.model_dump() | {"amount": float(item.amount)} for item in request.transactions]
+    )
+
+
 def test_import_transactions_requires_idempotency_key(service: BankTransactionService) -> None:
     request = BankTransactionImportRequest(transactions=[_build_item("txn-1", 15.0, "First")])
 
@@ -61,7 +71,7 @@ def test_import_transactions_returns_existing_idempotent_response(
     stored_response = BankTransactionImportResponse(
         created=0, duplicates=0, conflicts=0, transactions=[]
     )
-    payload_hash = stable_hash([item.model_dump() for item in request.transactions])
+    payload_hash = _legacy_hash(request)
     record = IdempotencyKey(
         tenant_id=tenant_context.tenant_id,
         endpoint=BankTransactionService.IDEMPOTENCY_ENDPOINT,
@@ -90,7 +100,7 @@ def test_import_transactions_persists_transactions_and_records_idempotency(
     assert response.created == 1
     assert response.duplicates == 0
     assert response.conflicts == 0
-    payload_hash = stable_hash([item.model_dump() for item in request.transactions])
+    payload_hash = stable_hash_bytes(request.model_dump_json().encode("utf-8"))
 
     rows = session.scalars(
         select(BankTransaction).where(BankTransaction.tenant_id == tenant_context.tenant_id)
@@ -108,6 +118,67 @@ def test_import_transactions_persists_transactions_and_records_idempotency(
     assert idempotency_record.response_body == response.model_dump()
 
 
+def test_import_transactions_bumps_reconcile_state_only_when_rows_are_created(
+    service: BankTransactionService,
+    session: Session,
+    tenant_context: TenantContext,
+) -> None:
+    states = ReconcileStateRepository(session)
+    states.store(tenant_context, None, {"matches": []})
+    service.import_transactions(
+        BankTransactionImportRequest(transactions=[_build_item("txn-state", 12.0, "New")]),
+        idempotency_key="state-1",
+    )
+    service.import_transactions(
+        BankTransactionImportRequest(transactions=[_build_item("txn-state", 12.0, "New")]),
+        idempotency_key="state-2",
+    )
+
+    assert states.current(tenant_context).version == 1
+
+
+def test_import_transactions_replays_retry_from_memory(
+    service: BankTransactionService,
+    session: Session,
+    engine,
+) -> None:
+    request = BankTransactionImportRequest(transactions=[_build_item("txn-1", 12.0, "Retry")])
+    first = service.import_transactions(request, idempotency_key="batch-retry")
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        replayed = service.import_transactions(request, idempotency_key="batch-retry")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert replayed == first
+    assert statements == []
+
+
+def test_import_replay_cache_is_scoped_to_tenant(
+    service: BankTransactionService,
+    session: Session,
+) -> None:
+    request = BankTransactionImportRequest(transactions=[_build_item("txn-1", 12.0, "Shared key")])
+    service.import_transactions(request, idempotency_key="shared-key")
+    other = Tenant(name="Other Tenant")
+    session.add(other)
+    session.commit()
+    other_service = BankTransactionService(
+        session, TenantContext(tenant_id=other.id, tenant_name=other.name)
+    )
+
+    response = other_service.import_transactions(request, idempotency_key="shared-key")
+
+    assert response.created == 1
+    assert response.transactions[0].tenant_id == other.id
+
+
 def test_import_transactions_counts_existing_duplicates(
     service: BankTransactionService,
     session: Session,
@@ -126,7 +197,7 @@ def test_import_transactions_counts_existing_duplicates(
 
     request = BankTransactionImportRequest(
         transactions=[
-            _build_item("txn-duplicate", 40.0, "Duplicate"),
+            _build_item(" txn-duplicate ", 40.0, "Duplicate"),
             _build_item("txn-new", 75.0, "Inserted"),
         ]
     )
@@ -140,6 +211,80 @@ def test_import_transactions_counts_existing_duplicates(
     assert any(row.external_id == "txn-new" for row in rows)
 
 
+def test_import_transactions_rejects_duplicate_external_ids_in_payload(
+    service: BankTransactionService,
+    session: Session,
+) -> None:
+    request = BankTransactionImportRequest(
+        transactions=[
+            _build_item("txn-1", 10.0, "First"),
+            _build_item(None, 11.0, "No id"),
+            _build_item(None, 12.0, "No id either"),
+            _build_item("txn-1 ", 13.0, "Same id after trimming"),
+        ]
+    )
+
+    with pytest.raises(ConflictError):
+        service.import_transactions(request, idempotency_key="batch-payload-dupes")
+
+    assert session.scalars(select(BankTransaction)).all() == []
+
+
+def test_import_transactions_counts_rows_lost_to_concurrent_import_as_duplicates(
+    service: BankTransactionService,
+    session: Session,
+    tenant_context: TenantContext,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session.add(
+        BankTransaction(
+            tenant_id=tenant_context.tenant_id,
+            external_id="txn-raced",
+            posted_at=datetime.now(tz=timezone.utc),
+            amount=Decimal("25.00"),
+            currency="USD",
+        )
+    )
+    session.commit()
+    # Simulate another import committing the row after the preflight ran.
+    monkeypatch.setattr(
+        service.transactions,
+        "preflight_import",
+        lambda *args, **kwargs: ImportPreflight(None, None, {}),
+    )
+
+    request = BankTransactionImportRequest(
+        transactions=[
+            _build_item("txn-raced", 25.0, "Raced"),
+            _build_item("txn-fresh", 12.5, "Fresh"),
+        ]
+    )
+
+    response = service.import_transactions(request, idempotency_key="batch-race")
+
+    assert response.created == 1
+    assert response.duplicates == 1
+    assert [txn.external_id for txn in response.transactions] == ["txn-fresh"]
+    fresh = session.scalar(select(BankTransaction).where(BankTransaction.external_id == "txn-fresh"))
+    assert fresh.amount_minor == 1250
+
+
+def test_import_transactions_conflicts_when_idempotency_record_vanishes(
+    service: BankTransactionService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    request = BankTransactionImportRequest(transactions=[_build_item("txn-1", 10.0, "Original")])
+    payload_hash = stable_hash_bytes(request.model_dump_json().encode("utf-8"))
+    monkeypatch.setattr(
+        service.transactions,
+        "preflight_import",
+        lambda *args, **kwargs: ImportPreflight("deleted-record", payload_hash, {}),
+    )
+
+    with pytest.raises(ConflictError):
+        service.import_transactions(request, idempotency_key="batch-gone")
+
+
 def test_import_transactions_rejects_payload_mismatch(
     service: BankTransactionService,
     session: Session,
@@ -148,7 +293,7 @@ def test_import_transactions_rejects_payload_mismatch(
     original_request = BankTransactionImportRequest(
         transactions=[_build_item("txn-1", 10.0, "Original")]
     )
-    payload_hash = stable_hash([item.model_dump() for item in original_request.transactions])
+    payload_hash = _legacy_hash(original_request)
     record = IdempotencyKey(
         tenant_id=tenant_context.tenant_id,
         endpoint=BankTransactionService.IDEMPOTENCY_ENDPOINT,
@@ -170,6 +315,21 @@ def test_import_transactions_rejects_payload_mismatch(
         service.import_transactions(different_request, idempotency_key="batch-777")
 
 
+def test_import_transactions_rejects_payload_mismatch_under_current_hash(
+    service: BankTransactionService,
+) -> None:
+    service.import_transactions(
+        BankTransactionImportRequest(transactions=[_build_item("txn-1", 10.0, "Original")]),
+        idempotency_key="batch-v2",
+    )
+
+    with pytest.raises(ConflictError):
+        service.import_transactions(
+            BankTransactionImportRequest(transactions=[_build_item("txn-1", 11.0, "Changed")]),
+            idempotency_key="batch-v2",
+        )
+
+
 def test_import_transactions_rolls_back_on_integrity_error(
     service: BankTransactionService,
     session: Session,
@@ -219,3 +379,43 @@ def test_list_transactions_returns_serialized_rows(
 
     assert {item.id for item in result} == {tx_one.id, tx_two.id}
     assert all(item.tenant_id == tenant_context.tenant_id for item in result)
+
+
+def test_list_transactions_page_walks_cursor_to_end(
+    service: BankTransactionService,
+    session: Session,
+    tenant_context: TenantContext,
+) -> None:
+    transactions = [
+        BankTransaction(
+            tenant_id=tenant_context.tenant_id,
+            external_id=f"page-{index}",
+            posted_at=datetime(2024, 1, 1 + index // 2, tzinfo=timezone.utc),
+            amount=Decimal("10.00"),
+            currency="USD",
+            description=f"Payment {index}",
+        )
+        for index in range(5)
+    ]
+    session.add_all(transactions)
+    session.commit()
+
+    seen: list[str] = []
+    cursor: str | None = None
+    pages = 0
+    while True:
+        page = service.list_transactions_page(after=cursor, limit=2)
+        pages += 1
+        seen.extend(item.id for item in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    expected = sorted(transactions, key=lambda txn: (txn.posted_at, txn.id))
+    assert seen == [txn.id for txn in expected]
+    assert pages == 3
+
+
+def test_list_transactions_page_rejects_malformed_cursor(service: BankTransactionService) -> None:
+    with pytest.raises(ValidationError):
+        service.list_transactions_page(after="not-a-cursor")
@@ -1,7 +1,13 @@
 """Unit tests for service-layer exception hierarchy."""
 from __future__ import annotations
 
-from app.services.exceptions import ConflictError, NotFoundError, ServiceError, ValidationError
+from app.services.exceptions import (
+    CapacityError,
+    ConflictError,
+    NotFoundError,
+    ServiceError,
+    ValidationError,
+)
 
 
 def test_service_error_inherits_from_exception() -> None:
@@ -20,6 +26,10 @@ def test_validation_error_inherits_service_error() -> None:
     assert issubclass(ValidationError, ServiceError)
 
 
+def test_capacity_error_inherits_service_error() -> None:
+    assert issubclass(CapacityError, ServiceError)
+
+
 def test_exception_instantiation_preserves_message() -> None:
     message = "entity not found"
     error = NotFoundError(message)
@@ -0,0 +1,49 @@
+"""Tests for the in-process explanation job registry."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.schemas.match import AIExplanationResponse
+from app.services.exceptions import CapacityError
+from app.services.explanation_jobs import ExplanationJobStore
+
+
+async def explain(gate: asyncio.Event) -> AIExplanationResponse:
+    await gate.wait()
+    return AIExplanationResponse(explanation="done", confidence="high")
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_when_every_job_is_pending() -> None:
+    jobs = ExplanationJobStore(max_jobs=2)
+    gate = asyncio.Event()
+    first = jobs.submit("tenant", explain(gate))
+    jobs.submit("tenant", explain(gate))
+
+    with pytest.raises(CapacityError):
+        jobs.submit("tenant", explain(gate))
+
+    assert jobs.get("tenant", first) is not None
+    gate.set()
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_submit_evicts_oldest_finished_job_to_make_room() -> None:
+    jobs = ExplanationJobStore(max_jobs=2)
+    done = asyncio.Event()
+    done.set()
+    finished = jobs.submit("tenant", explain(done))
+    gate = asyncio.Event()
+    pending = jobs.submit("tenant", explain(gate))
+    await asyncio.sleep(0)
+
+    latest = jobs.submit("tenant", explain(done))
+
+    assert jobs.get("tenant", finished) is None
+    assert jobs.get("tenant", pending) is not None
+    assert jobs.get("tenant", latest) is not None
+    gate.set()
+    await asyncio.sleep(0)
@@ -1,6 +1,7 @@
 """Unit tests for :mod:`app.services.explanation_service`."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
@@ -12,6 +13,7 @@ from app.ai.provider import ExplanationContext
 from app.core.tenant import TenantContext
 from app.db.models import BankTransaction, Invoice, MatchCandidate, MatchStatus, Tenant
 from app.services import explanation_service
+from app.services.explanation_jobs import ExplanationJobStore
 from app.services.explanation_service import ExplanationService
 from app.services.exceptions import NotFoundError
 
@@ -33,6 +35,9 @@ class StubAIClient:
             raise RuntimeError("boom")
         return "AI explanation", "medium"
 
+    async def aexplain(self, context: ExplanationContext) -> tuple[str, str | None]:
+        return self.explain(context)
+
 
 class StubFallbackClient:
     def __init__(self) -> None:
@@ -42,6 +47,9 @@ class StubFallbackClient:
         self.calls.append(context)
         return "Fallback explanation", "low"
 
+    async def aexplain(self, context: ExplanationContext) -> tuple[str, str | None]:
+        return self.explain(context)
+
 
 def create_match(
     session: Session,
@@ -308,3 +316,172 @@ def test_explain_pair_missing_invoice_raises(
 
     with pytest.raises(NotFoundError):
         service.explain_pair("missing-invoice", "missing-txn")
+
+
+@pytest.mark.asyncio
+async def test_aexplain_contexts_returns_results_in_request_order(
+    monkeypatch: pytest.MonkeyPatch,
+    session: Session,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    first = create_match(session, tenant, reasoning="First reasoning")
+    second = create_match(session, tenant, reasoning="Second reasoning")
+
+    ai_client = StubAIClient()
+    configure_settings(monkeypatch, api_key="integration-key")
+    monkeypatch.setattr(explanation_service, "resolve_ai_client", lambda model, key: ai_client)
+    configure_fallback(monkeypatch, StubFallbackClient())
+
+    service = ExplanationService(session, tenant_context)
+    responses = await service.aexplain_contexts(service.match_contexts([second.id, first.id]))
+
+    assert [response.explanation for response in responses] == ["AI explanation", "AI explanation"]
+    assert [call.reasoning for call in ai_client.calls] == ["Second reasoning", "First reasoning"]
+
+
+@pytest.mark.asyncio
+async def test_aexplain_context_falls_back_on_ai_error(
+    monkeypatch: pytest.MonkeyPatch,
+    session: Session,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    match = create_match(session, tenant)
+
+    ai_client = StubAIClient(fail=True)
+    fallback = StubFallbackClient()
+    configure_settings(monkeypatch, api_key="integration-key")
+    monkeypatch.setattr(explanation_service, "resolve_ai_client", lambda model, key: ai_client)
+    configure_fallback(monkeypatch, fallback)
+
+    service = ExplanationService(session, tenant_context)
+    response = await service.aexplain_context(service.match_context(match.id))
+
+    assert response.explanation == "Fallback explanation"
+    assert len(fallback.calls) == 1
+
+
+def test_explain_matches_returns_results_in_request_order(
+    monkeypatch: pytest.MonkeyPatch,
+    session: Session,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    first = create_match(session, tenant, reasoning="First reasoning")
+    second = create_match(session, tenant, reasoning="Second reasoning")
+
+    ai_client = StubAIClient()
+    configure_settings(monkeypatch, api_key="integration-key")
+    monkeypatch.setattr(explanation_service, "resolve_ai_client", lambda model, key: ai_client)
+    configure_fallback(monkeypatch, StubFallbackClient())
+
+    service = ExplanationService(session, tenant_context)
+    responses = service.explain_matches([second.id, first.id])
+
+    assert [response.explanation for response in responses] == ["AI explanation", "AI explanation"]
+    assert [call.reasoning for call in ai_client.calls] == ["Second reasoning", "First reasoning"]
+
+
+def test_explain_matches_falls_back_per_pair_when_ai_fails(
+    monkeypatch: pytest.MonkeyPatch,
+    session: Session,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    first = create_match(session, tenant, reasoning="First reasoning")
+    second = create_match(session, tenant, reasoning="Second reasoning")
+
+    fallback = StubFallbackClient()
+    configure_settings(monkeypatch, api_key="integration-key")
+    monkeypatch.setattr(explanation_service, "resolve_ai_client", lambda model, key: StubAIClient(fail=True))
+    configure_fallback(monkeypatch, fallback)
+
+    service = ExplanationService(session, tenant_context)
+    responses = service.explain_matches([first.id, second.id])
+
+    assert [response.explanation for response in responses] == ["Fallback explanation"] * 2
+    assert [call.reasoning for call in fallback.calls] == ["First reasoning", "Second reasoning"]
+
+
+@pytest.mark.asyncio
+async def test_submit_job_completes_in_background(
+    monkeypatch: pytest.MonkeyPatch,
+    session: Session,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    match = create_match(session, tenant)
+
+    configure_settings(monkeypatch, api_key="integration-key")
+    monkeypatch.setattr(explanation_service, "resolve_ai_client", lambda model, key: StubAIClient())
+    configure_fallback(monkeypatch, StubFallbackClient())
+
+    jobs = ExplanationJobStore()
+    service = ExplanationService(session, tenant_context)
+    job_id = service.submit_job(jobs, service.match_context(match.id))
+
+    assert service.job_status(jobs, job_id).status == "pending"
+    await jobs.get(tenant_context.tenant_id, job_id)
+
+    status = service.job_status(jobs, job_id)
+    assert status.status == "completed"
+    assert status.result is not None
+    assert status.result.explanation == "AI explanation"
+
+
+@pytest.mark.asyncio
+async def test_job_status_is_scoped_to_tenant(
+    monkeypatch: pytest.MonkeyPatch,
+    session: Session,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    match = create_match(session, tenant)
+
+    configure_settings(monkeypatch, api_key=None)
+    configure_fallback(monkeypatch, StubFallbackClient())
+
+    jobs = ExplanationJobStore()
+    service = ExplanationService(session, tenant_context)
+    job_id = service.submit_job(jobs, service.match_context(match.id))
+    await jobs.get(tenant_context.tenant_id, job_id)
+
+    other_service = ExplanationService(session, TenantContext(tenant_id="other-tenant", tenant_name="Other"))
+    with pytest.raises(NotFoundError):
+        other_service.job_status(jobs, job_id)
+
+
+@pytest.mark.asyncio
+async def test_aexplain_contexts_caps_concurrent_ai_calls(
+    monkeypatch: pytest.MonkeyPatch,
+    session: Session,
+    tenant: Tenant,
+    tenant_context: TenantContext,
+) -> None:
+    matches = [create_match(session, tenant, reasoning=f"Reasoning {index}") for index in range(5)]
+
+    class SlowAIClient(StubAIClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.active = 0
+            self.peak = 0
+
+        async def aexplain(self, context: ExplanationContext) -> tuple[str, str | None]:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0)
+            self.active -= 1
+            return self.explain(context)
+
+    ai_client = SlowAIClient()
+    configure_settings(monkeypatch, api_key="integration-key")
+    monkeypatch.setattr(explanation_service, "resolve_ai_client", lambda model, key: ai_client)
+    configure_fallback(monkeypatch, StubFallbackClient())
+    monkeypatch.setattr(ExplanationService, "MAX_CONCURRENT_EXPLANATIONS", 2)
+
+    service = ExplanationService(session, tenant_context)
+    responses = await service.aexplain_contexts(service.match_contexts([match.id for match in matches]))
+
+    assert len(responses) == 5
+    assert ai_client.peak == 2
@@ -1,7 +1,7 @@
 """Unit tests for :mod:`app.services.invoice_service`."""
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import MagicMock
@@ -12,7 +12,9 @@ from app.core.tenant import TenantContext
 from app.db.models import InvoiceStatus
 from app.schemas.invoice import InvoiceCreate, InvoiceFilterParams
 from app.services import invoice_service
+from app.services.exceptions import ValidationError
 from app.services.invoice_service import InvoiceService
+from app.utils.cursor import decode_date_cursor, encode_date_cursor
 
 
 def _invoice_namespace(**overrides: object) -> SimpleNamespace:
@@ -68,7 +70,6 @@ def test_create_persists_invoice_with_expected_defaults(monkeypatch: pytest.Monk
 def test_list_applies_filters_and_returns_response(monkeypatch: pytest.MonkeyPatch) -> None:
     session = MagicMock()
     tenant = TenantContext(tenant_id="tenant-abc", tenant_name="Tenant")
-    statement = object()
     rows = [
         _invoice_namespace(
             tenant_id=tenant.tenant_id,
@@ -79,17 +80,12 @@ def test_list_applies_filters_and_returns_response(monkeypatch: pytest.MonkeyPat
         )
     ]
 
-    scalars_result = MagicMock()
-    scalars_result.all.return_value = rows
-    session.scalars.return_value = scalars_result
-
     class QueryRepository:
         def __init__(self, bound_session: MagicMock) -> None:
             self.session = bound_session
-            self.built_filters: dict[str, object] | None = None
-            self.count_filters: dict[str, object] | None = None
+            self.list_filters: dict[str, object] | None = None
 
-        def build_filter_query(
+        def list_filtered_with_total(
             self,
             *,
             tenant: TenantContext,
@@ -101,8 +97,8 @@ def test_list_applies_filters_and_returns_response(monkeypatch: pytest.MonkeyPat
             max_amount,
             offset: int,
             limit: int,
-        ) -> object:
-            self.built_filters = {
+        ) -> tuple[list[SimpleNamespace], int]:
+            self.list_filters = {
                 "tenant": tenant,
                 "status": status,
                 "vendor_id": vendor_id,
@@ -113,29 +109,7 @@ def test_list_applies_filters_and_returns_response(monkeypatch: pytest.MonkeyPat
                 "offset": offset,
                 "limit": limit,
             }
-            return statement
-
-        def count_filtered(
-            self,
-            *,
-            tenant: TenantContext,
-            status: InvoiceStatus | None,
-            vendor_id: str | None,
-            start_date,
-            end_date,
-            min_amount,
-            max_amount,
-        ) -> int:
-            self.count_filters = {
-                "tenant": tenant,
-                "status": status,
-                "vendor_id": vendor_id,
-                "start_date": start_date,
-                "end_date": end_date,
-                "min_amount": min_amount,
-                "max_amount": max_amount,
-            }
-            return 7
+            return rows, 7
 
     repository = QueryRepository(session)
     monkeypatch.setattr(invoice_service, "InvoiceRepository", lambda _session: repository)
@@ -150,7 +124,7 @@ def test_list_applies_filters_and_returns_response(monkeypatch: pytest.MonkeyPat
 
     response = service.list(filters, offset=5, limit=2)
 
-    assert repository.built_filters == {
+    assert repository.list_filters == {
         "tenant": tenant,
         "status": InvoiceStatus.MATCHED,
         "vendor_id": "vendor-1",
@@ -161,17 +135,6 @@ def test_list_applies_filters_and_returns_response(monkeypatch: pytest.MonkeyPat
         "offset": 5,
         "limit": 2,
     }
-    assert repository.count_filters == {
-        "tenant": tenant,
-        "status": InvoiceStatus.MATCHED,
-        "vendor_id": "vendor-1",
-        "start_date": None,
-        "end_date": None,
-        "min_amount": 10,
-        "max_amount": 100,
-    }
-    session.scalars.assert_called_once_with(statement)
-    scalars_result.all.assert_called_once()
 
     assert response.total == 7
     assert len(response.items) == 1
@@ -228,3 +191,67 @@ def test_delete_raises_when_invoice_missing(monkeypatch: pytest.MonkeyPatch) ->
 
     session.delete.assert_not_called()
     session.commit.assert_not_called()
+
+
+def test_list_serves_repeat_queries_from_cache_until_invalidated(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = MagicMock()
+    tenant = TenantContext(tenant_id="tenant-cache", tenant_name="Tenant")
+
+    class CountingRepository:
+        def __init__(self, bound_session: MagicMock) -> None:
+            self.queries = 0
+
+        def list_filtered_with_total(self, **kwargs: object) -> tuple[list[object], int]:
+            self.queries += 1
+            return [], 0
+
+    repository = CountingRepository(session)
+    monkeypatch.setattr(invoice_service, "InvoiceRepository", lambda _session: repository)
+
+    service = InvoiceService(session, tenant)
+    filters = InvoiceFilterParams()
+
+    first = service.list(filters, offset=0, limit=10)
+    assert service.list(filters, offset=0, limit=10) is first
+    assert repository.queries == 1
+
+    service.list(filters, offset=10, limit=10)
+    assert repository.queries == 2
+
+    invoice_service.invalidate_invoice_lists(tenant.tenant_id)
+    service.list(filters, offset=0, limit=10)
+    assert repository.queries == 3
+
+
+def test_list_with_cursor_seeks_by_keyset_and_returns_next_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = MagicMock()
+    tenant = TenantContext(tenant_id="tenant-keyset", tenant_name="Tenant")
+    rows = [
+        _invoice_namespace(id=f"inv-{index}", tenant_id=tenant.tenant_id, invoice_date=date(2024, 5, 3 - index))
+        for index in range(3)
+    ]
+    repository = MagicMock()
+    repository.list_filtered_keyset_with_total.return_value = (rows, 7)
+    monkeypatch.setattr(invoice_service, "InvoiceRepository", lambda _session: repository)
+
+    cursor = encode_date_cursor(date(2024, 5, 9), "inv-prev")
+    response = InvoiceService(session, tenant).list(
+        InvoiceFilterParams(status=InvoiceStatus.OPEN, cursor=cursor), offset=50, limit=2
+    )
+
+    keyset_kwargs = repository.list_filtered_keyset_with_total.call_args.kwargs
+    assert keyset_kwargs["after"] == (date(2024, 5, 9), "inv-prev")
+    assert keyset_kwargs["limit"] == 3
+    assert keyset_kwargs["status"] is InvoiceStatus.OPEN
+    repository.list_filtered_with_total.assert_not_called()
+    assert [item.id for item in response.items] == ["inv-0", "inv-1"]
+    assert response.total == 7
+    assert decode_date_cursor(response.next_cursor) == (date(2024, 5, 2), "inv-1")
+
+
+def test_list_rejects_malformed_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(invoice_service, "InvoiceRepository", lambda _session: MagicMock())
+    service = InvoiceService(MagicMock(), TenantContext(tenant_id="tenant-bad", tenant_name="Tenant"))
+
+    with pytest.raises(ValidationError):
+        service.list(InvoiceFilterParams(cursor="not a cursor"), limit=10)
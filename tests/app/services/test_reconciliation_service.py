@@ -1,11 +1,12 @@
 """Unit tests for the reconciliation service."""
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import delete, event, select, update
 
 from app.core.tenant import TenantContext
 from app.db.models import (
@@ -15,7 +16,10 @@ from app.db.models import (
     MatchCandidate,
     MatchStatus,
 )
+from app.schemas.invoice import InvoiceCreate
+from app.services import reconciliation_service, scoring
 from app.services.exceptions import ConflictError, NotFoundError
+from app.services.invoice_service import InvoiceService
 from app.services.reconciliation_service import ReconciliationService
 
 
@@ -146,6 +150,225 @@ def test_reconcile_generates_candidates_respecting_per_invoice_limit(session, te
     assert len(persisted) == 3
 
 
+def test_reconcile_only_scores_transactions_within_amount_tolerance(
+    session, tenant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = create_service(session, tenant)
+    invoice = create_invoice(session, tenant.id, amount=Decimal("100.00"))
+    near = create_transaction(session, tenant.id, amount=Decimal("101.00"), external_id="near")
+    create_transaction(session, tenant.id, amount=Decimal("101.01"), external_id="above")
+    create_transaction(session, tenant.id, amount=Decimal("98.99"), external_id="below")
+    exact = create_transaction(session, tenant.id, amount=Decimal("100.00"), external_id="exact")
+
+    scored: list[int] = []
+    real_score_features = reconciliation_service.score_features
+
+    def recording_score_features(invoice_arg, transaction_arg, **kwargs):  # type: ignore[no-untyped-def]
+        scored.append(transaction_arg.amount_minor)
+        return real_score_features(invoice_arg, transaction_arg, **kwargs)
+
+    monkeypatch.setattr(reconciliation_service, "score_features", recording_score_features)
+
+    response = service.reconcile()
+
+    assert sorted(scored) == [10000, 10100]
+    assert [match.bank_transaction_id for match in response.matches] == [exact.id]
+    assert all(match.invoice_id == invoice.id for match in response.matches)
+    assert near.id not in {match.bank_transaction_id for match in response.matches}
+
+
+def test_reconcile_renders_reasoning_only_for_selected_pairs(
+    session, tenant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = create_service(session, tenant)
+    create_invoice(session, tenant.id, amount=Decimal("75.00"))
+    create_invoice(session, tenant.id, amount=Decimal("75.00"))
+    transaction = create_transaction(session, tenant.id, amount=Decimal("75.00"))
+
+    rendered: list[object] = []
+    real_format_reasoning = reconciliation_service.format_reasoning
+
+    def recording_format_reasoning(match_score):  # type: ignore[no-untyped-def]
+        rendered.append(match_score)
+        return real_format_reasoning(match_score)
+
+    monkeypatch.setattr(reconciliation_service, "format_reasoning", recording_format_reasoning)
+
+    response = service.reconcile()
+
+    assert [match.bank_transaction_id for match in response.matches] == [transaction.id]
+    assert len(rendered) == 1
+
+
+def test_reconcile_scores_batches_in_pool_with_same_result(
+    session, tenant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(reconciliation_service, "SCORING_BATCH_SIZE", 2)
+    for index in range(5):
+        create_invoice(session, tenant.id, amount=Decimal(f"{100 + index}.00"))
+        create_transaction(session, tenant.id, amount=Decimal(f"{100 + index}.00"), external_id=f"pool-{index}")
+
+    inline = create_service(session, tenant).reconcile()
+    session.execute(delete(MatchCandidate))
+    session.commit()
+
+    submitted: list[tuple[object, ...]] = []
+
+    class RecordingPool(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):  # type: ignore[no-untyped-def, override]
+            submitted.append(args)
+            return super().submit(fn, *args, **kwargs)
+
+    def executor(*initargs):  # type: ignore[no-untyped-def]
+        pool = RecordingPool(
+            max_workers=2, initializer=reconciliation_service._init_scoring_worker, initargs=initargs
+        )
+        return pool, 2
+
+    monkeypatch.setattr(reconciliation_service, "_scoring_executor", executor)
+    pooled = create_service(session, tenant).reconcile()
+
+    def pairs(response):  # type: ignore[no-untyped-def]
+        return [(m.invoice_id, m.bank_transaction_id, m.score) for m in response.matches]
+
+    assert len(inline.matches) == 5
+    assert pairs(pooled) == pairs(inline)
+    # Three batches, each shipped without the transaction index.
+    assert [len(args) for args in submitted] == [1, 1, 1]
+
+
+def test_reconcile_scores_a_single_batch_inline(session, tenant, monkeypatch: pytest.MonkeyPatch) -> None:
+    create_invoice(session, tenant.id, amount=Decimal("15.00"))
+    create_transaction(session, tenant.id, amount=Decimal("15.00"))
+
+    def no_pool(*initargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("a single batch should not start a pool")
+
+    monkeypatch.setattr(reconciliation_service, "_scoring_executor", no_pool)
+
+    assert len(create_service(session, tenant).reconcile().matches) == 1
+
+
+def test_score_invoices_runs_in_a_worker_process(session, tenant) -> None:
+    invoice = create_invoice(session, tenant.id, amount=Decimal("42.00"))
+    transaction = create_transaction(session, tenant.id, amount=Decimal("42.00"))
+    index = reconciliation_service._TransactionIndex.build([transaction])
+    jobs = [(invoice.id, reconciliation_service.InvoiceFeatures.from_invoice(invoice), frozenset())]
+
+    with ProcessPoolExecutor(
+        max_workers=1,
+        initializer=reconciliation_service._init_scoring_worker,
+        initargs=(index, 0.45, 3),
+    ) as pool:
+        remote = pool.submit(reconciliation_service._score_in_worker, jobs).result()
+
+    assert remote == reconciliation_service._score_invoices(jobs, index, 0.45, 3)
+    assert [(invoice_id, position) for _, invoice_id, position in remote] == [(invoice.id, 0)]
+
+
+def test_transaction_index_translates_settled_pairs_to_positions(session, tenant) -> None:
+    first = create_transaction(session, tenant.id, amount=Decimal("10.00"), external_id="pos-1")
+    second = create_transaction(session, tenant.id, amount=Decimal("20.00"), external_id="pos-2")
+    index = reconciliation_service._TransactionIndex.build([first, second])
+
+    positions = index.positions_of(
+        {
+            "inv-a": frozenset({second.id, "not-indexed"}),
+            "inv-b": frozenset({"not-indexed"}),
+        }
+    )
+
+    assert positions == {"inv-a": frozenset({1})}
+
+
+def test_repeat_reconcile_reuses_description_similarity(session, tenant) -> None:
+    scoring._text_similarity.cache_clear()
+    create_invoice(session, tenant.id, amount=Decimal("60.00"), description="Annual support plan")
+    create_transaction(session, tenant.id, amount=Decimal("60.00"), description="SUPPORT PLAN 2024")
+
+    create_service(session, tenant).reconcile()
+    first = scoring._text_similarity.cache_info()
+    session.execute(delete(MatchCandidate))
+    session.commit()
+    create_service(session, tenant).reconcile()
+    second = scoring._text_similarity.cache_info()
+
+    assert first.misses > 0
+    assert second.misses == first.misses
+    assert second.hits > first.hits
+
+
+def test_repeat_reconcile_proposes_the_same_matches_again(session, tenant) -> None:
+    create_invoice(session, tenant.id, amount=Decimal("80.00"))
+    transaction = create_transaction(session, tenant.id, amount=Decimal("80.00"))
+
+    first = create_service(session, tenant).reconcile()
+    second = create_service(session, tenant).reconcile()
+
+    assert [match.bank_transaction_id for match in first.matches] == [transaction.id]
+    assert [match.bank_transaction_id for match in second.matches] == [transaction.id]
+    persisted = session.scalars(select(MatchCandidate).where(MatchCandidate.status == MatchStatus.PROPOSED)).all()
+    assert len(persisted) == 1
+
+
+def test_reconcile_sees_rows_written_outside_the_service(session, tenant) -> None:
+    create_invoice(session, tenant.id, amount=Decimal("70.00"))
+    first = create_service(session, tenant).reconcile()
+    # The first run only creates the tenant's reconcile state, caching nothing.
+    transaction = create_transaction(session, tenant.id, amount=Decimal("70.00"))
+    second = create_service(session, tenant).reconcile()
+
+    assert first.matches == []
+    assert [match.bank_transaction_id for match in second.matches] == [transaction.id]
+
+
+def test_unchanged_tenant_reuses_the_stored_reconciliation(session, tenant) -> None:
+    create_invoice(session, tenant.id, amount=Decimal("90.00"))
+    create_transaction(session, tenant.id, amount=Decimal("90.00"))
+    create_service(session, tenant).reconcile()
+    stored = create_service(session, tenant).reconcile()
+    service = create_service(session, tenant)
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        reused = service.reconcile()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert reused == stored
+    assert len(statements) == 1
+    assert "tenantreconcilestate" in statements[0]
+
+
+def test_reconcile_recomputes_after_an_invoice_is_created(session, tenant) -> None:
+    context = TenantContext(tenant_id=str(tenant.id), tenant_name=tenant.name)
+    create_transaction(session, tenant.id, amount=Decimal("45.00"))
+    create_service(session, tenant).reconcile()
+    assert create_service(session, tenant).reconcile().matches == []
+
+    invoice = InvoiceService(session, context).create(InvoiceCreate(amount=45.00, description="Consulting Services"))
+    refreshed = create_service(session, tenant).reconcile()
+
+    assert [match.invoice_id for match in refreshed.matches] == [invoice.id]
+
+
+def test_reconcile_recomputes_after_a_match_is_confirmed(session, tenant) -> None:
+    create_invoice(session, tenant.id, amount=Decimal("30.00"))
+    create_transaction(session, tenant.id, amount=Decimal("30.00"))
+    create_service(session, tenant).reconcile()
+    proposed = create_service(session, tenant).reconcile()
+
+    create_service(session, tenant).confirm_match(proposed.matches[0].id)
+
+    assert create_service(session, tenant).reconcile().matches == []
+
+
 def test_reconcile_skips_confirmed_invoices_and_transactions(session, tenant) -> None:
     service = create_service(session, tenant)
 
@@ -215,6 +438,33 @@ def test_confirm_match_updates_invoice_and_rejects_others(session, tenant) -> No
     assert rejected.status == MatchStatus.REJECTED
 
 
+def test_confirm_match_conflicts_when_match_was_rejected_concurrently(session, tenant) -> None:
+    service = create_service(session, tenant)
+
+    invoice = create_invoice(session, tenant.id, description="Hosting")
+    stale_match = create_match(
+        session, tenant.id, invoice, create_transaction(session, tenant.id, description="Hosting", external_id="txn-stale")
+    )
+    sibling = create_match(
+        session, tenant.id, invoice, create_transaction(session, tenant.id, description="Hosting", external_id="txn-sibling")
+    )
+    session.commit()
+    assert stale_match.status == MatchStatus.PROPOSED
+    # Another confirmation rejected the candidate; the loaded instance still says proposed.
+    session.execute(
+        update(MatchCandidate)
+        .where(MatchCandidate.id == stale_match.id)
+        .values(status=MatchStatus.REJECTED)
+        .execution_options(synchronize_session=False)
+    )
+
+    with pytest.raises(ConflictError):
+        service.confirm_match(stale_match.id)
+
+    assert session.get(MatchCandidate, sibling.id).status == MatchStatus.PROPOSED
+    assert session.get(Invoice, invoice.id).status != InvoiceStatus.MATCHED
+
+
 def test_confirm_match_raises_not_found_for_unknown_id(session, tenant) -> None:
     service = create_service(session, tenant)
 
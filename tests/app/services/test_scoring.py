@@ -9,10 +9,14 @@ from typing import cast
 import pytest
 
 from app.db.models import BankTransaction, Invoice
+from app.services import scoring
 from app.services.scoring import (
+    InvoiceFeatures,
     MatchScore,
     ScoreComponent,
+    TransactionFeatures,
     format_reasoning,
+    score_features,
     score_match,
 )
 
@@ -125,6 +129,137 @@ def test_score_match_large_mismatch_is_low_confidence() -> None:
     assert details["amount_tolerance"] == "Outside $1 tolerance (difference $150.00)"
 
 
+def test_score_match_prefers_minor_units_for_exact_cent_differences() -> None:
+    invoice = cast(
+        Invoice,
+        SimpleNamespace(
+            amount=Decimal("200.00"),
+            amount_minor=20000,
+            invoice_date=None,
+            description=None,
+            vendor=None,
+        ),
+    )
+    transaction = cast(
+        BankTransaction,
+        SimpleNamespace(
+            amount=Decimal("199.99"),
+            amount_minor=19999,
+            posted_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            description=None,
+        ),
+    )
+
+    match_score = score_match(invoice, transaction)
+
+    details = {component.name: component.detail for component in match_score.components}
+    assert details["amount_exact"] == "Exact amount match"
+
+
+@pytest.mark.parametrize(
+    "invoice_amount,txn_amount,days_apart,invoice_description,txn_description,vendor_name",
+    [
+        ("100.00", "100.00", 0, "Consulting", "Consulting Acme", "Acme"),
+        ("100.00", "100.40", 5, "Retainer", "Retainer fee", None),
+        ("100.00", "100.99", 12, None, "Memo", "Acme"),
+        ("100.00", "101.00", None, "Hosting", None, "Acme"),
+        ("100.00", "250.00", 1, "Hosting", "Hosting", None),
+        # Chained + and sum() round this one differently.
+        ("100.84", "100.20", None, "hosting cloud", "support inv hosting", "Acme"),
+    ],
+)
+def test_score_features_matches_score_match_total(
+    invoice_amount: str,
+    txn_amount: str,
+    days_apart: int | None,
+    invoice_description: str | None,
+    txn_description: str | None,
+    vendor_name: str | None,
+) -> None:
+    posted_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    invoice = cast(
+        Invoice,
+        SimpleNamespace(
+            amount=Decimal(invoice_amount),
+            invoice_date=None if days_apart is None else (posted_at - timedelta(days=days_apart)).date(),
+            description=invoice_description,
+            vendor=SimpleNamespace(name=vendor_name) if vendor_name else None,
+        ),
+    )
+    transaction = cast(
+        BankTransaction,
+        SimpleNamespace(amount=Decimal(txn_amount), posted_at=posted_at, description=txn_description),
+    )
+
+    total = score_features(
+        InvoiceFeatures.from_invoice(invoice), TransactionFeatures.from_transaction(transaction)
+    )
+
+    assert total == score_match(invoice, transaction).total
+
+
+def test_description_similarity_is_memoised_per_pair() -> None:
+    scoring._text_similarity.cache_clear()
+    posted_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    invoice = cast(
+        Invoice,
+        SimpleNamespace(amount=Decimal("10.00"), invoice_date=None, description="Cloud Hosting", vendor=None),
+    )
+    transaction = cast(
+        BankTransaction,
+        SimpleNamespace(amount=Decimal("10.00"), posted_at=posted_at, description="cloud hosting inv"),
+    )
+
+    first = score_features(
+        InvoiceFeatures.from_invoice(invoice), TransactionFeatures.from_transaction(transaction)
+    )
+    second = score_features(
+        InvoiceFeatures.from_invoice(invoice), TransactionFeatures.from_transaction(transaction)
+    )
+
+    info = scoring._text_similarity.cache_info()
+    assert first == second
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_score_features_skips_text_comparison_below_minimum() -> None:
+    scoring._text_similarity.cache_clear()
+    posted_on = datetime(2024, 2, 1, tzinfo=timezone.utc).date()
+    invoice = InvoiceFeatures(
+        amount_minor=10000, invoice_date=posted_on - timedelta(days=30), description="hosting", vendor_name=None
+    )
+    transaction = TransactionFeatures(amount_minor=10050, posted_on=posted_on, description="hosting")
+
+    assert score_features(invoice, transaction, minimum=0.45) == 0.0
+    assert scoring._text_similarity.cache_info().misses == 0
+    assert score_features(invoice, transaction) == pytest.approx(0.2)
+
+    exact = TransactionFeatures(amount_minor=10000, posted_on=posted_on, description="hosting")
+    assert score_features(invoice, exact, minimum=0.45) == score_features(invoice, exact)
+
+
+def test_features_lowercase_vendor_and_memo_once() -> None:
+    posted_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    invoice = InvoiceFeatures.from_invoice(
+        cast(
+            Invoice,
+            SimpleNamespace(
+                amount=Decimal("10.00"), invoice_date=None, description=None, vendor=SimpleNamespace(name="ACME Corp")
+            ),
+        )
+    )
+    transaction = TransactionFeatures.from_transaction(
+        cast(
+            BankTransaction,
+            SimpleNamespace(amount=Decimal("10.00"), posted_at=posted_at, description="Payment ACME CORP 42"),
+        )
+    )
+
+    assert invoice.vendor_name == "acme corp"
+    assert transaction.description == "payment acme corp 42"
+    assert scoring._vendor_achieved(invoice.vendor_name, transaction.description) == 1.0
+
+
 def test_format_reasoning_mirrors_match_score_reasoning(perfect_invoice, perfect_transaction) -> None:
     match_score = score_match(perfect_invoice, perfect_transaction)
     assert format_reasoning(match_score) == match_score.reasoning_text()
@@ -0,0 +1,44 @@
+"""Unit tests for the operational command line entrypoint."""
+from __future__ import annotations
+
+import pytest
+
+from app import cli
+
+
+def test_migrate_upgrades_then_ensures_schema(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(cli.command, "upgrade", lambda config, revision: calls.append(revision))
+    monkeypatch.setattr(cli, "create_database_schema", lambda: calls.append("create_all"))
+
+    cli.migrate()
+
+    assert calls == ["head", "create_all"]
+
+
+def test_migrate_falls_back_to_create_all_when_upgrade_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def failing_upgrade(config: object, revision: str) -> None:
+        raise RuntimeError("no alembic.ini")
+
+    monkeypatch.setattr(cli.command, "upgrade", failing_upgrade)
+    monkeypatch.setattr(cli, "create_database_schema", lambda: calls.append("create_all"))
+
+    cli.migrate()
+
+    assert calls == ["create_all"]
+
+
+def test_main_dispatches_named_command(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setitem(cli.COMMANDS, "migrate", lambda: calls.append("migrate"))
+
+    cli.main(["migrate"])
+
+    assert calls == ["migrate"]
+
+
+def test_main_rejects_unknown_command() -> None:
+    with pytest.raises(SystemExit):
+        cli.main(["unknown"])
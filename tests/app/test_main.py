@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from fastapi import FastAPI
@@ -24,8 +25,11 @@ def test_ensure_sqlite_directory_creates_parent(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_lifespan_initializes_and_disposes_resources(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_settings = object()
+@pytest.mark.parametrize("run_migrations", [True, False])
+async def test_lifespan_initializes_and_disposes_resources(
+    monkeypatch: pytest.MonkeyPatch, run_migrations: bool
+) -> None:
+    fake_settings = SimpleNamespace(run_migrations_on_startup=run_migrations)
     ensure_calls: list[object] = []
     schema_calls: list[bool] = []
     disposed: list[bool] = []
@@ -36,7 +40,7 @@ async def test_lifespan_initializes_and_disposes_resources(monkeypatch: pytest.M
     def fake_ensure(settings: object) -> None:
         ensure_calls.append(settings)
 
-    def fake_create_schema() -> None:
+    def fake_migrate() -> None:
         schema_calls.append(True)
 
     class DummyEngine:
@@ -45,7 +49,7 @@ async def test_lifespan_initializes_and_disposes_resources(monkeypatch: pytest.M
 
     monkeypatch.setattr(main, "get_settings", fake_get_settings)
     monkeypatch.setattr(main, "_ensure_sqlite_directory", fake_ensure)
-    monkeypatch.setattr(main, "create_database_schema", fake_create_schema)
+    monkeypatch.setattr(main, "migrate", fake_migrate)
     monkeypatch.setattr(main, "ENGINE", DummyEngine())
 
     app = FastAPI()
@@ -54,7 +58,7 @@ async def test_lifespan_initializes_and_disposes_resources(monkeypatch: pytest.M
         assert getattr(app.state, "settings") is fake_settings
 
     assert ensure_calls == [fake_settings]
-    assert schema_calls == [True]
+    assert schema_calls == ([True] if run_migrations else [])
     assert disposed == [True]
 
 
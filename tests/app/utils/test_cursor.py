@@ -0,0 +1,30 @@
+"""Unit tests for :mod:`app.utils.cursor`."""
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from app.utils.cursor import decode_cursor, decode_date_cursor, encode_cursor, encode_date_cursor
+
+
+def test_cursor_round_trips_position() -> None:
+    posted_at = datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+    assert decode_cursor(encode_cursor(posted_at, "txn|1")) == (posted_at, "txn|1")
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm8tc2VwYXJhdG9y", "bm90LWEtZGF0ZXxpZA=="])
+def test_decode_cursor_rejects_malformed_tokens(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("value", [date(2024, 3, 1), None])
+def test_date_cursor_round_trips_nullable_position(value: date | None) -> None:
+    assert decode_date_cursor(encode_date_cursor(value, "inv|1")) == (value, "inv|1")
+
+
+def test_decode_date_cursor_rejects_malformed_tokens() -> None:
+    with pytest.raises(ValueError):
+        decode_date_cursor("bm90LWEtZGF0ZXxpZA==")
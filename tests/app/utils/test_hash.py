@@ -5,7 +5,7 @@ from datetime import datetime
 
 import pytest
 
-from app.utils.hash import stable_hash
+from app.utils.hash import stable_hash, stable_hash_bytes
 
 
 def is_hexadecimal_sha256(value: str) -> bool:
@@ -51,8 +51,24 @@ def test_stable_hash_handles_non_json_serializable_values() -> None:
     assert first == second
 
 
+def test_stable_hash_output_is_frozen_for_stored_legacy_digests() -> None:
+    data = [{"external_id": "tx-1", "amount": 12.5, "description": "Café"}]
+
+    assert stable_hash(data) == "584644e2125d162379bcec06839339b4855806b5b3f78b72742a8480b9c0c9d6"
+
+
 def test_stable_hash_reflects_value_changes() -> None:
     base_data = {"value": "original"}
     mutated_data = {"value": "mutated"}
 
     assert stable_hash(base_data) != stable_hash(mutated_data)
+
+
+def test_stable_hash_bytes_is_versioned_blake2b() -> None:
+    result = stable_hash_bytes(b'{"transactions":[]}')
+
+    prefix, digest = result.split(":")
+    assert prefix == "v2"
+    assert len(digest) == 32
+    assert result == stable_hash_bytes(b'{"transactions":[]}')
+    assert result != stable_hash_bytes(b'{"transactions":[1]}')
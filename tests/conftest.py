@@ -4,41 +4,80 @@ from __future__ import annotations
 from collections.abc import Generator
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 from app.core.database import get_db_session
 from app.db.base import Base
 from app.db.models import Tenant
 from app.main import create_app
+from app.services.bank_transaction_service import forget_import_replays
+from app.services.invoice_service import invalidate_invoice_lists
+from app.services.tenant_service import invalidate_tenant_list
 
 
-@pytest.fixture()
+@pytest.fixture(autouse=True)
+def reset_list_caches() -> Generator[None, None, None]:
+    """Keep cached list responses from leaking between tests."""
+
+    invalidate_invoice_lists()
+    invalidate_tenant_list()
+    forget_import_replays()
+    yield
+
+
+@pytest.fixture(scope="session")
 def engine() -> Generator:
+    """One in-memory database per test process; the schema is created once."""
+
     engine = create_engine(
         "sqlite:///:memory:",
         future=True,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    # pysqlite defers BEGIN and mishandles SAVEPOINT; let SQLAlchemy emit both.
+    @event.listens_for(engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record) -> None:  # type: ignore[no-untyped-def]
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection) -> None:  # type: ignore[no-untyped-def]
+        connection.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
     try:
         yield engine
     finally:
-        Base.metadata.drop_all(bind=engine)
         engine.dispose()
 
 
 @pytest.fixture()
 def session(engine) -> Generator[Session, None, None]:
-    SessionLocal = sessionmaker(bind=engine, class_=Session, autoflush=False, autocommit=False)
-    db_session = SessionLocal()
+    """Session inside an outer transaction that is rolled back after the test.
+
+    Commits and rollbacks made by the code under test only release or roll
+    back savepoints, so every test starts from an empty schema.
+    """
+
+    connection = engine.connect()
+    outer = connection.begin()
+    db_session = Session(
+        bind=connection,
+        autoflush=False,
+        autocommit=False,
+        join_transaction_mode="create_savepoint",
+    )
     try:
         yield db_session
     finally:
         db_session.close()
+        outer.rollback()
+        connection.close()
 
 
 @pytest.fixture()
@@ -50,9 +89,15 @@ def tenant(session: Session) -> Tenant:
     return tenant
 
 
+@pytest.fixture(scope="session")
+def application() -> FastAPI:
+    """The full application, built once; clients only swap dependency overrides."""
+
+    return create_app()
+
+
 @pytest.fixture()
-def client(session: Session) -> Generator[TestClient, None, None]:
-    application = create_app()
+def client(application: FastAPI, session: Session) -> Generator[TestClient, None, None]:
 
     def override_get_db_session() -> Generator[Session, None, None]:
         try:
@@ -6,6 +6,7 @@ from importlib import import_module
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy.pool import StaticPool
 
 
 @pytest.fixture()
@@ -37,6 +38,63 @@ def test_engine_uses_database_url(load_database_module):
     assert database.ENGINE.url.render_as_string(hide_password=False) == url
 
 
+def test_engine_options_use_static_pool_for_in_memory_sqlite(load_database_module):
+    database = load_database_module()
+
+    options = database._engine_options("sqlite+pysqlite:///:memory:")
+
+    assert options["poolclass"] is StaticPool
+    assert options["connect_args"] == {"check_same_thread": False}
+
+
+def test_engine_options_keep_default_pool_for_file_sqlite(load_database_module):
+    database = load_database_module()
+
+    options = database._engine_options("sqlite:///./data/dev.db")
+
+    assert "poolclass" not in options
+    assert options["connect_args"] == {"check_same_thread": False}
+
+
+def test_engine_options_size_pool_for_server_databases(load_database_module):
+    database = load_database_module()
+
+    options = database._engine_options("postgresql+psycopg://user:secret@db/flow")
+
+    assert options == {
+        "pool_size": 20,
+        "max_overflow": 40,
+        "pool_pre_ping": False,
+        "pool_recycle": 1800,
+        "pool_timeout": 5.0,
+    }
+
+
+def test_engine_options_read_pool_settings(load_database_module, monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "8")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "2")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "300")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "true")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "1.5")
+    database = load_database_module()
+
+    options = database._engine_options("postgresql+psycopg://user:secret@db/flow")
+
+    assert options == {
+        "pool_size": 8,
+        "max_overflow": 2,
+        "pool_pre_ping": True,
+        "pool_recycle": 300,
+        "pool_timeout": 1.5,
+    }
+
+
+def test_engine_uses_enlarged_compiled_cache(load_database_module):
+    database = load_database_module()
+
+    assert database.ENGINE._compiled_cache.capacity == database.QUERY_CACHE_SIZE
+
+
 def test_sessionlocal_creates_session_bound_to_engine(load_database_module):
     database = load_database_module()
 
@@ -82,3 +140,40 @@ def test_create_database_schema_invokes_metadata(monkeypatch, load_database_modu
     database.create_database_schema()
 
     create_all.assert_called_once_with(bind=database.ENGINE)
+
+
+def test_bind_session_tenant_is_noop_for_sqlite(load_database_module):
+    database = load_database_module()
+
+    session = database.SessionLocal()
+    try:
+        database.bind_session_tenant(session, "tenant-1")
+        assert len(session.dispatch.after_begin) == 0
+        assert session.in_transaction() is False
+    finally:
+        session.close()
+
+
+def test_bind_session_tenant_applies_setting_on_each_transaction(monkeypatch, load_database_module):
+    database = load_database_module()
+    statements: list[tuple[str, object]] = []
+
+    monkeypatch.setattr(database.ENGINE.dialect, "name", "postgresql")
+    monkeypatch.setattr(database, "_SET_TENANT_SQL", database.text("SELECT :tenant_id"))
+
+    @database.event.listens_for(database.ENGINE, "before_cursor_execute")
+    def _record(_conn, _cursor, statement, parameters, _context, _executemany):  # type: ignore[no-untyped-def]
+        statements.append((statement, parameters))
+
+    session = database.SessionLocal()
+    try:
+        database.bind_session_tenant(session, "tenant-7")
+        session.execute(database.text("SELECT 1"))
+        session.commit()
+        session.execute(database.text("SELECT 2"))
+    finally:
+        session.close()
+        database.event.remove(database.ENGINE, "before_cursor_execute", _record)
+
+    tenant_statements = [params for statement, params in statements if statement == "SELECT ?"]
+    assert tenant_statements == [("tenant-7",), ("tenant-7",)]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import importlib
-import sys
+import os
 from typing import Iterable
 
 import pytest
@@ -32,6 +32,7 @@ def test_settings_defaults(settings_module):
     assert settings.database_url == "sqlite:///./data/dev.db"
     assert settings.ai_api_key is None
     assert settings.ai_model == "gpt-4o-mini"
+    assert settings.reconcile_workers == 0
 
 
 def test_settings_env_alias_override(settings_module, monkeypatch: pytest.MonkeyPatch):
@@ -94,25 +95,20 @@ def test_get_settings_cache_clear_allows_refresh(settings_module, monkeypatch: p
     assert refreshed.environment == "staging"
 
 
-def test_settings_module_loads_dotenv_file(monkeypatch: pytest.MonkeyPatch):
-    dotenv_module = importlib.import_module("dotenv")
-    original = dotenv_module.load_dotenv
+def test_settings_reads_env_file_without_touching_process_env(
+    settings_module, monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    env_file = tmp_path / ".env"
+    env_file.write_text("AI_MODEL=dotenv-model\nUNRELATED_KEY=ignored\n", encoding="utf-8")
 
-    calls: dict[str, dict[str, object]] = {}
+    settings = settings_module.Settings(_env_file=env_file)
 
-    def fake_load_dotenv(*args, **kwargs):
-        calls["args"] = args
-        calls["kwargs"] = kwargs
-        return True
+    assert settings_module.Settings.model_config["env_file"] == settings_module.ENV_FILE
+    assert settings.ai_model == "dotenv-model"
+    assert "AI_MODEL" not in os.environ
 
-    monkeypatch.setattr("dotenv.load_dotenv", fake_load_dotenv)
-    sys.modules.pop("app.core.settings", None)
 
+def test_settings_module_does_not_preload_dotenv():
     module = importlib.import_module("app.core.settings")
 
-    assert "kwargs" in calls
-    assert calls["kwargs"].get("dotenv_path") == module.ENV_FILE
-
-    monkeypatch.setattr("dotenv.load_dotenv", original)
-    importlib.reload(module)
-    module.get_settings.cache_clear()
+    assert not hasattr(module, "load_dotenv")
@@ -140,3 +140,75 @@ def test_invoice_status_enum_members() -> None:
     assert models.InvoiceStatus.MATCHED.value == "matched"
     assert models.InvoiceStatus.PAID.value == "paid"
     assert models.InvoiceStatus.CANCELLED.value == "cancelled"
+
+
+def test_bank_transaction_posted_index_covers_keyset_columns() -> None:
+    """The pagination index should lead with tenant_id and include the id tiebreaker."""
+    indexes = {index.name: index for index in models.BankTransaction.__table__.indexes}
+    index = indexes["ix_tx_tenant_posted_id"]
+
+    assert [column.name for column in index.columns] == ["tenant_id", "posted_at", "id"]
+    assert index.dialect_options["postgresql"]["include"] == ["amount", "currency"]
+
+
+def test_amount_assignment_keeps_minor_units_in_sync(session, tenant) -> None:
+    """Setting amount should derive integer cents for invoices and transactions."""
+    invoice = models.Invoice(tenant_id=tenant.id, amount=Decimal("199.99"))
+    transaction = models.BankTransaction(
+        tenant_id=tenant.id,
+        posted_at=datetime.now(timezone.utc),
+        amount=Decimal("0.005"),
+    )
+    session.add_all([invoice, transaction])
+    session.commit()
+
+    assert invoice.amount_minor == 19999
+    assert transaction.amount_minor == 1
+
+    invoice.amount = Decimal("12.30")
+    assert invoice.amount_minor == 1230
+
+
+def test_match_status_score_index_orders_by_score_descending() -> None:
+    """The match listing index should serve status filters and score ordering."""
+    indexes = {index.name: index for index in models.MatchCandidate.__table__.indexes}
+    index = indexes["ix_match_tenant_status_score"]
+
+    assert [str(expression) for expression in index.expressions] == [
+        "matchcandidate.tenant_id",
+        "matchcandidate.status",
+        "score DESC",
+        "matchcandidate.id",
+    ]
+    assert "ix_match_status" not in indexes
+
+
+def test_invoice_date_index_matches_keyset_ordering() -> None:
+    """Keyset invoice pages walk (invoice_date DESC, id DESC) within a tenant."""
+    indexes = {index.name: index for index in models.Invoice.__table__.indexes}
+    index = indexes["ix_invoice_tenant_date_id"]
+
+    assert [str(expression) for expression in index.expressions] == [
+        "invoice.tenant_id",
+        "invoice_date DESC",
+        "id DESC",
+    ]
+
+
+def test_match_candidate_is_hash_partitioned_by_tenant_on_postgres() -> None:
+    """Partitioning needs tenant_id in the table key while the ORM keys on id alone."""
+    table = models.MatchCandidate.__table__
+
+    assert table.dialect_options["postgresql"]["partition_by"] == "HASH (tenant_id)"
+    assert [column.name for column in table.primary_key.columns] == ["id", "tenant_id"]
+    assert [column.name for column in models.MatchCandidate.__mapper__.primary_key] == ["id"]
+
+
+def test_idempotency_lookup_index_is_unique_and_covering() -> None:
+    """The (tenant, endpoint, key) index should enforce uniqueness and cover the preflight read."""
+    indexes = {index.name: index for index in models.IdempotencyKey.__table__.indexes}
+    index = indexes["ix_idemp_tenant_endpoint_key"]
+
+    assert index.unique
+    assert [column.name for column in index.columns] == ["tenant_id", "endpoint", "key"]
+    assert index.dialect_options["postgresql"]["include"] == ["id", "payload_hash", "response_status"]
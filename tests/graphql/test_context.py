@@ -87,6 +87,18 @@ def test_build_context_loads_tenant_and_returns_graphql_context(monkeypatch: pyt
     assert session_used.closed is True
 
 
+def test_build_context_skips_session_when_tenant_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    tenant_context = TenantContext(tenant_id="tenant-cached", tenant_name="Cached")
+    monkeypatch.setattr(graphql_context, "cached_tenant_context", lambda tenant_id: tenant_context)
+    session_factory_mock = MagicMock()
+    monkeypatch.setattr(graphql_context, "SessionLocal", session_factory_mock)
+
+    result = graphql_context.build_context("tenant-cached")
+
+    assert result.tenant is tenant_context
+    session_factory_mock.assert_not_called()
+
+
 def test_context_getter_builds_context_when_header_present(monkeypatch: pytest.MonkeyPatch) -> None:
     expected_context = object()
     build_mock = MagicMock(return_value=expected_context)
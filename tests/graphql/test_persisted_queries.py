@@ -0,0 +1,64 @@
+"""Tests for automatic persisted query support."""
+from __future__ import annotations
+
+import hashlib
+
+import strawberry
+
+from app.graphql.persisted_queries import PersistedQueries
+from app.graphql.schema import schema as app_schema
+
+
+@strawberry.type
+class _Query:
+    @strawberry.field
+    def ping(self) -> str:
+        return "pong"
+
+
+def _persisted(query: str) -> dict[str, dict[str, object]]:
+    digest = hashlib.sha256(query.encode()).hexdigest()
+    return {"persistedQuery": {"version": 1, "sha256Hash": digest}}
+
+
+def test_unknown_hash_requests_full_query_then_serves_hash_only() -> None:
+    schema = strawberry.Schema(query=_Query, extensions=[PersistedQueries()])
+    query = "{ ping }"
+
+    missing = schema.execute_sync(None, operation_extensions=_persisted(query))
+    assert missing.errors[0].extensions == {"code": "PERSISTED_QUERY_NOT_FOUND"}
+
+    registered = schema.execute_sync(query, operation_extensions=_persisted(query))
+    assert registered.data == {"ping": "pong"}
+
+    replayed = schema.execute_sync(None, operation_extensions=_persisted(query))
+    assert replayed.errors is None
+    assert replayed.data == {"ping": "pong"}
+
+
+def test_hash_mismatch_is_rejected() -> None:
+    schema = strawberry.Schema(query=_Query, extensions=[PersistedQueries()])
+
+    result = schema.execute_sync("{ ping }", operation_extensions=_persisted("{ other }"))
+
+    assert result.errors[0].extensions == {"code": "PERSISTED_QUERY_HASH_MISMATCH"}
+
+
+def test_least_recently_used_queries_are_evicted() -> None:
+    schema = strawberry.Schema(query=_Query, extensions=[PersistedQueries(maxsize=1)])
+    first, second = "{ ping }", "query Second { ping }"
+
+    schema.execute_sync(first, operation_extensions=_persisted(first))
+    schema.execute_sync(second, operation_extensions=_persisted(second))
+
+    evicted = schema.execute_sync(None, operation_extensions=_persisted(first))
+    assert evicted.errors[0].extensions == {"code": "PERSISTED_QUERY_NOT_FOUND"}
+
+
+def test_application_schema_accepts_persisted_queries() -> None:
+    query = "query PersistedTypename { __typename }"
+
+    app_schema.execute_sync(query, operation_extensions=_persisted(query))
+    result = app_schema.execute_sync(None, operation_extensions=_persisted(query))
+
+    assert result.data == {"__typename": "Query"}
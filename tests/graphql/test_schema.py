@@ -14,6 +14,7 @@ from app.graphql.context import GraphQLContext
 from app.schemas.bank_transaction import (
     BankTransactionImportRequest,
     BankTransactionImportResponse,
+    BankTransactionPage,
     BankTransactionRead,
 )
 from app.schemas.invoice import InvoiceCreate, InvoiceListResponse, InvoiceRead
@@ -191,6 +192,39 @@ def test_bank_transactions_return_converted_rows(monkeypatch: pytest.MonkeyPatch
     assert sessions[0].closed is True
 
 
+def test_bank_transactions_page_exposes_cursor(monkeypatch: pytest.MonkeyPatch, graphql_info) -> None:
+    info, sessions, context = graphql_info
+    captured: dict[str, object] = {}
+    txn = BankTransactionRead(
+        id="txn-1",
+        tenant_id=context.tenant.tenant_id,
+        external_id="ext-1",
+        posted_at=datetime.now(tz=timezone.utc),
+        amount=200.0,
+        currency="USD",
+        description="Deposit",
+        created_at=datetime.now(tz=timezone.utc),
+    )
+
+    class FakeBankTransactionService:
+        def __init__(self, session, tenant) -> None:  # type: ignore[no-untyped-def]
+            captured["session"] = session
+
+        def list_transactions_page(self, after, limit) -> BankTransactionPage:  # type: ignore[no-untyped-def]
+            captured["after"] = after
+            captured["limit"] = limit
+            return BankTransactionPage(items=[txn], next_cursor="cursor-2")
+
+    monkeypatch.setattr(schema, "BankTransactionService", FakeBankTransactionService)
+
+    result = schema.Query().bank_transactions_page(info, after="cursor-1", limit=1)
+
+    assert [item.id for item in result.items] == ["txn-1"]
+    assert result.end_cursor == "cursor-2"
+    assert result.has_next_page is True
+    assert captured == {"session": sessions[0], "after": "cursor-1", "limit": 1}
+
+
 def test_match_candidates_translates_status(monkeypatch: pytest.MonkeyPatch, graphql_info) -> None:
     info, sessions, _ = graphql_info
     captured: dict[str, object] = {}
@@ -209,14 +243,16 @@ def test_match_candidates_translates_status(monkeypatch: pytest.MonkeyPatch, gra
             captured["session"] = session
             captured["tenant"] = tenant
 
-        def list_matches(self, status=None) -> list[MatchCandidateRead]:  # type: ignore[no-untyped-def]
+        def list_matches(self, status=None, limit=None) -> list[MatchCandidateRead]:  # type: ignore[no-untyped-def]
             captured["status"] = status
+            captured["limit"] = limit
             return [candidate]
 
     monkeypatch.setattr(schema, "ReconciliationService", FakeReconciliationService)
 
-    result = schema.Query().match_candidates(info, status=schema.MatchStatusEnum.CONFIRMED)
+    result = schema.Query().match_candidates(info, status=schema.MatchStatusEnum.CONFIRMED, limit=5)
 
+    assert captured["limit"] == 5
     assert len(result) == 1
     assert result[0].id == "match-1"
     assert captured["status"] == MatchStatus.CONFIRMED
@@ -232,8 +268,9 @@ def test_match_candidates_without_status(monkeypatch: pytest.MonkeyPatch, graphq
         def __init__(self, session, tenant) -> None:  # type: ignore[no-untyped-def]
             captured["session"] = session
 
-        def list_matches(self, status=None):  # type: ignore[no-untyped-def]
+        def list_matches(self, status=None, limit=None):  # type: ignore[no-untyped-def]
             captured["status"] = status
+            captured["limit"] = limit
             return []
 
     monkeypatch.setattr(schema, "ReconciliationService", FakeReconciliationService)
@@ -275,6 +312,28 @@ def test_explain_reconciliation_returns_ai_payload(monkeypatch: pytest.MonkeyPat
     assert sessions[0].closed is True
 
 
+def test_explain_matches_returns_payloads_in_order(monkeypatch: pytest.MonkeyPatch, graphql_info) -> None:
+    info, sessions, _ = graphql_info
+    captured: dict[str, object] = {}
+
+    class FakeExplanationService:
+        def __init__(self, session, tenant) -> None:  # type: ignore[no-untyped-def]
+            captured["session"] = session
+
+        def explain_matches(self, match_ids: list[str]) -> list[AIExplanationResponse]:
+            captured["match_ids"] = match_ids
+            return [AIExplanationResponse(explanation=f"About {match_id}", confidence="low") for match_id in match_ids]
+
+    monkeypatch.setattr(schema, "ExplanationService", FakeExplanationService)
+
+    result = schema.Query().explain_matches(info, match_ids=["m-1", "m-2"])
+
+    assert [item.explanation for item in result] == ["About m-1", "About m-2"]
+    assert captured["match_ids"] == ["m-1", "m-2"]
+    assert captured["session"] is sessions[0]
+    assert sessions[0].closed is True
+
+
 def test_create_tenant_returns_graphql_type(monkeypatch: pytest.MonkeyPatch, graphql_info) -> None:
     info, sessions, _ = graphql_info
     created_at = datetime.now(tz=timezone.utc)
@@ -510,3 +569,53 @@ def test_confirm_match_returns_confirmation(monkeypatch: pytest.MonkeyPatch, gra
     assert result.invoice_status == "matched"
     assert captured["match_id"] == "match-1"
     assert sessions[0].closed is True
+
+
+@pytest.mark.parametrize(
+    "graphql_type",
+    [
+        schema.TenantType,
+        schema.InvoiceType,
+        schema.InvoiceListType,
+        schema.BankTransactionType,
+        schema.BankTransactionPageType,
+        schema.BankTransactionImportResult,
+        schema.MatchCandidateType,
+        schema.ReconciliationResult,
+    ],
+)
+def test_row_output_types_are_slotted(graphql_type: type) -> None:
+    assert "__slots__" in vars(graphql_type)
+    assert "__dict__" not in vars(graphql_type)
+
+
+def test_status_lookups_accept_members_and_raw_values() -> None:
+    assert schema._INVOICE_STATUS_BY_VALUE["paid"] is InvoiceStatus.PAID
+    assert schema._INVOICE_STATUS_BY_VALUE[InvoiceStatus.PAID] is InvoiceStatus.PAID
+    assert schema._MATCH_STATUS_BY_VALUE["rejected"] is MatchStatus.REJECTED
+    assert schema._MATCH_STATUS_BY_VALUE[MatchStatus.REJECTED] is MatchStatus.REJECTED
+
+
+def test_row_converters_copy_fields_in_declaration_order() -> None:
+    created_at = datetime.now(tz=timezone.utc)
+    row = SimpleNamespace(
+        id="match-9",
+        invoice_id="inv-9",
+        bank_transaction_id="txn-9",
+        score=0.75,
+        status="confirmed",
+        reasoning="Amounts match",
+        created_at=created_at,
+    )
+
+    result = schema._to_match_type(row)
+
+    assert result == schema.MatchCandidateType(
+        id="match-9",
+        invoice_id="inv-9",
+        bank_transaction_id="txn-9",
+        score=0.75,
+        status=MatchStatus.CONFIRMED,
+        reasoning="Amounts match",
+        created_at=created_at,
+    )
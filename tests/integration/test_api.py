@@ -129,6 +129,9 @@ def test_ai_explanation_endpoint_success(client, tenant, monkeypatch) -> None:
             self.calls.append(context)
             return "AI explanation", "high"
 
+        async def aexplain(self, context) -> tuple[str, str | None]:  # type: ignore[override]
+            return self.explain(context)
+
     class FakeFallback:
         def __init__(self) -> None:
             self.calls = 0
@@ -137,6 +140,9 @@ def test_ai_explanation_endpoint_success(client, tenant, monkeypatch) -> None:
             self.calls += 1
             return "Fallback explanation", "low"
 
+        async def aexplain(self, context) -> tuple[str, str | None]:  # type: ignore[override]
+            return self.explain(context)
+
     fake_ai = FakeAI()
     fake_fallback = FakeFallback()
 
@@ -171,6 +177,9 @@ def test_ai_explanation_endpoint_fallback(client, tenant, monkeypatch) -> None:
         def explain(self, context) -> tuple[str, str | None]:  # type: ignore[override]
             raise RuntimeError("boom")
 
+        async def aexplain(self, context) -> tuple[str, str | None]:  # type: ignore[override]
+            raise RuntimeError("boom")
+
     class TrackingFallback:
         def __init__(self) -> None:
             self.calls = 0
@@ -179,6 +188,9 @@ def test_ai_explanation_endpoint_fallback(client, tenant, monkeypatch) -> None:
             self.calls += 1
             return "Fallback explanation", "low"
 
+        async def aexplain(self, context) -> tuple[str, str | None]:  # type: ignore[override]
+            return self.explain(context)
+
     fake_fallback = TrackingFallback()
 
     monkeypatch.setattr(